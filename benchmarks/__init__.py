@@ -0,0 +1,15 @@
+"""
+Benchmarks of recx.
+
+Run the suite on synthetic frames, and compare it with the stored baseline::
+
+    python -m benchmarks --suite quick --baseline benchmarks/baseline.json
+
+Record a new baseline (timings depend on the machine, so record and compare on the
+same one) with ``--save benchmarks/baseline.json``. See :mod:`benchmarks.runner`.
+
+Micro-benchmarks of single kernels run on their own::
+
+    python -m benchmarks.equality --rows 1000000
+    python -m benchmarks.tolerance --rows 10000000
+"""
@@ -0,0 +1,53 @@
+"""
+Micro-benchmark of the equality kernels, one dtype at a time.
+
+Compares ``EqualCheck.check_mask`` with the generic ``==`` plus ``isnull()``
+comparison it replaces. Run with::
+
+    python -m benchmarks.equality --rows 1000000
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import dtype_columns
+from recx import EqualCheck
+
+
+def generic(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    good = (baseline == candidate) | (baseline.isnull() & candidate.isnull())
+    return ~good.to_numpy(dtype=bool, na_value=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    check = EqualCheck()
+    print(f"{'dtype':<12} {'generic ms':>12} {'kernel ms':>12} {'speed-up':>9}")
+
+    for dtype, (baseline, candidate) in dtype_columns(args.rows).items():
+        if dtype == "category":
+            # The generic comparison needs identical categories
+            candidate = candidate.cat.set_categories(baseline.cat.categories)
+
+        def run_generic(b=baseline, c=candidate):
+            return generic(b, c)
+
+        def run_kernel(b=baseline, c=candidate):
+            return check.check_mask(b, c)
+
+        slow = min(timeit.repeat(run_generic, number=1, repeat=args.repeat))
+        fast = min(timeit.repeat(run_kernel, number=1, repeat=args.repeat))
+        print(
+            f"{dtype:<12} {slow * 1e3:>12.2f} {fast * 1e3:>12.2f} {slow / fast:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Deterministic generators of baseline and candidate frames.
+
+Every generator takes a number of rows and a seed and returns ``(baseline,
+candidate, columns)``, where ``columns`` is the ``Rec`` column mapping to reconcile
+them with. The same arguments always give the same frames.
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+from recx import AbsTolCheck, ColumnCheck, EqualCheck, RelTolCheck
+
+Frames = tuple[pd.DataFrame, pd.DataFrame, dict[str, ColumnCheck]]
+
+# Columns of the wide frames
+WIDE_COLUMNS = 100
+
+
+def dtype_columns(
+    n_rows: int,
+    seed: int = 0,
+) -> dict[str, tuple[pd.Series, pd.Series]]:
+    """Pairs of columns per dtype, with 1% of rows changed and 1% null."""
+    rng = np.random.default_rng(seed)
+    ints = rng.integers(0, 1_000, n_rows)
+    changed = rng.random(n_rows) < 0.01
+    nulls = rng.random(n_rows) < 0.01
+
+    def pair(values: pd.Series, other: pd.Series) -> tuple[pd.Series, pd.Series]:
+        candidate = values.copy()
+        candidate[changed] = other[changed]
+        return values, candidate
+
+    floats = pd.Series(ints / 7).mask(nulls)
+    dates = pd.Series(pd.Timestamp("2024-01-01") + pd.to_timedelta(ints, "D"))
+    labels = pd.Series(ints).astype(str)
+
+    return {
+        "int64": pair(pd.Series(ints), pd.Series(ints + 1)),
+        "bool": pair(pd.Series(ints % 2 == 0), pd.Series(ints % 2 == 1)),
+        "float64": pair(floats, floats + 1),
+        "datetime64": pair(dates.mask(nulls), dates + pd.Timedelta("1D")),
+        "Int64": pair(pd.Series(ints, dtype="Int64").mask(nulls), pd.Series(ints + 1)),
+        "category": pair(labels.astype("category"), labels.astype("category")[::-1]),
+        "object": pair(labels.astype(object), (labels + "x").astype(object)),
+    }
+
+
+def _perturb(
+    frame: pd.DataFrame,
+    rng: np.random.Generator,
+    rate: float,
+    scale: float = 1e-3,
+) -> pd.DataFrame:
+    """Copy of a numeric frame with ``rate`` of its cells moved by about ``scale``."""
+    values = frame.to_numpy(dtype=float, copy=True)
+    changed = rng.random(values.shape) < rate
+    values[changed] += rng.normal(scale=scale, size=int(changed.sum()))
+    return pd.DataFrame(values, index=frame.index, columns=frame.columns)
+
+
+def long(n_rows: int, seed: int = 0) -> Frames:
+    """A few numeric columns, 1% of values changed, aligned on an integer index."""
+    rng = np.random.default_rng(seed)
+    baseline = pd.DataFrame(
+        {
+            "price": rng.lognormal(size=n_rows),
+            "quantity": rng.integers(0, 1_000, n_rows).astype(float),
+            "value": rng.normal(size=n_rows),
+            "weight": rng.random(n_rows),
+        },
+        index=pd.RangeIndex(n_rows, name="id"),
+    )
+    candidate = _perturb(baseline, rng, rate=0.01)
+
+    columns: dict[str, ColumnCheck] = {
+        "price": RelTolCheck(tol=1e-4),
+        "quantity": EqualCheck(),
+        "value": AbsTolCheck(tol=1e-4),
+        "weight": AbsTolCheck(tol=1e-4),
+    }
+    return baseline, candidate, columns
+
+
+def wide(n_rows: int, seed: int = 0) -> Frames:
+    """
+    ``WIDE_COLUMNS`` float columns checked with one regex, 0.1% of cells changed.
+
+    ``n_rows`` counts cells rather than rows, so that a wide frame holds as many
+    values as the other frames of the same size.
+    """
+    rng = np.random.default_rng(seed)
+    baseline = pd.DataFrame(
+        rng.normal(size=(max(1, n_rows // WIDE_COLUMNS), WIDE_COLUMNS)),
+        columns=[f"x{i}" for i in range(WIDE_COLUMNS)],
+    )
+    candidate = _perturb(baseline, rng, rate=0.001)
+    return baseline, candidate, {"x.*": AbsTolCheck(tol=1e-4, regex=True)}
+
+
+def multiindex(n_rows: int, seed: int = 0) -> Frames:
+    """
+    Rows indexed by ``(date, id)``, with 1% of rows missing from the candidate.
+    """
+    rng = np.random.default_rng(seed)
+    per_day = max(1, min(n_rows, 1_000))
+    dates = pd.date_range("2024-01-01", periods=-(-n_rows // per_day))
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            dates.repeat(per_day)[:n_rows],
+            np.tile(np.arange(per_day), len(dates))[:n_rows],
+        ],
+        names=["date", "id"],
+    )
+    baseline = pd.DataFrame(
+        {"x": rng.normal(size=n_rows), "y": rng.normal(size=n_rows)}, index=index
+    )
+    candidate = _perturb(baseline, rng, rate=0.01)
+    candidate = candidate[rng.random(n_rows) >= 0.01]
+
+    columns: dict[str, ColumnCheck] = {"x": AbsTolCheck(tol=1e-4), "y": EqualCheck()}
+    return baseline, candidate, columns
+
+
+def strings(n_rows: int, seed: int = 0) -> Frames:
+    """Object columns of short strings, 1% of them changed, on a string index."""
+    rng = np.random.default_rng(seed)
+    words = np.array([f"word{i}" for i in range(1_000)], dtype=object)
+
+    baseline = pd.DataFrame(
+        {
+            "name": words[rng.integers(0, len(words), n_rows)],
+            "code": words[rng.integers(0, 10, n_rows)],
+        },
+        index=pd.Index([f"row{i}" for i in range(n_rows)], dtype=object, name="key"),
+    )
+    candidate = baseline.copy()
+    changed = rng.random(n_rows) < 0.01
+    candidate.loc[changed, "name"] = "changed"
+
+    return baseline, candidate, {"name": EqualCheck(), "code": EqualCheck()}
+
+
+def mixed(n_rows: int, seed: int = 0) -> Frames:
+    """One column per dtype (see :func:`dtype_columns`), all checked for equality."""
+    pairs = dtype_columns(n_rows, seed)
+    baseline = pd.DataFrame({dtype: b for dtype, (b, _) in pairs.items()})
+    candidate = pd.DataFrame({dtype: c for dtype, (_, c) in pairs.items()})
+    return baseline, candidate, {dtype: EqualCheck() for dtype in pairs}
+
+
+def failures(n_rows: int, seed: int = 0) -> Frames:
+    """
+    Half the values out of tolerance and 5% of rows missing or extra on each side.
+    """
+    rng = np.random.default_rng(seed)
+    baseline = pd.DataFrame(
+        {"x": rng.normal(size=n_rows), "y": rng.normal(size=n_rows)},
+        index=pd.RangeIndex(n_rows, name="id"),
+    )
+    candidate = _perturb(baseline, rng, rate=0.5, scale=1.0)
+
+    keep = rng.random(n_rows) >= 0.05
+    candidate = candidate[keep]
+    extra = n_rows + np.flatnonzero(rng.random(n_rows) < 0.05)
+    extra_rows = pd.DataFrame(
+        rng.normal(size=(len(extra), 2)),
+        index=pd.Index(extra, name="id"),
+        columns=candidate.columns,
+    )
+    candidate = pd.concat([candidate, extra_rows])
+
+    columns: dict[str, ColumnCheck] = {
+        "x": AbsTolCheck(tol=0.1),
+        "y": RelTolCheck(tol=0.1),
+    }
+    return baseline, candidate, columns
+
+
+GENERATORS: dict[str, Callable[[int, int], Frames]] = {
+    "long": long,
+    "wide": wide,
+    "multiindex": multiindex,
+    "strings": strings,
+    "mixed": mixed,
+    "failures": failures,
+}
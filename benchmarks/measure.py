@@ -0,0 +1,178 @@
+"""
+Wall time and peak memory of one phase of a benchmark.
+
+Time and memory are measured in separate passes, since tracing allocations slows
+them down. Timings are the fastest of several calls, with garbage collection off.
+Peak memory is reported twice: the peak of Python and NumPy allocations traced by
+``tracemalloc`` while the phase ran, and the peak resident set size of the process,
+sampled from ``/proc`` (``None`` where that is unavailable).
+"""
+
+import gc
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+# Seconds between two samples of the resident set size
+RSS_INTERVAL = 0.002
+
+
+def current_rss() -> int | None:
+    """Resident set size of this process in bytes, ``None`` if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class PeakRSS:
+    """
+    Context manager sampling the resident set size on a background thread.
+
+    Examples
+    --------
+    >>> with PeakRSS() as rss:
+    ...     data = bytearray(10**6)
+    >>> rss.peak is None or rss.peak > 0
+    True
+    """
+
+    def __init__(self, interval: float = RSS_INTERVAL):
+        self.interval = interval
+        self.peak: int | None = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _update(self) -> None:
+        rss = current_rss()
+        if rss is not None:
+            self.peak = max(self.peak or 0, rss)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._update()
+
+    def __enter__(self) -> "PeakRSS":
+        self._update()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._update()
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Peak bytes allocated (as traced by ``tracemalloc``) while running ``func``."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class Measurement:
+    """
+    Measurements of one phase.
+
+    Parameters
+    ----------
+    seconds : float
+        Fastest wall time over the repeats.
+
+    rows : int
+        Rows processed by the phase.
+
+    peak_bytes : int
+        Peak memory traced by ``tracemalloc``.
+
+    peak_rss : int, optional
+        Peak resident set size of the process.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        rows: int,
+        peak_bytes: int,
+        peak_rss: int | None = None,
+    ):
+        self.seconds = seconds
+        self.rows = rows
+        self.peak_bytes = peak_bytes
+        self.peak_rss = peak_rss
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float("inf")
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        return {
+            "seconds": self.seconds,
+            "rows": self.rows,
+            "rows_per_second": self.rows_per_second,
+            "peak_bytes": self.peak_bytes,
+            "peak_rss": self.peak_rss,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Measurement":
+        return cls(data["seconds"], data["rows"], data["peak_bytes"], data["peak_rss"])
+
+
+def measure(
+    func: Callable[[Any], Any],
+    rows: int,
+    setup: Callable[[], Any] = lambda: None,
+    repeat: int = 5,
+) -> Measurement:
+    """
+    Time ``func(setup())`` and record its peak memory.
+
+    Parameters
+    ----------
+    func : callable
+        The phase. Called with the value returned by ``setup``.
+
+    rows : int
+        Rows processed by one call, for the throughput.
+
+    setup : callable, optional
+        Called before every call of ``func`` and excluded from the measurements,
+        e.g. to build a fresh result whose failing rows are not built yet.
+
+    repeat : int, default 5
+        Number of timed calls; the fastest counts.
+
+    Returns
+    -------
+    Measurement
+    """
+    times = []
+
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+
+        # As with timeit, garbage collection is kept out of the timings
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(state)
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    state = setup()
+    with PeakRSS() as rss:
+        peak_bytes = peak_memory(lambda: func(state))
+
+    return Measurement(min(times), rows, peak_bytes, rss.peak)
@@ -0,0 +1,239 @@
+"""
+Run the benchmark suite and compare it with a stored baseline.
+
+Each case is a generator (see :mod:`benchmarks.generators`) at one size. Every case
+measures three phases:
+
+- ``run``: ``Rec.run`` on the two frames.
+- ``index_check``: the join and both index checks, building their failing rows.
+- ``summary``: ``RecResult.summary``, which builds every frame of failing rows.
+
+Measurements are keyed ``<generator>/<rows>/<phase>``. With ``--baseline`` they are
+compared with a stored JSON file, and the exit code is 1 if any phase got slower or
+took more memory than the threshold allows.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import GENERATORS
+from benchmarks.measure import Measurement, measure
+from recx import Rec
+from recx.align import IndexJoin
+from recx.checks import index_check
+
+SUITES = {
+    "quick": [1_000, 10_000],
+    "standard": [100_000, 1_000_000],
+    "large": [10_000_000, 100_000_000],
+}
+
+# Relative slow-down (or memory growth) tolerated before a phase counts as a
+# regression
+THRESHOLD = 0.5
+
+# Phases faster than this, or allocating less than this, never count as
+# regressions; their measurements are noise
+MIN_SECONDS = 0.01
+MIN_BYTES = 2**20
+
+
+def _index_checks(frames: tuple[pd.DataFrame, pd.DataFrame]) -> None:
+    baseline, candidate = frames
+    join = IndexJoin.from_frames(baseline, candidate)
+
+    for check in ("missing", "extra"):
+        index_check(baseline, candidate, check, join).failed_rows  # noqa: B018
+
+
+def _summary(result) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        result.summary()
+
+
+def run_case(
+    generator: str,
+    n_rows: int,
+    repeat: int = 5,
+    seed: int = 0,
+) -> dict[str, Measurement]:
+    """
+    Measure every phase of one case.
+
+    Returns
+    -------
+    dict[str, Measurement]
+        Measurements keyed ``<generator>/<rows>/<phase>``.
+    """
+    baseline, candidate, columns = GENERATORS[generator](n_rows, seed)
+    rec = Rec(columns=columns)
+    frames = (baseline, candidate)
+
+    phases = {
+        "run": measure(lambda _: rec.run(baseline, candidate), n_rows, repeat=repeat),
+        "index_check": measure(
+            _index_checks, n_rows, setup=lambda: frames, repeat=repeat
+        ),
+        "summary": measure(
+            _summary,
+            n_rows,
+            setup=lambda: rec.run(baseline, candidate),
+            repeat=repeat,
+        ),
+    }
+
+    return {f"{generator}/{n_rows}/{phase}": m for phase, m in phases.items()}
+
+
+def compare(
+    results: dict[str, Measurement],
+    baseline: dict[str, Measurement],
+    threshold: float = THRESHOLD,
+) -> list[str]:
+    """
+    Return a description of every regression of ``results`` against ``baseline``.
+
+    A phase regresses if its time or its traced peak memory grew by more than
+    ``threshold`` (a fraction). Phases missing from the baseline are ignored.
+    """
+    regressions = []
+
+    for key, new in results.items():
+        old = baseline.get(key)
+
+        if old is None:
+            continue
+
+        slower = new.seconds > old.seconds * (1 + threshold)
+        if slower and new.seconds >= MIN_SECONDS:
+            ratio = new.seconds / old.seconds
+            regressions.append(
+                f"{key}: {old.seconds:.4f}s -> {new.seconds:.4f}s ({ratio:.2f}x)"
+            )
+
+        grew = new.peak_bytes > old.peak_bytes * (1 + threshold)
+        if grew and new.peak_bytes >= MIN_BYTES:
+            ratio = new.peak_bytes / max(old.peak_bytes, 1)
+            regressions.append(
+                f"{key}: peak {old.peak_bytes / 2**20:.1f} MB -> "
+                f"{new.peak_bytes / 2**20:.1f} MB ({ratio:.2f}x)"
+            )
+
+    return regressions
+
+
+def load(path: str) -> dict[str, Measurement]:
+    with open(path) as f:
+        data = json.load(f)
+
+    return {key: Measurement.from_dict(m) for key, m in data["results"].items()}
+
+
+def save(path: str, results: dict[str, Measurement]) -> None:
+    data = {
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "results": {key: m.to_dict() for key, m in results.items()},
+    }
+
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def _print_row(key: str, m: Measurement) -> None:
+    rss = f"{m.peak_rss / 2**20:>9.1f}" if m.peak_rss is not None else f"{'-':>9}"
+    print(
+        f"{key:<36} {m.seconds * 1e3:>10.2f} {m.rows_per_second:>14,.0f} "
+        f"{m.peak_bytes / 2**20:>9.1f} {rss}"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark recx on synthetic frames.",
+    )
+    parser.add_argument(
+        "--suite",
+        choices=sorted(SUITES),
+        default="quick",
+        help="Sizes to run (default: quick).",
+    )
+    parser.add_argument(
+        "--rows",
+        type=lambda s: int(float(s)),
+        nargs="+",
+        help="Sizes to run instead of a suite, e.g. 1e3 1e6.",
+    )
+    parser.add_argument(
+        "--generators",
+        nargs="+",
+        choices=sorted(GENERATORS),
+        default=list(GENERATORS),
+        help="Generators to run (default: all).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed calls per phase; the fastest counts (default: 5).",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", help="Baseline JSON to compare with.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"Tolerated relative regression (default: {THRESHOLD}).",
+    )
+    parser.add_argument("--save", help="Write the measurements to this JSON file.")
+    args = parser.parse_args(argv)
+
+    sizes = args.rows or SUITES[args.suite]
+
+    print(f"{'case':<36} {'ms':>10} {'rows/s':>14} {'peak MB':>9} {'RSS MB':>9}")
+
+    results: dict[str, Measurement] = {}
+
+    for generator in args.generators:
+        for n_rows in sizes:
+            case = run_case(generator, n_rows, args.repeat, args.seed)
+
+            for key, m in case.items():
+                _print_row(key, m)
+
+            results.update(case)
+
+    if args.save:
+        save(args.save, results)
+
+    if not args.baseline:
+        return 0
+
+    regressions = compare(results, load(args.baseline), args.threshold)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
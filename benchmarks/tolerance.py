@@ -0,0 +1,65 @@
+"""
+Micro-benchmark of the fused tolerance kernel.
+
+Compares ``AbsTolCheck.check_mask`` and ``RelTolCheck.check_mask`` with the chain
+of pandas operations they replace, in run time and peak memory. Run with::
+
+    python -m benchmarks.tolerance --rows 10000000
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.measure import peak_memory
+from recx import AbsTolCheck, RelTolCheck
+
+
+def chained(check, baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    error = (baseline - candidate).abs()
+
+    if isinstance(check, RelTolCheck):
+        error = error / candidate.abs().replace(0, 1e-10)
+
+    good = (error <= check.tol) | (baseline.isnull() & candidate.isnull())
+    return ~good.to_numpy(dtype=bool, na_value=False)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    baseline = pd.Series(rng.normal(size=args.rows))
+    candidate = baseline * (1 + rng.normal(scale=1e-3, size=args.rows))
+    candidate[rng.random(args.rows) < 0.01] = np.nan
+
+    header = ["chained ms", "fused ms", "chained MB", "fused MB"]
+    print(f"{'check':<12}", *(f"{h:>11}" for h in header))
+
+    for check in (AbsTolCheck(tol=0.01), RelTolCheck(tol=0.01)):
+
+        def run_chained(check=check):
+            return chained(check, baseline, candidate)
+
+        def run_fused(check=check):
+            return check.check_mask(baseline, candidate)
+
+        run_fused()  # warm up the scratch arena
+
+        slow = min(timeit.repeat(run_chained, number=1, repeat=args.repeat))
+        fast = min(timeit.repeat(run_fused, number=1, repeat=args.repeat))
+        slow_mb = peak_memory(run_chained) / 2**20
+        fast_mb = peak_memory(run_fused) / 2**20
+
+        name = type(check).__name__
+        values = [slow * 1e3, fast * 1e3, slow_mb, fast_mb]
+        print(f"{name:<12}", *(f"{v:>11.1f}" for v in values))
+
+
+if __name__ == "__main__":
+    main()
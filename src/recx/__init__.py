@@ -5,18 +5,29 @@ This package provides functionality to reconcile a *candidate* ``pandas.DataFram
 against a *baseline* frame using a set of column-wise checks.
 """
 
+from .budget import FailureBudget
 from .checks import AbsTolCheck, ColumnCheck, EqualCheck, RelTolCheck
 from .exceptions import RecFailedException
+from .plan import RecPlan
+from .profile import Profiler
+from .progress import CancelToken, Progress
 from .rec import Rec
 from .results import CheckResult, RecResult
+from .sketch import ErrorSketch
 
 __all__ = [
     "AbsTolCheck",
+    "CancelToken",
     "CheckResult",
     "ColumnCheck",
+    "Profiler",
+    "Progress",
     "Rec",
     "RecFailedException",
+    "RecPlan",
     "RecResult",
     "EqualCheck",
+    "ErrorSketch",
+    "FailureBudget",
     "RelTolCheck",
 ]
@@ -0,0 +1,430 @@
+"""
+Row alignment between a baseline and a candidate frame.
+
+Aligning by label with ``.loc`` copies both frames. Instead, we work out which
+positions of each frame line up and only take those rows from the columns a check
+actually reads. When the indexes already match, no positions are needed at all and
+the original frames are used as they are.
+"""
+
+from collections.abc import Sequence
+from typing import Literal, TypeVar
+
+import numpy as np
+import pandas as pd
+
+T = TypeVar("T", pd.Series, pd.DataFrame, np.ndarray)
+
+Duplicates = Literal["product", "occurrence"]
+
+DUPLICATES = ("product", "occurrence")
+
+
+def _take(values: T, indexer: np.ndarray | None, index: pd.Index) -> T:
+    if indexer is None:
+        return values
+
+    if isinstance(values, np.ndarray):
+        return values.take(indexer, axis=0)
+
+    # Label both sides identically so pandas does not try to re-align them
+    return values.take(indexer).set_axis(index)
+
+
+def _is_identity(indexer: np.ndarray | None, length: int) -> bool:
+    if indexer is None:
+        return True
+
+    # Positions are strictly increasing, so a full-length indexer is 0..n-1
+    return len(indexer) == length and bool(np.all(np.diff(indexer) > 0))
+
+
+class Alignment:
+    """
+    Positional alignment of baseline and candidate rows.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Labels of the aligned rows, in aligned order.
+
+    baseline_indexer : numpy.ndarray, optional
+        Positions in the baseline frame of each aligned row. ``None`` means the
+        baseline rows are already aligned and are used as-is.
+
+    candidate_indexer : numpy.ndarray, optional
+        Positions in the candidate frame of each aligned row. ``None`` means the
+        candidate rows are already aligned and are used as-is.
+    """
+
+    def __init__(
+        self,
+        index: pd.Index,
+        baseline_indexer: np.ndarray | None = None,
+        candidate_indexer: np.ndarray | None = None,
+    ):
+        self.index = index
+        self.baseline_indexer = baseline_indexer
+        self.candidate_indexer = candidate_indexer
+
+    @classmethod
+    def from_frames(cls, baseline: pd.DataFrame, candidate: pd.DataFrame):
+        """
+        Align two frames on the labels common to both indexes.
+
+        Parameters
+        ----------
+        baseline : pandas.DataFrame
+            Baseline frame.
+
+        candidate : pandas.DataFrame
+            Candidate frame.
+
+        Returns
+        -------
+        Alignment
+            Alignment in baseline order. If the indexes are equal, both indexers are
+            ``None`` and no rows are copied.
+        """
+        return IndexJoin.from_frames(baseline, candidate).alignment
+
+    @property
+    def is_identity(self) -> bool:
+        """``True`` if both frames are used without taking any rows."""
+        return self.baseline_indexer is None and self.candidate_indexer is None
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def take_rows(self, positions: np.ndarray) -> "Alignment":
+        """Return the alignment of the aligned rows at ``positions``."""
+        return Alignment(
+            self.index.take(positions),
+            self.baseline_positions(positions),
+            self.candidate_positions(positions),
+        )
+
+    def slice_rows(self, start: int, stop: int) -> "Alignment":
+        """Return the alignment of the aligned rows ``start:stop``."""
+        return self.take_rows(np.arange(start, min(stop, len(self))))
+
+    def baseline_positions(self, positions: np.ndarray) -> np.ndarray:
+        """Map aligned row positions to positions in the baseline frame."""
+        if self.baseline_indexer is None:
+            return positions
+
+        return self.baseline_indexer[positions]
+
+    def candidate_positions(self, positions: np.ndarray) -> np.ndarray:
+        """Map aligned row positions to positions in the candidate frame."""
+        if self.candidate_indexer is None:
+            return positions
+
+        return self.candidate_indexer[positions]
+
+    def baseline(self, values: T) -> T:
+        """Return the aligned rows of a baseline Series, DataFrame or array."""
+        return _take(values, self.baseline_indexer, self.index)
+
+    def candidate(self, values: T) -> T:
+        """Return the aligned rows of a candidate Series, DataFrame or array."""
+        return _take(values, self.candidate_indexer, self.index)
+
+
+class IndexJoin:
+    """
+    One join of the baseline and candidate indexes.
+
+    Holds everything the index checks and the column checks need, so the two
+    indexes are only hashed once per run.
+
+    Parameters
+    ----------
+    alignment : Alignment
+        Rows common to both frames.
+
+    missing : numpy.ndarray
+        Positions of baseline rows whose label is not in the candidate, in baseline
+        order.
+
+    extra : numpy.ndarray
+        Positions of candidate rows whose label is not in the baseline, in candidate
+        order.
+
+    keys : list[str], optional
+        Key columns the frames were joined on, if not joined on their indexes.
+
+    counts : KeyCounts, optional
+        Rows per key in each frame, if duplicate keys were paired by occurrence.
+    """
+
+    def __init__(
+        self,
+        alignment: Alignment,
+        missing: np.ndarray,
+        extra: np.ndarray,
+        keys: list[str] | None = None,
+        counts: "KeyCounts | None" = None,
+    ):
+        self.alignment = alignment
+        self.missing = missing
+        self.extra = extra
+        self.keys = keys
+        self.counts = counts
+
+    @classmethod
+    def from_frames(
+        cls,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        keys: Sequence[str] | None = None,
+        duplicates: Duplicates = "product",
+    ):
+        """
+        Join two frames on their indexes, or on key columns.
+
+        Parameters
+        ----------
+        baseline : pandas.DataFrame
+            Baseline frame.
+
+        candidate : pandas.DataFrame
+            Candidate frame.
+
+        keys : list[str], optional
+            Key columns to join on instead of the indexes. Each key column is
+            factorized over both frames and the codes are combined into one integer
+            per row, which is what gets hashed. The aligned rows are labelled by
+            their key values, as if both frames had been indexed by ``keys``.
+
+        duplicates : {'product', 'occurrence'}, default 'product'
+            How rows sharing a key are paired. ``'product'`` pairs every
+            combination, as ``.loc`` would. ``'occurrence'`` numbers the rows of
+            each key in order (0, 1, ...) and pairs the n-th occurrence in the
+            baseline with the n-th in the candidate, so every row is used at most
+            once. Surplus occurrences are then missing or extra rows.
+
+        Returns
+        -------
+        IndexJoin
+            The join. Its alignment is in baseline order.
+        """
+        if keys is None:
+            b_index = baseline.index
+            c_index = candidate.index
+            labels = b_index
+            c_labels = c_index
+        else:
+            keys = list(keys)
+            b_index, c_index, labels, c_labels = _key_codes(baseline, candidate, keys)
+
+        counts = None
+
+        if duplicates == "occurrence" and not (b_index.is_unique and c_index.is_unique):
+            b_index, c_index, counts = _number_occurrences(
+                b_index, c_index, labels, c_labels
+            )
+
+        b_indexer, c_indexer, missing, extra = _join(b_index, c_index)
+        index = labels if b_indexer is None else labels.take(b_indexer)
+        alignment = Alignment(index, b_indexer, c_indexer)
+
+        return cls(alignment, missing, extra, keys, counts)
+
+
+class KeyCounts:
+    """
+    Number of rows per key in each frame.
+
+    Parameters
+    ----------
+    baseline_labels, candidate_labels : pandas.Index
+        Key of every row of each frame.
+
+    first : numpy.ndarray
+        Per key, the position of its first row among the baseline rows followed by
+        the candidate rows.
+
+    baseline, candidate : numpy.ndarray
+        Per key, the number of rows in each frame.
+    """
+
+    def __init__(
+        self,
+        baseline_labels: pd.Index,
+        candidate_labels: pd.Index,
+        first: np.ndarray,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+    ):
+        self.baseline_labels = baseline_labels
+        self.candidate_labels = candidate_labels
+        self.first = first
+        self.baseline = baseline
+        self.candidate = candidate
+
+    def __len__(self) -> int:
+        return len(self.first)
+
+    def labels(self, keys: np.ndarray) -> pd.Index:
+        """Return the labels of the keys numbered ``keys``."""
+        positions = self.first[keys]
+        n_baseline = len(self.baseline_labels)
+        in_baseline = positions < n_baseline
+
+        b_labels = self.baseline_labels.take(positions[in_baseline])
+        c_labels = self.candidate_labels.take(positions[~in_baseline] - n_baseline)
+        return b_labels.append(c_labels)
+
+
+def _join(
+    b_index: pd.Index,
+    c_index: pd.Index,
+) -> tuple[np.ndarray | None, np.ndarray | None, np.ndarray, np.ndarray]:
+    """
+    Return the baseline and candidate indexers of the common labels, followed by
+    the positions of the missing and extra labels.
+    """
+    none = np.array([], dtype=np.intp)
+
+    # Cheap for identical objects and RangeIndexes, no hash table otherwise
+    if b_index is c_index or b_index.equals(c_index):
+        return None, None, none, none
+
+    if b_index.is_unique and c_index.is_unique:
+        # A single hash table over the candidate labels answers all three
+        # questions: the lookups that miss are the missing rows, and the candidate
+        # rows no lookup hit are the extra rows
+        c_indexer = c_index.get_indexer(b_index)
+        found = c_indexer >= 0
+        b_indexer = np.flatnonzero(found)
+        c_indexer = c_indexer[b_indexer]
+        missing = np.flatnonzero(~found)
+    else:
+        # Duplicate labels pair every combination, as ``.loc`` would
+        _, b_indexer, c_indexer = b_index.join(
+            c_index,
+            how="inner",
+            return_indexers=True,
+        )
+        if b_indexer is None:
+            b_indexer = np.arange(len(b_index))
+        if c_indexer is None:
+            c_indexer = np.arange(len(c_index))
+        missing = _unmatched(b_indexer, len(b_index))
+
+    extra = _unmatched(c_indexer, len(c_index))
+
+    if _is_identity(b_indexer, len(b_index)):
+        b_indexer = None
+
+    if _is_identity(c_indexer, len(c_index)):
+        c_indexer = None
+
+    return b_indexer, c_indexer, missing, extra
+
+
+def _unmatched(indexer: np.ndarray, length: int) -> np.ndarray:
+    """Return the positions in ``0..length-1`` that ``indexer`` never refers to."""
+    matched = np.zeros(length, dtype=bool)
+    matched[indexer] = True
+    return np.flatnonzero(~matched)
+
+
+def _number_occurrences(
+    b_index: pd.Index,
+    c_index: pd.Index,
+    b_labels: pd.Index,
+    c_labels: pd.Index,
+) -> tuple[pd.Index, pd.Index, KeyCounts]:
+    """
+    Make duplicate labels unique by pairing each with its occurrence number.
+
+    Returns one integer per row for each frame, encoding ``(label, occurrence)``,
+    and the number of rows per label.
+    """
+    n_baseline = len(b_index)
+    codes, uniques = pd.factorize(b_index.append(c_index), use_na_sentinel=False)
+    n_keys = len(uniques)
+
+    # One stable sort groups the rows of each key, baseline rows first
+    order = np.argsort(codes, kind="stable")
+    per_key = np.bincount(codes, minlength=n_keys)
+    starts = np.cumsum(per_key) - per_key
+
+    rank = np.empty(len(codes), dtype=np.int64)
+    rank[order] = np.arange(len(codes)) - starts[codes[order]]
+
+    b_codes = codes[:n_baseline]
+    c_codes = codes[n_baseline:]
+    b_counts = np.bincount(b_codes, minlength=n_keys)
+    c_counts = per_key - b_counts
+
+    # Candidate rows rank after the baseline rows of the same key
+    b_occurrence = rank[:n_baseline]
+    c_occurrence = rank[n_baseline:] - b_counts[c_codes]
+
+    width = max(int(per_key.max(initial=0)), 1)
+    counts = KeyCounts(b_labels, c_labels, order[starts], b_counts, c_counts)
+
+    return (
+        pd.Index(b_codes * width + b_occurrence, copy=False),
+        pd.Index(c_codes * width + c_occurrence, copy=False),
+        counts,
+    )
+
+
+def _key_codes(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    keys: list[str],
+) -> tuple[pd.Index, pd.Index, pd.Index, pd.Index]:
+    """
+    Factorize the key columns of both frames into one integer code per row.
+
+    Returns the baseline and candidate codes, and the key labels of the baseline
+    and of the candidate rows.
+    """
+    n_baseline = len(baseline)
+    combined = np.zeros(n_baseline + len(candidate), dtype=np.int64)
+    cardinality = 1
+    levels = []
+    level_codes = []
+
+    for key in keys:
+        values = pd.concat([baseline[key], candidate[key]], ignore_index=True)
+        codes, uniques = pd.factorize(values)
+        levels.append(uniques)
+        level_codes.append(codes)
+
+        # Missing keys (code -1) match each other, as NaN labels do
+        size = len(uniques) + 1
+
+        if cardinality * size > np.iinfo(np.int64).max:
+            # Renumber the combinations seen so far to make room
+            combined, seen = pd.factorize(combined)
+            cardinality = len(seen)
+
+        combined = combined * size + (codes + 1)
+        cardinality *= size
+
+    def key_labels(frame: pd.DataFrame, rows: slice) -> pd.Index:
+        if len(keys) == 1:
+            return pd.Index(frame[keys[0]], name=keys[0])
+
+        return pd.MultiIndex(
+            levels=levels,
+            codes=[codes[rows] for codes in level_codes],
+            names=keys,
+            verify_integrity=False,
+        )
+
+    baseline_rows = slice(None, n_baseline)
+    candidate_rows = slice(n_baseline, None)
+
+    return (
+        pd.Index(combined[baseline_rows], copy=False),
+        pd.Index(combined[candidate_rows], copy=False),
+        key_labels(baseline, baseline_rows),
+        key_labels(candidate, candidate_rows),
+    )
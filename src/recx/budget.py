@@ -0,0 +1,258 @@
+"""
+Failure budgets and early termination.
+
+With a budget, the column checks run in task order over slices of the aligned rows
+rather than in one pass. After every slice the failures found so far are compared
+against the budgets, so a check (or the whole run) stops as soon as its budget is
+exceeded and the remaining rows and checks are never compared. Time budgets and
+cancellation (see :mod:`recx.progress`) stop the checks between slices in the same
+way.
+"""
+
+from collections.abc import Hashable, Sequence
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from recx.align import Alignment
+from recx.engine import (
+    ColumnOutcome,
+    Mode,
+    concat_outcomes,
+    evaluate_tasks,
+    plan_units,
+    to_result,
+)
+from recx.profile import Profiler
+from recx.progress import RunControl
+from recx.results import CheckResult, Status
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+    from recx.prefilter import RowFilter
+
+# Number of aligned rows compared between two budget checks
+BUDGET_ROWS = 2**16
+
+
+class FailureBudget:
+    """
+    Maximum number of failing rows tolerated before a check is stopped.
+
+    Parameters
+    ----------
+    rows : int, optional
+        Maximum number of failing rows.
+
+    fraction : float, optional
+        Maximum fraction of failing rows, between 0 and 1. If both ``rows`` and
+        ``fraction`` are given the stricter limit applies.
+
+    Examples
+    --------
+    >>> FailureBudget(rows=100).limit(10_000)
+    100
+    >>> FailureBudget(rows=100, fraction=0.001).limit(10_000)
+    10
+    """
+
+    def __init__(self, rows: int | None = None, fraction: float | None = None):
+        if rows is None and fraction is None:
+            raise ValueError("FailureBudget needs rows, fraction or both.")
+
+        if rows is not None and rows < 0:
+            raise ValueError(f"rows must not be negative, got {rows}")
+
+        if fraction is not None and not 0 <= fraction <= 1:
+            raise ValueError(f"fraction must be between 0 and 1, got {fraction}")
+
+        self.rows = rows
+        self.fraction = fraction
+
+    def __repr__(self) -> str:
+        return f"FailureBudget(rows={self.rows}, fraction={self.fraction})"
+
+    def limit(self, total_rows: int) -> int:
+        """
+        Return the largest number of failing rows allowed out of ``total_rows``.
+        """
+        limits = []
+
+        if self.rows is not None:
+            limits.append(self.rows)
+
+        if self.fraction is not None:
+            limits.append(int(self.fraction * total_rows))
+
+        return min(limits)
+
+
+def run_budgeted(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment,
+    budget: FailureBudget | None = None,
+    check_budget: FailureBudget | None = None,
+    prior: Sequence[CheckResult] = (),
+    n_jobs: int = 1,
+    mode: Mode = "rows",
+    row_filter: "RowFilter | None" = None,
+    block_keys: Sequence[Hashable | None] | None = None,
+    profiler: Profiler | None = None,
+    control: RunControl | None = None,
+) -> list[CheckResult]:
+    """
+    Run ``(check, column)`` tasks, stopping once a failure budget is exceeded.
+
+    Parameters
+    ----------
+    baseline : pandas.DataFrame
+        Baseline frame.
+
+    candidate : pandas.DataFrame
+        Candidate frame.
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Checks paired with the concrete column they apply to.
+
+    alignment : Alignment
+        Rows of each frame to compare.
+
+    budget : FailureBudget, optional
+        Budget over the failing rows of all checks together, including ``prior``.
+        The fraction is relative to the rows of every check combined. Once
+        exceeded, the checks in progress are truncated and the rest are skipped.
+
+    check_budget : FailureBudget, optional
+        Budget applied to each check on its own. A check that exceeds it is
+        truncated; the other checks carry on.
+
+    prior : list[CheckResult], optional
+        Results of checks that already ran (e.g. the index checks). Their failures
+        count towards ``budget``.
+
+    n_jobs : int, default 1
+        Number of threads used within each slice of rows.
+
+    mode : {'rows', 'counts'}, default 'rows'
+        See :func:`recx.engine.run_column_checks`.
+
+    row_filter : RowFilter, optional
+        See :func:`recx.engine.run_column_checks`.
+
+    block_keys : list, optional
+        See :func:`recx.engine.run_column_checks`.
+
+    profiler : Profiler, optional
+        See :func:`recx.engine.run_column_checks`.
+
+    control : RunControl, optional
+        Progress is reported to it after every slice, and the checks stop, like
+        with ``budget``, once it says so (time budget or cancellation).
+
+    Returns
+    -------
+    list[CheckResult]
+        One result per task, in the same order as ``tasks``. Results carry a
+        ``status`` of ``'complete'``, ``'truncated'`` or ``'skipped'``.
+    """
+    n_rows = len(alignment)
+
+    spent = sum(r.failed_count for r in prior)
+    planned = sum(r.total_rows for r in prior) + n_rows * len(tasks)
+
+    global_limit = budget.limit(planned) if budget is not None else None
+    check_limit = check_budget.limit(n_rows) if check_budget is not None else None
+
+    parts: list[list[tuple[int, ColumnOutcome]]] = [[] for _ in tasks]
+    counts = [0] * len(tasks)
+    compared = [0] * len(tasks)
+    statuses: list[Status] = ["skipped"] * len(tasks)
+
+    if control is not None:
+        control.plan_columns(n_rows, len(tasks))
+
+    stopped = global_limit is not None and spent > global_limit
+    finished = 0
+
+    for _, members in plan_units(baseline, candidate, tasks, block_keys):
+        if stopped or (control is not None and control.should_stop()):
+            stopped = True
+            break
+
+        active = list(members)
+
+        # An empty alignment still gets one (empty) slice so every check runs
+        for start in range(0, max(n_rows, 1), BUDGET_ROWS):
+            stop = min(start + BUDGET_ROWS, n_rows)
+            outcomes = evaluate_tasks(
+                baseline,
+                candidate,
+                [tasks[i] for i in active],
+                alignment.slice_rows(start, stop),
+                n_jobs,
+                mode,
+                row_filter.slice_rows(start, stop) if row_filter else None,
+                None if block_keys is None else [block_keys[i] for i in active],
+                profiler,
+            )
+
+            for i, outcome in zip(active, outcomes, strict=True):
+                parts[i].append((start, outcome))
+                counts[i] += outcome.failed_count
+                compared[i] += stop - start
+                spent += outcome.failed_count
+
+            if control is not None:
+                control.advance((stop - start) * len(active))
+
+            # Rows left to compare; a check that ran to the end is complete anyway
+            status: Status = "truncated" if stop < n_rows else "complete"
+
+            if global_limit is not None and spent > global_limit:
+                for i in active:
+                    statuses[i] = status
+                stopped = True
+                break
+
+            if check_limit is not None:
+                for i in active:
+                    if counts[i] > check_limit:
+                        statuses[i] = status
+
+                active = [i for i in active if counts[i] <= check_limit]
+
+            if not active:
+                break
+
+            if stop < n_rows and control is not None and control.should_stop():
+                for i in active:
+                    statuses[i] = status
+                stopped = True
+                break
+        else:
+            for i in active:
+                statuses[i] = "complete"
+
+        if control is not None:
+            finished += len(members)
+            control.finish_columns(
+                len(members), sum(n_rows - compared[i] for i in members)
+            )
+
+    if control is not None and finished < len(tasks):
+        # The checks never started are skipped
+        control.finish_columns(len(tasks) - finished, n_rows * (len(tasks) - finished))
+
+    results: list[CheckResult] = []
+
+    for (check, column), task_parts, task_status in zip(
+        tasks, parts, statuses, strict=True
+    ):
+        outcome = concat_outcomes(task_parts, task_status)
+        results.append(
+            to_result(baseline, candidate, alignment, check, column, outcome)
+        )
+
+    return results
@@ -0,0 +1,170 @@
+"""
+Partition-hash cache for incremental re-runs.
+
+Both frames are split into partitions by the values of ``align_date_col``, and each
+partition of each frame gets a content hash. Results of every partition are stored
+on disk together with the hashes. On the next run only partitions whose hash changed
+on either side are reconciled again; the stored results are reused for the rest.
+
+The cache file is named after a key derived from the ``Rec`` configuration, so
+changing a check, a column spec or any other setting starts a fresh cache.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Hashable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from recx.results import CheckResult
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of cached results changes
+CACHE_VERSION = 2
+
+
+def _describe(check: "ColumnCheck") -> str:
+    cls = type(check)
+    attributes = sorted((k, repr(v)) for k, v in vars(check).items())
+    return f"{cls.__module__}.{cls.__qualname__}{attributes}"
+
+
+def config_key(
+    settings: dict[str, Any],
+    tasks: Sequence[tuple["ColumnCheck", str]],
+) -> str:
+    """
+    Return a key identifying a reconciliation configuration.
+
+    Parameters
+    ----------
+    settings : dict
+        Settings that change results (e.g. which index checks run).
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Resolved checks and their columns. Checks are described by their class and
+        attributes.
+
+    Returns
+    -------
+    str
+        Hex digest of the configuration.
+    """
+    parts = [f"version={CACHE_VERSION}"]
+    parts += [f"{k}={v!r}" for k, v in sorted(settings.items())]
+    parts += [f"{column!r}:{_describe(check)}" for check, column in tasks]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def partition_positions(dates: np.ndarray) -> dict[Hashable, np.ndarray]:
+    """
+    Group row positions by date, keeping the row order within each group.
+    """
+    codes, uniques = pd.factorize(dates, use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    counts = np.bincount(codes, minlength=len(uniques))
+    groups = np.split(order, np.cumsum(counts)[:-1])
+    return dict(zip(uniques, groups, strict=True))
+
+
+class PartitionHasher:
+    """
+    Content hashes of the partitions of one frame.
+
+    Every row is hashed once (index and values); a partition's hash is a digest of
+    its row hashes together with the frame's column names and dtypes.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        Frame to hash.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        hashes = pd.util.hash_pandas_object(frame, index=True)  # type: ignore
+        self.row_hashes = hashes.to_numpy()
+        schema = [(column, str(dtype)) for column, dtype in frame.dtypes.items()]
+        self.schema = repr(schema).encode()
+
+    def digest(self, positions: np.ndarray) -> str:
+        """Return the hash of the rows at ``positions``."""
+        h = hashlib.blake2b(self.schema, digest_size=16)
+        h.update(self.row_hashes[positions].tobytes())
+        return h.hexdigest()
+
+
+class PartitionCache:
+    """
+    Results per partition, persisted in ``cache_dir``.
+
+    Each entry maps a partition (date) to the baseline and candidate hashes it was
+    computed for and the list of :class:`CheckResult` found in it.
+
+    Parameters
+    ----------
+    cache_dir : str or os.PathLike
+        Directory of the cache files. Created if it does not exist.
+
+    key : str
+        Configuration key, see :func:`config_key`.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike, key: str):
+        self.path = Path(cache_dir) / f"{key}.pkl"
+        self.entries: dict[Hashable, tuple[str, str, list[CheckResult]]] = {}
+
+    def load(self) -> "PartitionCache":
+        """Read the entries from disk, if the cache file exists and is readable."""
+        try:
+            with self.path.open("rb") as f:
+                self.entries = pickle.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            logger.warning(f"Ignoring unreadable cache file {self.path}")
+            self.entries = {}
+
+        return self
+
+    def get(
+        self,
+        partition: Hashable,
+        baseline_hash: str,
+        candidate_hash: str,
+    ) -> list[CheckResult] | None:
+        """Return the cached results if both hashes are unchanged."""
+        entry = self.entries.get(partition)
+
+        if entry is None or entry[:2] != (baseline_hash, candidate_hash):
+            return None
+
+        return entry[2]
+
+    def save(
+        self,
+        entries: dict[Hashable, tuple[str, str, list[CheckResult]]],
+    ) -> None:
+        """Replace the cache file with ``entries``, atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.entries = entries
@@ -1,15 +1,70 @@
 from abc import ABC, abstractmethod
+from collections.abc import Hashable, Mapping, Sequence
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
+from recx.align import IndexJoin
+from recx.engine import ArrayLike, failed_frame, failed_positions, run_column_checks
+from recx.kernels import (
+    abs_error,
+    block_unequal,
+    equal_kernel,
+    rel_error,
+    tolerance_failed,
+)
 from recx.results import CheckResult
 
 
+def _shared_dtype(
+    baseline_dtype,
+    candidate_dtype,
+    kinds: str | None = None,
+) -> np.dtype | None:
+    """
+    Return the NumPy dtype shared by two columns, or ``None`` if there is none.
+
+    If ``kinds`` is given, the dtype must also be one of those NumPy dtype kinds.
+    """
+    if baseline_dtype != candidate_dtype:
+        return None
+
+    if not isinstance(baseline_dtype, np.dtype):
+        return None
+
+    if kinds is not None and baseline_dtype.kind not in kinds:
+        return None
+
+    return baseline_dtype
+
+
+def _unmatched_rows(
+    frame: pd.DataFrame,
+    positions: np.ndarray,
+    keys: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Return the rows at ``positions``, ordered by label where labels are sortable.
+
+    With ``keys`` the rows are indexed by their key columns.
+    """
+    rows = frame.iloc[positions]
+
+    if keys is not None:
+        rows = rows.set_index(keys)
+
+    try:
+        return rows.sort_index(kind="stable")
+    except TypeError:
+        return rows
+
+
 def index_check(
     baseline: pd.DataFrame,
     candidate: pd.DataFrame,
     check: Literal["missing", "extra"],
+    join: IndexJoin | None = None,
 ) -> CheckResult:
     """
     Checks that there are no missing or extra indices.
@@ -26,45 +81,149 @@ def index_check(
         If *extra*, checks that candidate does not have extra indices.
         If *missing*, checks that candidate has all indices from baseline.
 
+    join : IndexJoin, optional
+        Join of the two indexes, if already computed. Passing it lets both index
+        checks and the column checks share one join.
+
     Returns
     -------
     CheckResult
-        Result whose ``failed_rows`` contains the rows with unmatched index values.
+        Result whose ``failed_rows`` contains the rows with unmatched index values,
+        sorted by label. The rows are only taken when accessed.
     """
-
     if check == "missing":
-        missing_indices = baseline.index.difference(candidate.index)
-        bad_rows = baseline.loc[missing_indices]
-        total_rows = len(baseline)
+        frame = baseline
         check_name = "missing_indices_check"
     elif check == "extra":
-        extra_indices = candidate.index.difference(baseline.index)
-        bad_rows = candidate.loc[extra_indices]
-        total_rows = len(candidate)
+        frame = candidate
         check_name = "extra_indices_check"
     else:
         raise ValueError("check must be either 'missing' or 'extra'")
 
-    assert isinstance(bad_rows, pd.DataFrame)
+    if join is None:
+        join = IndexJoin.from_frames(baseline, candidate)
+
+    positions = join.missing if check == "missing" else join.extra
+    keys = join.keys
 
     return CheckResult(
-        failed_rows=bad_rows,
+        failed_rows=lambda: _unmatched_rows(frame, positions, keys),
         check_name=check_name,
-        total_rows=total_rows,
+        total_rows=len(frame),
+        failed_count=len(positions),
     )
 
 
-class ColumnCheck(ABC):
+def duplicate_check(join: IndexJoin) -> CheckResult:
+    """
+    Checks that every duplicated key occurs equally often in both frames.
+
+    Only meaningful for joins that pair duplicates by occurrence; surplus
+    occurrences are additionally reported by the missing and extra index checks.
+
+    Parameters
+    ----------
+    join : IndexJoin
+        Join of the two indexes.
+
+    Returns
+    -------
+    CheckResult
+        Result over the distinct keys of both frames, whose ``failed_rows`` holds
+        one row per mismatching key with its ``baseline_count`` and
+        ``candidate_count``.
+    """
+    counts = join.counts
+
+    if counts is None:
+        # Both indexes are unique: one row per key on each side
+        return CheckResult(
+            failed_rows=pd.DataFrame(
+                {"baseline_count": [], "candidate_count": []}, dtype=np.int64
+            ),
+            check_name="duplicate_count_check",
+            total_rows=len(join.alignment) + len(join.missing) + len(join.extra),
+        )
+
+    mismatched = counts.baseline != counts.candidate
+    duplicated = np.maximum(counts.baseline, counts.candidate) > 1
+    keys = np.flatnonzero(mismatched & duplicated)
+
+    def failed_rows() -> pd.DataFrame:
+        frame = pd.DataFrame(
+            {
+                "baseline_count": counts.baseline[keys],
+                "candidate_count": counts.candidate[keys],
+            },
+            index=counts.labels(keys),
+        )
+
+        try:
+            return frame.sort_index(kind="stable")
+        except TypeError:
+            return frame
+
+    return CheckResult(
+        failed_rows=failed_rows,
+        check_name="duplicate_count_check",
+        total_rows=len(counts),
+        failed_count=len(keys),
+    )
+
+
+def _latest_overrides(cls: type, hooks: Sequence[str]) -> set[str]:
+    """
+    The ``hooks`` defined by the most derived class (below :class:`ColumnCheck`)
+    that defines any of them.
+    """
+    for klass in cls.__mro__:
+        if klass is ColumnCheck:
+            break
+
+        defined = {hook for hook in hooks if hook in vars(klass)}
+        if defined:
+            return defined
+
+    return set()
+
+
+class ColumnCheck(ABC):  # noqa: B024 - subclasses implement check or check_mask
+    """
+    Base class for column checks.
+
+    Subclasses implement one of two protocols:
+
+    * :meth:`check` returns the frame of failing rows directly.
+    * :meth:`check_mask` returns a mask of failing rows plus diagnostic arrays. The
+      failing rows frame is then only built if :attr:`CheckResult.failed_rows` is
+      accessed.
+
+    Either may additionally implement :meth:`check_block` to be evaluated on 2-D
+    blocks of columns.
+
+    The most derived of these overrides wins: a subclass that overrides
+    :meth:`check` of a mask-based check is evaluated with its :meth:`check`, and one
+    that overrides :meth:`check_mask` of a block-wise check column by column.
+
+    Checks with ``prefilter`` set to ``True`` treat identical values as passing.
+    With ``Rec(prefilter=True)`` they are then only run on the rows whose
+    fingerprints differ between the frames. The rows they skip enter the sketches
+    of :meth:`identical_diagnostics` as zeros.
+    """
+
+    prefilter: bool = False
+
     def __init__(self, regex: bool = False, **kwargs):
         self.check_name = self.__class__.__name__
         self.check_args = kwargs
         self.regex = regex
 
-    @abstractmethod
     def check(self, baseline: pd.Series, candidate: pd.Series) -> pd.DataFrame:
         """
         Evaluate the check for a single column.
 
+        The default implementation builds the frame from :meth:`check_mask`.
+
         Parameters
         ----------
         baseline : pandas.Series
@@ -79,16 +238,168 @@ class ColumnCheck(ABC):
             Frame of failing rows (may include additional diagnostic columns)
             or an empty frame if the check passed entirely.
         """
+        failed, diagnostics = self.check_mask(baseline, candidate)
+
+        failed_rows = failed_frame(
+            baseline.index,
+            baseline.array,
+            candidate.array,
+            failed,
+            diagnostics,
+        )
+
+        return self.order_failures(failed_rows)
+
+    def check_mask(
+        self,
+        baseline: pd.Series,
+        candidate: pd.Series,
+    ) -> tuple[np.ndarray, dict[str, ArrayLike]]:
+        """
+        Evaluate the check for a single column without building any frames.
+
+        Parameters
+        ----------
+        baseline : pandas.Series
+            Baseline series.
+
+        candidate : pandas.Series
+            Candidate series (index-aligned with ``baseline``).
+
+        Returns
+        -------
+        tuple[numpy.ndarray, dict[str, array-like]]
+            Boolean mask that is ``True`` for failing rows (or an integer array of
+            failing positions) and a (possibly empty) mapping of diagnostic column
+            names to arrays with one value per row.
+        """
         raise NotImplementedError
 
-    def run(
+    @property
+    def uses_masks(self) -> bool:
+        """
+        ``True`` if the check is evaluated with :meth:`check_mask`: it implements it,
+        and no subclass overrides :meth:`check` further down.
+        """
+        return "check_mask" in _latest_overrides(type(self), ("check", "check_mask"))
+
+    @property
+    def uses_blocks(self) -> bool:
+        """
+        ``True`` if the check may be evaluated with :meth:`check_block`: it
+        implements it, and no subclass overrides :meth:`check` or
+        :meth:`check_mask` further down.
+        """
+        hooks = ("check", "check_mask", "check_block")
+        return "check_block" in _latest_overrides(type(self), hooks)
+
+    def block_key(self, baseline_dtype, candidate_dtype) -> Hashable | None:
+        """
+        Key grouping columns that can be compared in one :meth:`check_block` call.
+
+        Columns whose checks return equal keys are stacked into 2-D blocks. The key
+        must therefore capture everything :meth:`check_block` depends on, including
+        the dtypes. Return ``None`` (the default unless :meth:`check_block` is
+        implemented) to evaluate the column on its own with :meth:`check`.
+
+        Parameters
+        ----------
+        baseline_dtype, candidate_dtype : dtype
+            Dtypes of the baseline and candidate column.
+
+        Returns
+        -------
+        Hashable or None
+            Block key, or ``None`` to opt out of block evaluation.
+        """
+        if not self.uses_blocks:
+            return None
+
+        dtype = _shared_dtype(baseline_dtype, candidate_dtype)
+
+        if dtype is None:
+            return None
+
+        return (type(self), id(self), dtype)
+
+    def check_block(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        """
+        Evaluate the check for a 2-D block of columns (optional hook).
+
+        Parameters
+        ----------
+        baseline : numpy.ndarray
+            Baseline values with shape ``(rows, columns)``.
+
+        candidate : numpy.ndarray
+            Candidate values with the same shape.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, dict[str, numpy.ndarray]]
+            Boolean mask that is ``True`` for failing cells and a (possibly empty)
+            mapping of diagnostic column names to arrays of the same shape.
+        """
+        raise NotImplementedError
+
+    def order_failures(self, failed_rows: pd.DataFrame) -> pd.DataFrame:
+        """
+        Order the failing rows built from a mask (no-op by default).
+        """
+        return failed_rows
+
+    def select_failures(
+        self,
+        failed: np.ndarray,
+        diagnostics: Mapping[str, ArrayLike],
+    ) -> np.ndarray:
+        """
+        Return the failing positions to keep (all of them by default).
+
+        Checks that only keep some failures override this. The result still counts
+        every failure. Since partial results (e.g. per chunk) are merged by
+        concatenating their kept failures, :meth:`order_failures` must then reduce
+        the merged rows to the ones to keep.
+
+        Parameters
+        ----------
+        failed : numpy.ndarray
+            Boolean mask of failing rows, or the failing positions, as returned by
+            :meth:`check_mask` or a column of :meth:`check_block`.
+
+        diagnostics : dict[str, array-like]
+            Diagnostic arrays with one value per row.
+
+        Returns
+        -------
+        numpy.ndarray
+            Ascending failing positions.
+        """
+        return failed_positions(failed)
+
+    def identical_diagnostics(self) -> tuple[str, ...]:
+        """
+        Numeric diagnostics that are zero when a value is compared with itself
+        (none by default).
+
+        Rows that are skipped because their values are identical (see
+        ``prefilter``) are added to the sketches of these diagnostics as zeros, so
+        the statistics do not depend on what was skipped.
+        """
+        return ()
+
+    def resolve_columns(
         self,
         baseline: pd.DataFrame,
         candidate: pd.DataFrame,
         column: str,
-    ) -> list[CheckResult]:
+    ) -> list[str]:
         """
-        Execute the check for one (possibly regex) column pattern.
+        Return the concrete columns selected by a column spec.
 
         Parameters
         ----------
@@ -99,46 +410,48 @@ class ColumnCheck(ABC):
             Candidate frame.
 
         column : str
-            Exact column name or regex pattern (if ``regex``) selecting columns to test.
+            Exact column name or regex pattern (if ``regex``) selecting columns.
 
         Returns
         -------
-        list[CheckResult]
-            One result per concrete column matched.
+        list[str]
+            The matched column names.
         """
-
         if self.regex:
             baseline_cols = baseline.filter(regex=column).columns
             candidate_cols = candidate.filter(regex=column).columns
-            columns = list(baseline_cols.intersection(candidate_cols))
-        else:
-            columns = [column]
-
-        results: list[CheckResult] = []
+            return list(baseline_cols.intersection(candidate_cols))
 
-        for col in columns:
-            bcol = baseline[col]
-            ccol = candidate[col]
+        return [column]
 
-            # Defensive: if a DataFrame slipped through, raise (mis-specified column)
-            if not isinstance(bcol, pd.Series) or not isinstance(ccol, pd.Series):
-                raise TypeError(
-                    "Column selection did not return a Series; check column spec."
-                )
+    def run(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        column: str,
+    ) -> list[CheckResult]:
+        """
+        Execute the check for one (possibly regex) column pattern.
 
-            failed_rows = self.check(bcol, ccol)
+        Parameters
+        ----------
+        baseline : pandas.DataFrame
+            Baseline frame containing the columns.
 
-            result = CheckResult(
-                failed_rows=failed_rows,
-                column=col,
-                check_name=self.check_name,
-                check_args=self.check_args,
-                total_rows=len(baseline[col]),
-            )
+        candidate : pandas.DataFrame
+            Candidate frame.
 
-            results.append(result)
+        column : str
+            Exact column name or regex pattern (if ``regex``) selecting columns to test.
 
-        return results
+        Returns
+        -------
+        list[CheckResult]
+            One result per concrete column matched.
+        """
+        columns = self.resolve_columns(baseline, candidate, column)
+        tasks = [(self, col) for col in columns]
+        return run_column_checks(baseline, candidate, tasks)
 
 
 class EqualCheck(ColumnCheck):
@@ -146,52 +459,140 @@ class EqualCheck(ColumnCheck):
     Check that baseline and candidate values are exactly equal.
 
     NaNs (nulls) in the same position are treated as equal.
+
+    Numeric, boolean, datetime, categorical and nullable columns are compared by
+    dtype-specialised kernels (see :mod:`recx.kernels`); other columns with the
+    generic ``==``.
     """
 
-    def check(self, baseline: pd.Series, candidate: pd.Series) -> pd.DataFrame:
+    prefilter = True
+
+    def check_mask(
+        self,
+        baseline: pd.Series,
+        candidate: pd.Series,
+    ) -> tuple[np.ndarray, dict[str, ArrayLike]]:
+        kernel = equal_kernel(baseline.dtype, candidate.dtype)
+
+        if kernel is not None:
+            return kernel(baseline, candidate), {}
+
         good_idx: pd.Series = baseline == candidate
         good_idx = good_idx | (baseline.isnull() & candidate.isnull())
-        # Explicit frame build (avoid concat type ambiguity)
-        bad = pd.DataFrame(
-            {
-                "baseline": baseline[~good_idx],
-                "candidate": candidate[~good_idx],
-            }
-        )
-        return bad
+        # Missing comparison results (nullable dtypes) count as failures
+        return ~good_idx.to_numpy(dtype=bool, na_value=False), {}
 
+    def block_key(self, baseline_dtype, candidate_dtype) -> Hashable | None:
+        if not self.uses_blocks:
+            return None
 
-class AbsTolCheck(ColumnCheck):
-    """
-    Check absolute difference within tolerance.
+        dtype = _shared_dtype(baseline_dtype, candidate_dtype, kinds="biufmM")
 
-    The absolute error ``abs(baseline - candidate)`` must be ``<= tol`` or the
-    row is flagged. Matching nulls are ignored.
+        if dtype is None:
+            return None
 
-    Parameters
-    ----------
-    tol : float
-        Maximum permitted absolute difference.
+        return (type(self), dtype)
 
-    sort : {'asc', 'desc'}, optional
-        Sort order for failing rows by absolute error.
+    def check_block(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        return block_unequal(baseline, candidate), {}
 
-    regex : bool, default False
-        Treat the provided column spec as a regex pattern.
+
+class _ToleranceCheck(ColumnCheck):
+    """
+    Shared machinery for checks that compare an error against a tolerance.
+
+    Subclasses implement :meth:`error` (for Series) and :meth:`error_block` (for
+    NumPy blocks) and name the diagnostic column with ``error_column``. NumPy
+    columns and blocks are evaluated by the fused kernel
+    :func:`recx.kernels.tolerance_failed`, to which subclasses may hand an in-place
+    version of :meth:`error_block` by overriding :meth:`error_into`.
     """
 
+    error_column: str
+
     def __init__(
         self,
         tol: float,
         sort: Literal["asc", "desc"] | None = None,
         regex: bool = False,
+        prefilter: bool = False,
+        top_k: int | None = None,
     ):
-        super().__init__(regex=regex, tol=tol)
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be a positive number of rows")
+
+        if top_k is None:
+            super().__init__(regex=regex, tol=tol)
+        else:
+            super().__init__(regex=regex, tol=tol, top_k=top_k)
+
         self.tol = tol
         self.sort = sort
+        self.prefilter = prefilter
+        self.top_k = top_k
 
-    def check(self, baseline: pd.Series, candidate: pd.Series) -> pd.DataFrame:
-        error: pd.Series = (baseline - candidate).abs()
+    @abstractmethod
+    def error(self, baseline: pd.Series, candidate: pd.Series) -> pd.Series:
+        raise NotImplementedError
+
+    @abstractmethod
+    def error_block(self, baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def error_into(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """Write the error of a chunk of rows into ``out``."""
+        out[...] = self.error_block(baseline, candidate)
+
+    def error_dtype(self, baseline_dtype: np.dtype, candidate_dtype: np.dtype):
+        """Dtype of the error of two NumPy columns."""
+        return np.result_type(baseline_dtype, candidate_dtype)
+
+    def _fused(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return tolerance_failed(
+            baseline,
+            candidate,
+            self.tol,
+            self.error_into,
+            self.error_dtype(baseline.dtype, candidate.dtype),
+        )
+
+    def identical_diagnostics(self) -> tuple[str, ...]:
+        return (self.error_column,)
+
+    def _validate_sort(self):
+        if self.sort not in (None, "asc", "desc"):
+            raise ValueError("sort must be either 'asc' or 'desc'")
+
+    def check_mask(
+        self,
+        baseline: pd.Series,
+        candidate: pd.Series,
+    ) -> tuple[np.ndarray, dict[str, ArrayLike]]:
+        self._validate_sort()
+
+        numeric = [
+            isinstance(s.dtype, np.dtype) and s.dtype.kind in "iuf"
+            for s in (baseline, candidate)
+        ]
+
+        if all(numeric):
+            failed, error = self._fused(baseline.to_numpy(), candidate.to_numpy())
+            return failed, {self.error_column: error}
+
+        error = self.error(baseline, candidate)
 
         good_idx = (
             # Within tolerance
@@ -200,26 +601,121 @@ class AbsTolCheck(ColumnCheck):
             | (baseline.isnull() & candidate.isnull())
         )
 
-        bad = pd.DataFrame(
-            {
-                "baseline": baseline[~good_idx],
-                "candidate": candidate[~good_idx],
-                "abs_error": error[~good_idx],
-            }
-        )
+        failed = ~good_idx.to_numpy(dtype=bool, na_value=False)
+        return failed, {self.error_column: error.array}
 
-        if self.sort is not None:
-            if self.sort == "asc":
-                bad = bad.sort_values(by="abs_error", ascending=True)
-            elif self.sort == "desc":
-                bad = bad.sort_values(by="abs_error", ascending=False)
-            else:
-                raise ValueError("sort must be either 'asc' or 'desc'")
+    def block_key(self, baseline_dtype, candidate_dtype) -> Hashable | None:
+        if not self.uses_blocks:
+            return None
 
-        return bad
+        dtype = _shared_dtype(baseline_dtype, candidate_dtype, kinds="iuf")
 
+        if dtype is None:
+            return None
 
-class RelTolCheck(ColumnCheck):
+        return (type(self), self.tol, dtype)
+
+    def check_block(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+    ) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+        self._validate_sort()
+        failed, error = self._fused(baseline, candidate)
+        return failed, {self.error_column: error}
+
+    def _direction(self) -> str | None:
+        self._validate_sort()
+
+        # Keeping the top k defaults to the worst failures first
+        if self.sort is None and self.top_k is not None:
+            return "desc"
+
+        return self.sort
+
+    def select_failures(
+        self,
+        failed: np.ndarray,
+        diagnostics: Mapping[str, ArrayLike],
+    ) -> np.ndarray:
+        positions = failed_positions(failed)
+
+        if self.top_k is None or len(positions) <= self.top_k:
+            return positions
+
+        error = diagnostics[self.error_column][positions]
+        error = pd.Series(error).to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Partition rather than sort: linear in the failures, and only k are kept.
+        # NaN errors (nulls on one side) go last either way.
+        key = error if self._direction() == "asc" else -error
+        chosen = np.argpartition(key, self.top_k - 1)[: self.top_k]
+
+        return positions[np.sort(chosen)]
+
+    def order_failures(self, failed_rows: pd.DataFrame) -> pd.DataFrame:
+        direction = self._direction()
+
+        if direction is None:
+            return failed_rows
+
+        ascending = direction == "asc"
+        ordered = failed_rows.sort_values(by=self.error_column, ascending=ascending)
+
+        if self.top_k is not None:
+            # Merged partial results hold up to k rows per part
+            ordered = ordered.head(self.top_k)
+
+        return ordered
+
+
+class AbsTolCheck(_ToleranceCheck):
+    """
+    Check absolute difference within tolerance.
+
+    The absolute error ``abs(baseline - candidate)`` must be ``<= tol`` or the
+    row is flagged. Matching nulls are ignored.
+
+    Parameters
+    ----------
+    tol : float
+        Maximum permitted absolute difference.
+
+    sort : {'asc', 'desc'}, optional
+        Sort order for failing rows by absolute error.
+
+    regex : bool, default False
+        Treat the provided column spec as a regex pattern.
+
+    prefilter : bool, default False
+        Only run on rows whose fingerprints differ when ``Rec(prefilter=True)``.
+        Identical values then always pass (including identical infinities).
+
+    top_k : int, optional
+        Only keep the ``top_k`` failing rows with the largest absolute error (the
+        smallest with ``sort="asc"``). ``failed_count`` still counts every failure,
+        and the kept rows are found without sorting all failures. Implies
+        ``sort="desc"`` unless ``sort`` is given.
+    """
+
+    error_column = "abs_error"
+
+    def error(self, baseline: pd.Series, candidate: pd.Series) -> pd.Series:
+        return (baseline - candidate).abs()
+
+    def error_block(self, baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+        return np.abs(baseline - candidate)
+
+    def error_into(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        abs_error(baseline, candidate, out)
+
+
+class RelTolCheck(_ToleranceCheck):
     """
     Check relative difference within tolerance.
 
@@ -236,43 +732,36 @@ class RelTolCheck(ColumnCheck):
 
     regex : bool, default False
         Treat the provided column spec as a regex pattern.
-    """
 
-    def __init__(
-        self,
-        tol: float,
-        sort: Literal["asc", "desc"] | None = None,
-        regex: bool = False,
-    ):
-        super().__init__(regex=regex, tol=tol)
-        self.tol = tol
-        self.sort = sort
+    prefilter : bool, default False
+        Only run on rows whose fingerprints differ when ``Rec(prefilter=True)``.
+        Identical values then always pass (including identical infinities).
 
-    def check(self, baseline: pd.Series, candidate: pd.Series) -> pd.DataFrame:
-        error: pd.Series = (baseline - candidate).abs()
-        error = error / candidate.abs().replace(0, 1e-10)
+    top_k : int, optional
+        Only keep the ``top_k`` failing rows with the largest relative error (the
+        smallest with ``sort="asc"``). ``failed_count`` still counts every failure,
+        and the kept rows are found without sorting all failures. Implies
+        ``sort="desc"`` unless ``sort`` is given.
+    """
 
-        good_idx = (
-            # Within tolerance
-            (error <= self.tol)
-            # Nulls are equal
-            | (baseline.isnull() & candidate.isnull())
-        )
+    error_column = "rel_error"
 
-        bad = pd.DataFrame(
-            {
-                "baseline": baseline[~good_idx],
-                "candidate": candidate[~good_idx],
-                "rel_error": error[~good_idx],
-            }
-        )
+    def error(self, baseline: pd.Series, candidate: pd.Series) -> pd.Series:
+        error: pd.Series = (baseline - candidate).abs()
+        return error / candidate.abs().replace(0, 1e-10)
 
-        if self.sort is not None:
-            if self.sort == "asc":
-                bad = bad.sort_values(by="rel_error", ascending=True)
-            elif self.sort == "desc":
-                bad = bad.sort_values(by="rel_error", ascending=False)
-            else:
-                raise ValueError("sort must be either 'asc' or 'desc'")
+    def error_block(self, baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+        denominator = np.abs(candidate).astype(np.float64)
+        denominator[denominator == 0] = 1e-10
+        return np.abs(baseline - candidate) / denominator
 
-        return bad
+    def error_into(
+        self,
+        baseline: np.ndarray,
+        candidate: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        rel_error(baseline, candidate, out)
+
+    def error_dtype(self, baseline_dtype: np.dtype, candidate_dtype: np.dtype):
+        return np.dtype(np.float64)
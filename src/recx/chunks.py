@@ -0,0 +1,145 @@
+"""
+Merge-join of sorted DataFrame chunk iterators.
+
+Both inputs are streams of chunks whose index is sorted in ascending order across the
+whole stream. We pair them up into windows covering the same range of index labels,
+so each window can be reconciled on its own while only about one chunk per side is
+held in memory.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import pandas as pd
+
+
+class _Side:
+    """
+    Buffered view over one sorted chunk stream.
+    """
+
+    def __init__(self, chunks: Iterable[pd.DataFrame], name: str):
+        self.chunks = iter(chunks)
+        self.name = name
+        self.buffer: pd.DataFrame | None = None
+        self.template: pd.DataFrame | None = None
+        self.last_label: Any = None
+        self.exhausted = False
+
+    def fill(self):
+        """Pull chunks until the buffer has rows or the stream is exhausted."""
+        while (self.buffer is None or len(self.buffer) == 0) and not self.exhausted:
+            try:
+                chunk = next(self.chunks)
+            except StopIteration:
+                self.exhausted = True
+                break
+
+            if not chunk.index.is_monotonic_increasing:
+                raise ValueError(f"{self.name} chunks must be sorted by index.")
+
+            self.template = chunk.iloc[:0]
+
+            if len(chunk) == 0:
+                continue
+
+            if self.last_label is not None and chunk.index[0] <= self.last_label:
+                raise ValueError(
+                    f"{self.name} chunks must be sorted by index across chunks."
+                )
+
+            self.last_label = chunk.index[-1]
+            self.buffer = chunk
+
+    @property
+    def has_rows(self) -> bool:
+        return self.buffer is not None and len(self.buffer) > 0
+
+    def split(self, watermark) -> pd.DataFrame:
+        """Remove and return the buffered rows with labels up to ``watermark``."""
+        if self.buffer is None:
+            return self.empty()
+
+        if watermark is None:
+            stop = len(self.buffer)
+        else:
+            stop = self.buffer.index.get_slice_bound(watermark, side="right")
+
+        window = self.buffer.iloc[:stop]
+        self.buffer = self.buffer.iloc[stop:]
+        return window
+
+    def empty(self, like: pd.DataFrame | None = None) -> pd.DataFrame:
+        if self.template is not None:
+            return self.template
+
+        if like is not None:
+            return like.iloc[:0]
+
+        return pd.DataFrame()
+
+
+def merge_windows(
+    baseline: Iterable[pd.DataFrame],
+    candidate: Iterable[pd.DataFrame],
+) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Pair up two index-sorted chunk streams into windows of the same label range.
+
+    Labels must be unique within each stream (they may not repeat across chunk
+    boundaries).
+
+    Parameters
+    ----------
+    baseline : Iterable[pandas.DataFrame]
+        Baseline chunks, sorted by index.
+
+    candidate : Iterable[pandas.DataFrame]
+        Candidate chunks, sorted by index.
+
+    Yields
+    ------
+    tuple[pandas.DataFrame, pandas.DataFrame]
+        ``(baseline_window, candidate_window)`` holding every row of each stream
+        whose label falls in the window. Consecutive windows do not overlap. If
+        the streams hold chunks but no rows, one empty window with their columns
+        is yielded.
+
+    Raises
+    ------
+    ValueError
+        If either stream is not sorted by index.
+    """
+    b = _Side(baseline, "Baseline")
+    c = _Side(candidate, "Candidate")
+    windows = 0
+
+    while True:
+        b.fill()
+        c.fill()
+
+        if not b.has_rows and not c.has_rows:
+            break
+
+        # Every label up to the smallest last-buffered label of an unfinished
+        # stream has now been seen on both sides. Once both streams are finished
+        # the remaining rows form the final window.
+        open_labels = [s.last_label for s in (b, c) if not s.exhausted]
+        watermark = min(open_labels) if open_labels else None
+
+        b_window = b.split(watermark)
+        c_window = c.split(watermark)
+
+        if b.template is None:
+            b_window = b.empty(like=c_window)
+
+        if c.template is None:
+            c_window = c.empty(like=b_window)
+
+        windows += 1
+        yield b_window, c_window
+
+    # Only empty chunks: keep their columns rather than yielding nothing
+    if windows == 0 and (b.template is not None or c.template is not None):
+        b_window = b.empty(like=c.template)
+        yield b_window, c.empty(like=b_window)
@@ -0,0 +1,371 @@
+"""
+Command-line entry point: reconcile two CSV files.
+
+::
+
+    recx baseline.csv candidate.csv --config rec.toml --report report.json
+
+The TOML config describes the ``Rec`` (checks per column, keys, date alignment) and
+how to read the files (dtypes and date columns). Only the columns the checks need
+are read, in one pass, with the configured dtypes. The summary is printed, a JSON
+report is written on request, and the exit code says how the run went:
+
+- ``0``: every check passed.
+- ``1``: at least one check failed.
+- ``2``: the config or the files could not be read, or the config does not support
+  the options (``--time-budget`` with ``executor = "process"``).
+- ``3``: no check failed, but the run stopped early (``--time-budget``).
+
+An example config::
+
+    keys = ["account", "date"]
+    align_date_col = "date"
+    check_all = false
+
+    [dtypes]
+    account = "string"
+    price = "float64"
+
+    [columns.price]
+    check = "abs_tol"
+    tol = 0.01
+
+    [columns."^metric_"]
+    check = "rel_tol"
+    tol = 1e-6
+    regex = true
+"""
+
+import argparse
+import inspect
+import json
+import re
+import sys
+from collections.abc import Sequence
+from typing import Any
+
+import pandas as pd
+
+from recx.checks import AbsTolCheck, ColumnCheck, EqualCheck, RelTolCheck
+from recx.rec import Rec
+from recx.results import RecResult
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+EXIT_PASSED = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+EXIT_INCOMPLETE = 3
+
+# Check names accepted in the ``check`` field of a column
+CHECKS: dict[str, type[ColumnCheck]] = {
+    "equal": EqualCheck,
+    "abs_tol": AbsTolCheck,
+    "rel_tol": RelTolCheck,
+}
+
+# Settings passed on to ``Rec``
+REC_SETTINGS = (
+    "keys",
+    "align_date_col",
+    "check_all",
+    "check_missing_indices",
+    "check_extra_indices",
+    "duplicates",
+    "n_jobs",
+    "executor",
+    "prefilter",
+)
+
+# Settings used to read the files
+READ_SETTINGS = ("dtypes", "parse_dates", "index")
+
+# Settings that must be lists of column names, and settings that must be tables
+LIST_SETTINGS = ("keys", "index", "parse_dates")
+TABLE_SETTINGS = ("columns", "dtypes")
+
+
+def load_config(path: str) -> dict[str, Any]:
+    """
+    Read and validate a TOML config.
+
+    Raises
+    ------
+    ValueError
+        If the config has unknown settings, no ``columns`` table, or a setting of
+        the wrong type.
+    """
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    unknown = set(config) - {"columns", *REC_SETTINGS, *READ_SETTINGS}
+    if unknown:
+        raise ValueError(f"Unknown settings in {path}: {', '.join(sorted(unknown))}")
+
+    if "columns" not in config:
+        raise ValueError(f"{path} needs a [columns] table")
+
+    for key in LIST_SETTINGS:
+        value = config.get(key, [])
+        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+            raise ValueError(f"{key} in {path} must be a list of column names")
+
+    for key in TABLE_SETTINGS:
+        if not isinstance(config.get(key, {}), dict):
+            raise ValueError(f"{key} in {path} must be a table")
+
+    for column, spec in config["columns"].items():
+        if not isinstance(spec, dict):
+            raise ValueError(f"columns.{column} in {path} must be a table")
+
+    return config
+
+
+def make_check(column: str, spec: dict[str, Any]) -> ColumnCheck | None:
+    """
+    Build the check of one ``[columns.<column>]`` table.
+
+    ``check`` names the check (``'equal'``, ``'abs_tol'``, ``'rel_tol'``, or
+    ``'skip'`` to leave the column out); the other fields are its arguments.
+    """
+    options = dict(spec)
+    name = options.pop("check", "equal")
+
+    if name == "skip":
+        return None
+
+    if name not in CHECKS:
+        raise ValueError(
+            f"Unknown check {name!r} for column {column!r}; "
+            f"expected one of {', '.join([*CHECKS, 'skip'])}"
+        )
+
+    # Checks pass extra keyword arguments on to ColumnCheck, which records them
+    # instead of rejecting them, so typos are caught against the signature
+    parameters = inspect.signature(CHECKS[name]).parameters.values()
+    fields = [
+        p.name for p in parameters if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+    ]
+    unknown = [f for f in options if f not in fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s) for column {column!r}: {', '.join(unknown)}; "
+            f"{name!r} takes {', '.join(['check', *fields])}"
+        )
+
+    try:
+        return CHECKS[name](**options)
+    except TypeError as e:
+        raise ValueError(f"Bad arguments for column {column!r}: {e}") from e
+
+
+def build_rec(config: dict[str, Any]) -> Rec:
+    """Build the ``Rec`` described by a config."""
+    columns = {
+        column: make_check(column, spec) for column, spec in config["columns"].items()
+    }
+    settings = {key: config[key] for key in REC_SETTINGS if key in config}
+    return Rec(columns=columns, **settings)
+
+
+def required_columns(config: dict[str, Any]) -> list[str]:
+    """
+    Columns every file must have for ``config``: the keys, the index, the date
+    column and the column of every check that is not a regex.
+    """
+    required = [*config.get("keys", []), *config.get("index", [])]
+
+    if config.get("align_date_col") is not None:
+        required.append(config["align_date_col"])
+
+    for column, spec in config["columns"].items():
+        if not spec.get("regex", False) and spec.get("check") != "skip":
+            required.append(column)
+
+    return list(dict.fromkeys(required))
+
+
+def needed_columns(config: dict[str, Any], header: Sequence[str]) -> list[str]:
+    """
+    Columns of a file with ``header`` that a run of ``config`` reads, in file order.
+
+    All of them with ``check_all`` (the default), otherwise the columns the specs
+    select, the keys, the index and the date column.
+
+    Raises
+    ------
+    ValueError
+        If one of the :func:`required_columns` is not in ``header``.
+    """
+    missing = [c for c in required_columns(config) if c not in header]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+
+    if config.get("check_all", True):
+        return list(header)
+
+    needed = set(required_columns(config))
+
+    for column, spec in config["columns"].items():
+        if spec.get("regex", False):
+            needed.update(c for c in header if re.search(column, c))
+
+    return [c for c in header if c in needed]
+
+
+def read_csv(path: str, config: dict[str, Any]) -> pd.DataFrame:
+    """
+    Read the columns of ``path`` a run of ``config`` needs.
+
+    Columns listed under ``dtypes`` are parsed with that dtype, and those under
+    ``parse_dates`` (plus ``align_date_col``) as dates, so pandas only infers the
+    dtype of the remaining columns. The file is parsed in one pass, straight into
+    the frame, so the rows are never held twice.
+    """
+    header = list(pd.read_csv(path, nrows=0).columns)
+
+    try:
+        usecols = needed_columns(config, header)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from e
+
+    dtypes = {c: t for c, t in config.get("dtypes", {}).items() if c in usecols}
+    dates = [*config.get("parse_dates", [])]
+    date_col = config.get("align_date_col")
+    if date_col is not None and date_col not in dtypes and date_col not in dates:
+        dates.append(date_col)
+
+    frame = pd.read_csv(
+        path,
+        usecols=usecols,
+        dtype=dtypes,
+        parse_dates=[c for c in dates if c in usecols],
+    )
+
+    if config.get("index"):
+        frame = frame.set_index(config["index"])
+
+    return frame
+
+
+def _jsonable(value: Any) -> Any:
+    # NumPy scalars, and anything else as text
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def exit_code(result: RecResult) -> int:
+    """Exit code of a run; see the module docstring."""
+    if any(r.failed_count > 0 for r in result):
+        return EXIT_FAILED
+
+    if result.incomplete():
+        return EXIT_INCOMPLETE
+
+    return EXIT_PASSED
+
+
+def build_report(
+    result: RecResult,
+    baseline_path: str,
+    candidate_path: str,
+) -> dict[str, Any]:
+    """
+    Machine-readable outcome of a run: the exit code, both files and every check.
+    """
+    checks = [
+        {
+            "check": r.check_name,
+            "column": r.column,
+            "args": r.check_args,
+            "status": r.status,
+            "passed": r.passed,
+            "total_rows": r.total_rows,
+            "failed_count": r.failed_count,
+            "stats": r.stats,
+            "sketches": {name: s.describe() for name, s in r.sketches.items()},
+        }
+        for r in result
+    ]
+
+    b_rows, b_cols = result.baseline_shape
+    c_rows, c_cols = result.candidate_shape
+
+    return {
+        "exit_code": exit_code(result),
+        "passed": result.passed(),
+        "stop_reason": result.stop_reason,
+        "baseline": {"path": baseline_path, "rows": b_rows, "columns": b_cols},
+        "candidate": {"path": candidate_path, "rows": c_rows, "columns": c_cols},
+        "checks": checks,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="recx",
+        description="Reconcile a candidate CSV file against a baseline CSV file.",
+    )
+    parser.add_argument("baseline", help="Baseline CSV file.")
+    parser.add_argument("candidate", help="Candidate CSV file.")
+    parser.add_argument("-c", "--config", required=True, help="TOML config.")
+    parser.add_argument("--report", help="Write a JSON report to this file.")
+    parser.add_argument(
+        "--mode",
+        choices=["rows", "counts"],
+        default="rows",
+        help="'counts' keeps no failing rows, only counts (default: rows).",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Seconds after which the column checks stop (exit code 3).",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print progress to stderr.",
+    )
+    args = parser.parse_args(argv)
+
+    def show(progress):
+        print(progress, file=sys.stderr)
+
+    try:
+        config = load_config(args.config)
+        rec = build_rec(config)
+
+        if args.time_budget is not None and not rec.stoppable:
+            raise ValueError(
+                "--time-budget cannot stop checks run with executor='process'; "
+                'use executor = "thread"'
+            )
+
+        baseline = read_csv(args.baseline, config)
+        candidate = read_csv(args.candidate, config)
+    except (OSError, ValueError, tomllib.TOMLDecodeError) as e:
+        print(f"recx: error: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    result = rec.run(
+        baseline,
+        candidate,
+        mode=args.mode,
+        time_budget=args.time_budget,
+        progress=show if args.progress else None,
+    )
+    result.summary()
+
+    if args.report:
+        report = build_report(result, args.baseline, args.candidate)
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2, default=_jsonable)
+            f.write("\n")
+
+    return exit_code(result)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
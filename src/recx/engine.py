@@ -0,0 +1,963 @@
+"""
+Block-wise execution of column checks.
+
+Columns that are checked with equivalent checks and share a NumPy dtype are compared
+together as 2-D blocks, so the per-column Python and pandas overhead is paid once per
+block rather than once per column.
+
+Checks report failures as masks (or positions). Only the failing positions and their
+diagnostics are kept; the frame of failing rows is built from the original frames the
+first time :attr:`CheckResult.failed_rows` is accessed.
+"""
+
+import functools
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+from recx.align import Alignment
+from recx.fingerprint import columns_identical
+from recx.parallel import imap_ordered
+from recx.profile import Profiler, span
+from recx.progress import RunControl
+from recx.results import CheckResult, Status
+from recx.sketch import ErrorSketch, merge_sketches, sketch_stats
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+    from recx.prefilter import RowFilter
+
+ArrayLike = np.ndarray | ExtensionArray
+
+# Picks the failing positions to keep from a mask and its diagnostics
+SelectFailures = Callable[[np.ndarray, Mapping[str, ArrayLike]], np.ndarray]
+
+Mode = Literal["rows", "counts"]
+
+MODES = ("rows", "counts")
+
+# Upper bound on the number of cells in one 2-D block. Groups holding more cells are
+# split into several blocks to keep the temporary arrays bounded.
+BLOCK_CELLS = 2**24
+
+
+def _dtype(dtypes: pd.Series, column: str):
+    dtype = dtypes[column]
+
+    # would occur with duplicate column labels
+    if isinstance(dtype, pd.Series):
+        raise TypeError("Column selection did not return a Series; check column spec.")
+
+    return dtype
+
+
+def _column(frame: pd.DataFrame, column: str) -> pd.Series:
+    series = frame[column]
+
+    # Defensive: if a DataFrame slipped through, raise (mis-specified column)
+    if not isinstance(series, pd.Series):
+        raise TypeError("Column selection did not return a Series; check column spec.")
+
+    return series
+
+
+def take_block(
+    frame: pd.DataFrame,
+    columns: Sequence[str],
+    indexer: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Rows ``indexer`` (all rows if ``None``) of ``columns`` as one 2-D array.
+
+    Rows are taken column by column from views of the columns, so only the taken
+    rows are copied, however few they are (e.g. one slice of a budgeted run).
+    """
+    if indexer is None:
+        # Often a view of the frame's own block
+        return frame[list(columns)].to_numpy()
+
+    arrays = [_column(frame, column).to_numpy() for column in columns]
+    block = np.empty(
+        (len(indexer), len(arrays)), dtype=np.result_type(*arrays), order="F"
+    )
+
+    for j, values in enumerate(arrays):
+        # The positions are valid; "clip" lets take write straight into out
+        np.take(values, indexer, out=block[:, j], mode="clip")
+
+    return block
+
+
+def failed_positions(failed: np.ndarray) -> np.ndarray:
+    """
+    Return the failing positions for a boolean mask or an array of positions.
+    """
+    failed = np.asarray(failed)
+
+    if failed.dtype == bool:
+        return np.flatnonzero(failed)
+
+    return failed.astype(np.intp, copy=False)
+
+
+def failed_frame(
+    index: pd.Index,
+    baseline: ArrayLike,
+    candidate: ArrayLike,
+    failed: np.ndarray,
+    diagnostics: Mapping[str, ArrayLike],
+) -> pd.DataFrame:
+    """
+    Build the frame of failing rows for one column.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Row labels of the compared values.
+
+    baseline, candidate : array-like
+        1-D arrays of compared values.
+
+    failed : numpy.ndarray
+        1-D boolean mask (``True`` where the row failed) or failing positions.
+
+    diagnostics : dict[str, array-like]
+        Extra 1-D arrays (e.g. errors), one value per compared row, to include as
+        columns.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Frame with ``baseline`` and ``candidate`` columns followed by diagnostics.
+    """
+    positions = failed_positions(failed)
+    data: dict[str, ArrayLike] = {
+        "baseline": baseline[positions],
+        "candidate": candidate[positions],
+    }
+    data.update({name: values[positions] for name, values in diagnostics.items()})
+    return pd.DataFrame(data, index=index[positions])
+
+
+class _FailedRows:
+    """
+    Deferred frame of failing rows for one column.
+
+    Holds only the failing positions and their diagnostics. The baseline and
+    candidate values are taken from the original frames when called.
+    """
+
+    def __init__(
+        self,
+        check: "ColumnCheck",
+        column: str,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        alignment: Alignment,
+        positions: np.ndarray,
+        diagnostics: Mapping[str, ArrayLike],
+    ):
+        self.check = check
+        self.column = column
+        self.baseline = baseline
+        self.candidate = candidate
+        self.alignment = alignment
+        self.positions = positions
+        self.diagnostics = diagnostics
+
+    def __call__(self) -> pd.DataFrame:
+        positions = self.positions
+        alignment = self.alignment
+
+        b = _column(self.baseline, self.column).array
+        c = _column(self.candidate, self.column).array
+
+        data: dict[str, ArrayLike] = {
+            "baseline": b.take(alignment.baseline_positions(positions)),
+            "candidate": c.take(alignment.candidate_positions(positions)),
+        }
+        data.update(self.diagnostics)
+
+        frame = pd.DataFrame(data, index=alignment.index[positions])
+        return self.check.order_failures(frame)
+
+
+class ColumnOutcome:
+    """
+    Failures found by one check on one column, before they become a result.
+
+    Mask-based checks report the failing (aligned) positions together with the
+    diagnostics of those rows only. Frame-based checks report their frame. In
+    ``'counts'`` mode neither is kept, only the number of failures. Either way the
+    numeric diagnostics of every evaluated row are summarised in sketches.
+
+    Parameters
+    ----------
+    total_rows : int
+        Number of rows evaluated.
+
+    positions : numpy.ndarray, optional
+        Failing positions among the aligned rows.
+
+    diagnostics : dict[str, array-like], optional
+        Diagnostic values at the failing positions.
+
+    failed_rows : pandas.DataFrame, optional
+        Frame of failing rows, for checks that only implement ``check``.
+
+    status : {'complete', 'truncated', 'skipped'}, default 'complete'
+        Whether every row was evaluated. See :class:`CheckResult`.
+
+    count : int, optional
+        Number of failing rows, if not every failure is kept (count-only outcomes,
+        or checks that only keep some failures, see
+        :meth:`ColumnCheck.select_failures`).
+
+    null_mismatches : int, optional
+        Number of rows missing on exactly one side, for count-only outcomes.
+
+    sketches : dict[str, ErrorSketch], optional
+        Sketch of each numeric diagnostic over all evaluated rows.
+    """
+
+    def __init__(
+        self,
+        total_rows: int,
+        positions: np.ndarray | None = None,
+        diagnostics: Mapping[str, ArrayLike] | None = None,
+        failed_rows: pd.DataFrame | None = None,
+        status: Status = "complete",
+        count: int | None = None,
+        null_mismatches: int | None = None,
+        sketches: Mapping[str, ErrorSketch] | None = None,
+    ):
+        self.total_rows = total_rows
+        self.positions = positions
+        self.diagnostics = dict(diagnostics or {})
+        self.failed_rows = failed_rows
+        self.status: Status = status
+        self.count = count
+        self.null_mismatches = null_mismatches
+        self.sketches = dict(sketches or {})
+
+    @property
+    def failed_count(self) -> int:
+        if self.count is not None:
+            return self.count
+
+        if self.positions is not None:
+            return len(self.positions)
+
+        assert self.failed_rows is not None
+        return len(self.failed_rows)
+
+    @property
+    def counts_only(self) -> bool:
+        return self.positions is None and self.failed_rows is None
+
+    @classmethod
+    def from_mask(
+        cls,
+        failed: np.ndarray,
+        diagnostics: Mapping[str, ArrayLike],
+        total_rows: int,
+        select: SelectFailures | None = None,
+    ) -> "ColumnOutcome":
+        failed = np.asarray(failed)
+        count = int(np.count_nonzero(failed)) if failed.dtype == bool else len(failed)
+
+        if select is None:
+            positions = failed_positions(failed)
+        else:
+            # Only the selected failures are kept, but all of them are counted
+            positions = select(failed, diagnostics)
+
+        # Keep only the failing diagnostics; everything else is released here
+        failing = {name: values[positions] for name, values in diagnostics.items()}
+
+        return cls(
+            total_rows,
+            positions=positions,
+            diagnostics=failing,
+            count=count,
+            sketches=sketch_diagnostics(diagnostics),
+        )
+
+    @classmethod
+    def passing(
+        cls,
+        total_rows: int,
+        mode: Mode = "rows",
+        sketches: Mapping[str, ErrorSketch] | None = None,
+    ) -> "ColumnOutcome":
+        """Outcome of a check that passed every row."""
+        if mode == "counts":
+            return cls(total_rows, count=0, null_mismatches=0, sketches=sketches)
+
+        return cls(
+            total_rows,
+            positions=np.empty(0, dtype=np.intp),
+            sketches=sketches,
+        )
+
+    @classmethod
+    def from_counts(
+        cls,
+        failed: np.ndarray,
+        diagnostics: Mapping[str, ArrayLike],
+        total_rows: int,
+        null_mismatches: int,
+    ) -> "ColumnOutcome":
+        failed = np.asarray(failed)
+        count = int(failed.sum()) if failed.dtype == bool else len(failed)
+
+        return cls(
+            total_rows,
+            count=count,
+            null_mismatches=null_mismatches,
+            sketches=sketch_diagnostics(diagnostics),
+        )
+
+
+def sketch_diagnostics(diagnostics: Mapping[str, ArrayLike]) -> dict[str, ErrorSketch]:
+    """
+    Return a sketch of each numeric diagnostic; other diagnostics are ignored.
+    """
+    return {
+        name: ErrorSketch.from_values(values)
+        for name, values in diagnostics.items()
+        if values.dtype.kind in "iuf"
+    }
+
+
+def merge_counts(
+    outcomes: Sequence[ColumnOutcome],
+    status: Status = "complete",
+) -> ColumnOutcome:
+    """
+    Combine count-only outcomes of one check over disjoint sets of rows.
+    """
+    return ColumnOutcome(
+        sum(o.total_rows for o in outcomes),
+        status=status,
+        count=sum(o.failed_count for o in outcomes),
+        null_mismatches=sum(o.null_mismatches or 0 for o in outcomes),
+        sketches=merge_sketches(o.sketches for o in outcomes),
+    )
+
+
+def error_stats(outcome: ColumnOutcome) -> dict[str, float]:
+    """
+    Summary statistics of a count-only outcome.
+
+    Returns the number of null mismatches and the maximum and mean of each numeric
+    diagnostic (e.g. ``max_abs_error`` and ``mean_abs_error``).
+    """
+    stats: dict[str, float] = {"null_mismatches": outcome.null_mismatches or 0}
+    stats.update(sketch_stats(outcome.sketches))
+    return stats
+
+
+def _null_mismatches(baseline, candidate) -> np.ndarray:
+    """
+    Number of rows (per column for 2-D input) missing on exactly one side.
+    """
+    return (pd.isna(baseline) != pd.isna(candidate)).sum(axis=0)
+
+
+def concat_arrays(arrays: Sequence[ArrayLike]) -> ArrayLike:
+    """
+    Concatenate 1-D NumPy or extension arrays.
+    """
+    numpy_arrays = [a for a in arrays if isinstance(a, np.ndarray)]
+
+    if len(numpy_arrays) == len(arrays):
+        return np.concatenate(numpy_arrays)
+
+    return pd.concat([pd.Series(a) for a in arrays], ignore_index=True).array
+
+
+def concat_outcomes(
+    parts: Sequence[tuple[int, ColumnOutcome]],
+    status: Status = "complete",
+) -> ColumnOutcome:
+    """
+    Combine the outcomes of one check over consecutive slices of the aligned rows.
+
+    Parameters
+    ----------
+    parts : list[tuple[int, ColumnOutcome]]
+        Outcomes paired with the aligned position their slice starts at.
+
+    status : {'complete', 'truncated', 'skipped'}, default 'complete'
+        Status of the combined outcome.
+
+    Returns
+    -------
+    ColumnOutcome
+        Outcome with positions relative to the full alignment.
+    """
+    total_rows = sum(o.total_rows for _, o in parts)
+
+    if not parts:
+        return ColumnOutcome(0, positions=np.empty(0, dtype=np.intp), status=status)
+
+    if parts[0][1].counts_only:
+        return merge_counts([o for _, o in parts], status)
+
+    if all(o.positions is not None for _, o in parts):
+        positions = np.concatenate(
+            [start + o.positions for start, o in parts if o.positions is not None]
+        )
+        diagnostics = {
+            name: concat_arrays([o.diagnostics[name] for _, o in parts])
+            for name in parts[0][1].diagnostics
+        }
+        return ColumnOutcome(
+            total_rows,
+            positions,
+            diagnostics,
+            status=status,
+            count=sum(o.failed_count for _, o in parts),
+            sketches=merge_sketches(o.sketches for _, o in parts),
+        )
+
+    frames = [o.failed_rows for _, o in parts if o.failed_rows is not None]
+    failed_rows = pd.concat(frames) if len(frames) > 1 else frames[0]
+
+    return ColumnOutcome(total_rows, failed_rows=failed_rows, status=status)
+
+
+def to_result(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    alignment: Alignment,
+    check: "ColumnCheck",
+    column: str,
+    outcome: ColumnOutcome,
+) -> CheckResult:
+    """
+    Turn a :class:`ColumnOutcome` into a :class:`CheckResult`.
+
+    For mask-based outcomes the failing rows frame is deferred until accessed.
+    Count-only outcomes give a result without failing rows but with statistics.
+    """
+    if outcome.counts_only:
+        return CheckResult(
+            failed_rows=None,
+            failed_count=outcome.failed_count,
+            column=column,
+            check_name=check.check_name,
+            check_args=check.check_args,
+            total_rows=outcome.total_rows,
+            status=outcome.status,
+            stats=error_stats(outcome),
+            sketches=outcome.sketches,
+        )
+
+    if outcome.positions is None:
+        assert outcome.failed_rows is not None
+        return CheckResult(
+            failed_rows=outcome.failed_rows,
+            column=column,
+            check_name=check.check_name,
+            check_args=check.check_args,
+            total_rows=outcome.total_rows,
+            status=outcome.status,
+        )
+
+    failed_rows = _FailedRows(
+        check,
+        column,
+        baseline,
+        candidate,
+        alignment,
+        outcome.positions,
+        outcome.diagnostics,
+    )
+
+    return CheckResult(
+        failed_rows=failed_rows,
+        failed_count=outcome.failed_count,
+        column=column,
+        check_name=check.check_name,
+        check_args=check.check_args,
+        total_rows=outcome.total_rows,
+        status=outcome.status,
+        sketches=outcome.sketches,
+    )
+
+
+def _evaluate_single(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    alignment: Alignment,
+    check: "ColumnCheck",
+    column: str,
+    mode: Mode = "rows",
+    profiler: Profiler | None = None,
+) -> ColumnOutcome:
+    with span(profiler, "align", "align"):
+        bcol = alignment.baseline(_column(baseline, column))
+        ccol = alignment.candidate(_column(candidate, column))
+
+    if mode == "counts":
+        nulls = int(_null_mismatches(bcol.to_numpy(), ccol.to_numpy()))
+
+        if check.uses_masks:
+            failed, diagnostics = check.check_mask(bcol, ccol)
+        else:
+            failed, diagnostics = np.arange(len(check.check(bcol, ccol))), {}
+
+        return ColumnOutcome.from_counts(failed, diagnostics, len(bcol), nulls)
+
+    if check.uses_masks:
+        failed, diagnostics = check.check_mask(bcol, ccol)
+        return ColumnOutcome.from_mask(
+            failed, diagnostics, len(bcol), check.select_failures
+        )
+
+    return ColumnOutcome(len(bcol), failed_rows=check.check(bcol, ccol))
+
+
+def _evaluate_block(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    alignment: Alignment,
+    tasks: list[tuple["ColumnCheck", str]],
+    mode: Mode = "rows",
+    profiler: Profiler | None = None,
+) -> list[ColumnOutcome]:
+    columns = [column for _, column in tasks]
+
+    # Only the aligned rows of the columns of this block are ever copied
+    with span(profiler, "align", "align"):
+        b = take_block(baseline, columns, alignment.baseline_indexer)
+        c = take_block(candidate, columns, alignment.candidate_indexer)
+
+    # All checks in a block share the same key, so any of them can run the kernel.
+    failed, diagnostics = tasks[0][0].check_block(b, c)
+
+    if mode == "counts":
+        nulls = _null_mismatches(b, c)
+
+        return [
+            ColumnOutcome.from_counts(
+                failed[:, j],
+                {name: values[:, j] for name, values in diagnostics.items()},
+                len(b),
+                int(nulls[j]),
+            )
+            for j in range(len(tasks))
+        ]
+
+    return [
+        ColumnOutcome.from_mask(
+            failed[:, j],
+            {name: values[:, j] for name, values in diagnostics.items()},
+            len(b),
+            check.select_failures,
+        )
+        for j, (check, _) in enumerate(tasks)
+    ]
+
+
+def task_block_keys(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+) -> list[Hashable | None]:
+    """
+    Return the :meth:`ColumnCheck.block_key` of every task.
+
+    Only the dtypes of the frames are read, so the keys can be computed once per
+    schema and reused.
+    """
+    baseline_dtypes = baseline.dtypes
+    candidate_dtypes = candidate.dtypes
+
+    return [
+        check.block_key(
+            _dtype(baseline_dtypes, column),
+            _dtype(candidate_dtypes, column),
+        )
+        for check, column in tasks
+    ]
+
+
+def plan_units(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    block_keys: Sequence[Hashable | None] | None = None,
+) -> list[tuple[bool, list[int]]]:
+    """
+    Group task positions into units of work.
+
+    Tasks whose checks share a :meth:`ColumnCheck.block_key` form one block unit
+    ``(True, members)``; every other task is a unit of its own ``(False, [i])``.
+    Units are ordered by their first task. ``block_keys`` are the keys of the
+    tasks, if already known (see :func:`task_block_keys`).
+    """
+    if block_keys is None:
+        block_keys = task_block_keys(baseline, candidate, tasks)
+
+    units: list[tuple[bool, list[int]]] = []
+    groups: dict[Hashable, list[int]] = {}
+
+    for i, key in enumerate(block_keys):
+        if key is None:
+            units.append((False, [i]))
+        elif key in groups:
+            groups[key].append(i)
+        else:
+            groups[key] = [i]
+            units.append((True, groups[key]))
+
+    return units
+
+
+def _evaluate(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment,
+    n_jobs: int,
+    mode: Mode,
+    block_keys: Sequence[Hashable | None] | None = None,
+    profiler: Profiler | None = None,
+    on_done: Callable[[int], None] | None = None,
+) -> list[ColumnOutcome]:
+    # Units of work: lists of task positions, either one block or a single column
+    units: list[tuple[bool, list[int]]] = []
+
+    block_width = max(1, BLOCK_CELLS // max(1, len(alignment)))
+
+    for is_block, members in plan_units(baseline, candidate, tasks, block_keys):
+        if not is_block:
+            units.append((is_block, members))
+            continue
+
+        # Split blocks further so that every worker has something to do
+        width = min(block_width, -(-len(members) // n_jobs))
+
+        units += [
+            (True, members[start : start + width])
+            for start in range(0, len(members), width)
+        ]
+
+    def run_unit(unit: tuple[bool, list[int]]) -> list[ColumnOutcome]:
+        is_block, members = unit
+        unit_tasks = [tasks[i] for i in members]
+        check, column = unit_tasks[0]
+
+        if is_block:
+            name = f"{check.check_name} block ({len(members)} columns)"
+        else:
+            name = f"{check.check_name}({column!r})"
+
+        columns = [column for _, column in unit_tasks]
+
+        with span(profiler, name, "check", unit_tasks, columns=columns):
+            if is_block:
+                return _evaluate_block(
+                    baseline, candidate, alignment, unit_tasks, mode, profiler
+                )
+
+            return [
+                _evaluate_single(
+                    baseline, candidate, alignment, check, column, mode, profiler
+                )
+            ]
+
+    outcomes: list[ColumnOutcome | None] = [None] * len(tasks)
+
+    for (_, members), unit_outcomes in zip(
+        units,
+        imap_ordered(run_unit, units, n_jobs),
+        strict=True,
+    ):
+        for i, outcome in zip(members, unit_outcomes, strict=True):
+            outcomes[i] = outcome
+
+        if on_done is not None:
+            on_done(len(members))
+
+    return [o for o in outcomes if o is not None]
+
+
+def _zero_errors(values: pd.Series, skip: np.ndarray | None = None) -> int:
+    """
+    Number of ``values`` that are neither missing nor infinite, leaving out the
+    positions where ``skip`` is ``True``.
+
+    These are the rows whose numeric diagnostics are zero when the values are
+    compared with themselves; missing and infinite values give NaN and are not
+    sketched.
+    """
+    dtype = values.dtype
+    finite: np.ndarray | None
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+        finite = None
+    elif isinstance(dtype, np.dtype) and dtype.kind in "fc":
+        finite = np.isfinite(values.to_numpy())
+    else:
+        try:
+            finite = np.isfinite(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        except (TypeError, ValueError):
+            finite = values.notna().to_numpy()
+
+    if finite is None:
+        return len(values) - (0 if skip is None else int(np.count_nonzero(skip)))
+
+    if skip is not None:
+        finite &= ~skip
+
+    return int(np.count_nonzero(finite))
+
+
+def _add_zeros(
+    check: "ColumnCheck",
+    sketches: Mapping[str, ErrorSketch],
+    count: int,
+) -> None:
+    for name in check.identical_diagnostics():
+        if name in sketches:
+            sketches[name].add_zeros(count)
+
+
+def _short_circuit(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment,
+    mode: Mode,
+) -> list[tuple[int, ColumnOutcome]]:
+    """
+    Pass the tasks whose columns are proven identical without running the check.
+
+    Only applies to checks that treat identical values as passing
+    (:attr:`ColumnCheck.prefilter`) and when the frames need no row alignment. The
+    check is not called, so its :meth:`ColumnCheck.identical_diagnostics` of a
+    numeric column are sketched as zeros.
+    """
+    if not alignment.is_identity:
+        return []
+
+    identical: dict[str, bool] = {}
+    passed: list[tuple[int, ColumnOutcome]] = []
+
+    for i, (check, column) in enumerate(tasks):
+        if not check.prefilter:
+            continue
+
+        if column not in identical:
+            identical[column] = columns_identical(
+                _column(baseline, column),
+                _column(candidate, column),
+            )
+
+        if not identical[column]:
+            continue
+
+        sketches = {}
+        values = _column(baseline, column)
+
+        if check.uses_masks and values.dtype.kind in "iuf":
+            sketches = {name: ErrorSketch() for name in check.identical_diagnostics()}
+            _add_zeros(check, sketches, _zero_errors(values))
+
+        passed.append((i, ColumnOutcome.passing(len(alignment), mode, sketches)))
+
+    return passed
+
+
+def _expand(
+    outcome: ColumnOutcome,
+    check: "ColumnCheck",
+    rows: np.ndarray,
+    total_rows: int,
+    zeros: Callable[[], int],
+) -> None:
+    """
+    Map an outcome over a subset of the aligned rows back to all of them.
+
+    The other rows hold identical values; ``zeros()`` of them are added to the
+    sketches of :meth:`ColumnCheck.identical_diagnostics` as zero errors (see
+    :func:`_zero_errors`).
+    """
+    if outcome.positions is not None:
+        outcome.positions = rows[outcome.positions]
+
+    if outcome.sketches.keys() & set(check.identical_diagnostics()):
+        _add_zeros(check, outcome.sketches, zeros())
+
+    outcome.total_rows = total_rows
+
+
+def evaluate_tasks(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment | None = None,
+    n_jobs: int = 1,
+    mode: Mode = "rows",
+    row_filter: "RowFilter | None" = None,
+    block_keys: Sequence[Hashable | None] | None = None,
+    profiler: Profiler | None = None,
+    on_done: Callable[[int], None] | None = None,
+) -> list[ColumnOutcome]:
+    """
+    Evaluate ``(check, column)`` tasks, returning one raw outcome per task.
+
+    ``on_done`` is called with a number of tasks whenever that many have been
+    evaluated. See :func:`run_column_checks` for the other parameters.
+    """
+    if alignment is None:
+        alignment = Alignment(baseline.index)
+
+    outcomes: list[ColumnOutcome | None] = [None] * len(tasks)
+    passed = _short_circuit(baseline, candidate, tasks, alignment, mode)
+
+    for i, outcome in passed:
+        outcomes[i] = outcome
+
+    if passed and on_done is not None:
+        on_done(len(passed))
+
+    pending = [i for i, outcome in enumerate(outcomes) if outcome is None]
+
+    # Checks the row filter applies to only see the rows whose fingerprints differ
+    groups: list[tuple[list[int], np.ndarray | None]] = [(pending, None)]
+    changed = np.empty(0, dtype=bool)
+
+    if row_filter is not None:
+        changed = row_filter.changed
+        filtered = [i for i in pending if row_filter.applies(*tasks[i])]
+        others = [i for i in pending if not row_filter.applies(*tasks[i])]
+        groups = [(filtered, np.flatnonzero(changed)), (others, None)]
+
+    @functools.cache
+    def unchanged_zeros(column: str) -> int:
+        return _zero_errors(alignment.baseline(_column(baseline, column)), changed)
+
+    for members, rows in groups:
+        if not members:
+            continue
+
+        group_outcomes = _evaluate(
+            baseline,
+            candidate,
+            [tasks[i] for i in members],
+            alignment if rows is None else alignment.take_rows(rows),
+            n_jobs,
+            mode,
+            None if block_keys is None else [block_keys[i] for i in members],
+            profiler,
+            on_done,
+        )
+
+        for i, outcome in zip(members, group_outcomes, strict=True):
+            if rows is not None:
+                check, column = tasks[i]
+                zeros = functools.partial(unchanged_zeros, column)
+                _expand(outcome, check, rows, len(alignment), zeros)
+            outcomes[i] = outcome
+
+    return [o for o in outcomes if o is not None]
+
+
+def run_column_checks(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment | None = None,
+    n_jobs: int = 1,
+    mode: Mode = "rows",
+    row_filter: "RowFilter | None" = None,
+    block_keys: Sequence[Hashable | None] | None = None,
+    profiler: Profiler | None = None,
+    control: RunControl | None = None,
+) -> list[CheckResult]:
+    """
+    Run a list of ``(check, column)`` tasks against two frames.
+
+    Tasks whose checks return the same :meth:`ColumnCheck.block_key` are evaluated
+    together with a single :meth:`ColumnCheck.check_block` call per block. All other
+    tasks fall back to :meth:`ColumnCheck.check_mask` (or :meth:`ColumnCheck.check`)
+    one column at a time.
+
+    Parameters
+    ----------
+    baseline : pandas.DataFrame
+        Baseline frame.
+
+    candidate : pandas.DataFrame
+        Candidate frame.
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Checks paired with the concrete column they apply to.
+
+    alignment : Alignment, optional
+        Rows of each frame to compare. By default the frames are assumed to be
+        index-aligned already.
+
+    n_jobs : int, default 1
+        Number of threads to run blocks and columns on. NumPy releases the GIL for
+        most of the comparison work, so blocks run concurrently.
+
+    mode : {'rows', 'counts'}, default 'rows'
+        With ``'counts'`` no failing rows are kept. Results only hold the number of
+        failures and :attr:`CheckResult.stats`.
+
+    row_filter : RowFilter, optional
+        Aligned rows whose fingerprints differ. Checks it applies to are only run on
+        those rows; all other rows pass. ``total_rows`` still counts every row.
+
+    block_keys : list, optional
+        :meth:`ColumnCheck.block_key` of every task, if already known (e.g. from a
+        compiled plan). Computed from the dtypes otherwise.
+
+    profiler : Profiler, optional
+        Records a span per block or column evaluated, and per alignment.
+
+    control : RunControl, optional
+        Progress is reported to it whenever a block or column is done. The checks
+        are never stopped early; see :func:`recx.budget.run_budgeted` for that.
+
+    Returns
+    -------
+    list[CheckResult]
+        One result per task, in the same order as ``tasks``.
+    """
+    if alignment is None:
+        alignment = Alignment(baseline.index)
+
+    on_done = None
+
+    if control is not None:
+        n_rows = len(alignment)
+        control.plan_columns(n_rows, len(tasks))
+        on_done = functools.partial(control.complete_columns, rows=n_rows)
+
+    outcomes = evaluate_tasks(
+        baseline,
+        candidate,
+        tasks,
+        alignment,
+        n_jobs,
+        mode,
+        row_filter,
+        block_keys,
+        profiler,
+        on_done,
+    )
+
+    return [
+        to_result(baseline, candidate, alignment, check, column, outcome)
+        for (check, column), outcome in zip(tasks, outcomes, strict=True)
+    ]
@@ -0,0 +1,115 @@
+"""
+Value fingerprints used to prove that columns (or rows) hold identical values.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+
+# Number of elements compared at a time, so that differing columns exit early
+FINGERPRINT_CHUNK = 2**20
+
+
+def hashable(baseline: pd.Series, candidate: pd.Series) -> bool:
+    """
+    ``True`` if equal hashes of the two columns imply equal values.
+    """
+    dtype = baseline.dtype
+
+    if dtype != candidate.dtype:
+        return False
+
+    if isinstance(dtype, pd.StringDtype):
+        return True
+
+    if not isinstance(dtype, np.dtype):
+        return False
+
+    if dtype.kind == "O":
+        # Mixed objects are hashed through their string form, so e.g. 1 and "1"
+        # would collide
+        return all(
+            infer_dtype(s, skipna=True) == "string" for s in (baseline, candidate)
+        )
+
+    return dtype.kind in "biufmM"
+
+
+def column_hash(values: pd.Series) -> np.ndarray:
+    """
+    Hash each value, with all NaNs and both zeros hashing alike.
+    """
+    array = values.to_numpy()
+
+    if array.dtype.kind == "f":
+        # -0.0 + 0.0 is 0.0, and NaN payloads are replaced by the default NaN
+        array = array + 0.0
+        array[np.isnan(array)] = np.nan
+
+    if isinstance(values.dtype, np.dtype):
+        return pd.util.hash_array(array)  # type: ignore
+
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()  # type: ignore
+
+
+def _same_buffer(a: np.ndarray, b: np.ndarray) -> bool:
+    a_data = a.__array_interface__["data"][0]
+    b_data = b.__array_interface__["data"][0]
+    return a_data == b_data and a.strides == b.strides
+
+
+def _bytes_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """
+    Compare the raw bytes of two arrays, chunk by chunk.
+    """
+    a = np.ascontiguousarray(a)
+    b = np.ascontiguousarray(b)
+
+    # Compare whole elements as unsigned integers where possible
+    if a.itemsize in (1, 2, 4, 8):
+        a = a.view(f"u{a.itemsize}")
+        b = b.view(f"u{b.itemsize}")
+    else:
+        a = a.view(np.uint8)
+        b = b.view(np.uint8)
+
+    for start in range(0, len(a), FINGERPRINT_CHUNK):
+        stop = start + FINGERPRINT_CHUNK
+        if not np.array_equal(a[start:stop], b[start:stop]):
+            return False
+
+    return True
+
+
+def columns_identical(baseline: pd.Series, candidate: pd.Series) -> bool:
+    """
+    ``True`` if two columns are proven to hold identical values.
+
+    NumPy columns are identical if they share a buffer or their bytes are equal.
+    Other columns are compared through their value hashes, where that is reliable
+    (see :func:`hashable`). ``False`` means "not proven", not "different".
+
+    Parameters
+    ----------
+    baseline, candidate : pandas.Series
+        Columns of equal length, row-aligned.
+
+    Returns
+    -------
+    bool
+        Whether the columns are identical. Equal nulls count as identical.
+    """
+    if len(baseline) != len(candidate) or baseline.dtype != candidate.dtype:
+        return False
+
+    dtype = baseline.dtype
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        b = baseline.to_numpy()
+        c = candidate.to_numpy()
+        return _same_buffer(b, c) or _bytes_equal(b, c)
+
+    if hashable(baseline, candidate):
+        return bool(np.array_equal(column_hash(baseline), column_hash(candidate)))
+
+    return False
@@ -0,0 +1,263 @@
+"""
+Dtype-specialised comparison kernels.
+
+``baseline == candidate`` plus two ``isnull()`` calls is correct for every dtype, but
+allocates several temporaries and is slow on categoricals. Each equality kernel here
+returns the same mask of failing rows (nulls in the same position are equal) for one
+family of dtypes, working on the underlying NumPy arrays.
+
+The tolerance kernel fuses the error, the comparison and the null handling of
+:class:`~recx.checks.AbsTolCheck` and :class:`~recx.checks.RelTolCheck`. It writes
+straight into its two outputs (the error and the failing mask), chunk by chunk, so
+any other temporaries only cover one chunk and come from a reused scratch arena.
+"""
+
+import math
+import threading
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+EqualKernel = Callable[[pd.Series, pd.Series], np.ndarray]
+
+# Writes the error of ``(baseline, candidate)`` into ``out``
+ErrorKernel = Callable[[np.ndarray, np.ndarray, np.ndarray], None]
+
+# Cells per chunk of the tolerance kernel, so that per-chunk temporaries stay small
+TOLERANCE_CHUNK = 2**16
+
+# Extension arrays that store their values in ``_data`` and nulls in ``_mask``
+_MASKED_ARRAYS = (
+    pd.arrays.IntegerArray,
+    pd.arrays.FloatingArray,
+    pd.arrays.BooleanArray,
+)
+
+
+def exact_unequal(baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Failing mask of arrays that cannot hold nulls (integers, booleans)."""
+    return baseline != candidate
+
+
+def nan_unequal(baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Failing mask of float arrays, with NaNs in the same position equal."""
+    failed = baseline != candidate
+
+    # NaN != NaN, so both-NaN rows are among the failures. Only those are
+    # rechecked, rather than testing every row for NaN.
+    positions = np.flatnonzero(failed)
+
+    if len(positions):
+        both_nan = np.isnan(baseline[positions]) & np.isnan(candidate[positions])
+        failed[positions[both_nan]] = False
+
+    return failed
+
+
+def int64_unequal(baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """
+    Failing mask of datetime or timedelta arrays of one unit, compared as int64.
+
+    NaT is stored as the smallest int64, so NaTs in the same position are equal.
+    """
+    return baseline.view(np.int64) != candidate.view(np.int64)
+
+
+def block_unequal(baseline: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+    """Failing mask of two NumPy arrays (1-D or 2-D) of the same dtype."""
+    kind = baseline.dtype.kind
+
+    if kind in "mM":
+        return int64_unequal(baseline, candidate)
+
+    if kind in "fc":
+        return nan_unequal(baseline.ravel(), candidate.ravel()).reshape(baseline.shape)
+
+    return exact_unequal(baseline, candidate)
+
+
+def _numpy(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    return block_unequal(baseline.to_numpy(), candidate.to_numpy())
+
+
+def _datetime_tz(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    b = np.asarray(baseline.array.asi8)  # type: ignore[union-attr]
+    c = np.asarray(candidate.array.asi8)  # type: ignore[union-attr]
+    return b != c
+
+
+def _masked(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    b = baseline.array
+    c = candidate.array
+    b_data, b_mask = b._data, b._mask  # type: ignore[union-attr]
+    c_data, c_mask = c._data, c._mask  # type: ignore[union-attr]
+
+    failed = block_unequal(b_data, c_data)
+
+    # Values under a mask are meaningless; a null on one side only fails
+    failed &= ~(b_mask | c_mask)
+    failed |= b_mask != c_mask
+    return failed
+
+
+def _categorical(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    b_codes = baseline.cat.codes.to_numpy()
+    c_codes = candidate.cat.codes.to_numpy()
+    b_categories = baseline.cat.categories
+    c_categories = candidate.cat.categories
+
+    if not b_categories.equals(c_categories):
+        # Recode the candidate into the baseline categories. Categories missing
+        # from the baseline get -2, which no baseline code (or null, -1) matches.
+        recode = b_categories.get_indexer(c_categories)
+        recode[recode < 0] = -2
+        c_codes = np.where(c_codes >= 0, recode.take(c_codes), -1)
+
+    return b_codes != c_codes
+
+
+def equal_kernel(baseline_dtype, candidate_dtype) -> EqualKernel | None:
+    """
+    Return the equality kernel for two column dtypes.
+
+    Parameters
+    ----------
+    baseline_dtype, candidate_dtype
+        Dtypes of the baseline and candidate columns.
+
+    Returns
+    -------
+    callable or None
+        A function of the two columns returning the mask of failing rows, or
+        ``None`` if there is no specialised kernel (e.g. strings, objects or
+        differing dtypes) and the generic comparison should be used.
+    """
+    if isinstance(baseline_dtype, pd.CategoricalDtype) and isinstance(
+        candidate_dtype, pd.CategoricalDtype
+    ):
+        return _categorical
+
+    if baseline_dtype != candidate_dtype:
+        return None
+
+    if isinstance(baseline_dtype, np.dtype):
+        return _numpy if baseline_dtype.kind in "biufcmM" else None
+
+    if isinstance(baseline_dtype, pd.DatetimeTZDtype):
+        return _datetime_tz
+
+    if issubclass(baseline_dtype.construct_array_type(), _MASKED_ARRAYS):
+        return _masked
+
+    return None
+
+
+class ScratchArena(threading.local):
+    """
+    Scratch buffers reused across chunks and calls, one set per thread.
+
+    Buffers only grow, and are sized by the largest chunk requested, not by the
+    rows of a column.
+    """
+
+    def __init__(self):
+        self.buffers: dict[tuple[np.dtype, int], np.ndarray] = {}
+
+    def get(self, shape: tuple[int, ...], dtype, slot: int = 0) -> np.ndarray:
+        """
+        Return an uninitialised array of ``shape`` and ``dtype``.
+
+        Arrays handed out with different ``slot`` numbers do not overlap; an
+        array is overwritten by the next request for the same slot and dtype.
+        """
+        dtype = np.dtype(dtype)
+        size = math.prod(shape)
+        buffer = self.buffers.get((dtype, slot))
+
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=dtype)
+            self.buffers[(dtype, slot)] = buffer
+
+        return buffer[:size].reshape(shape)
+
+
+SCRATCH = ScratchArena()
+
+
+def tolerance_failed(
+    baseline: np.ndarray,
+    candidate: np.ndarray,
+    tol: float,
+    error_kernel: ErrorKernel,
+    error_dtype,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the failing mask and the error of a tolerance check.
+
+    Parameters
+    ----------
+    baseline, candidate : numpy.ndarray
+        Numeric arrays (1-D columns or 2-D blocks) of the same shape.
+
+    tol : float
+        Largest error that passes.
+
+    error_kernel : callable
+        ``error_kernel(baseline, candidate, out)`` writes the error of a chunk of
+        rows into ``out``.
+
+    error_dtype
+        Dtype of the error.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        ``(failed, error)``. A row fails if its error is above ``tol`` or is NaN,
+        unless both values are NaN.
+    """
+    error = np.empty(baseline.shape, dtype=error_dtype)
+    failed = np.empty(baseline.shape, dtype=bool)
+
+    width = math.prod(baseline.shape[1:])
+    step = max(1, TOLERANCE_CHUNK // max(width, 1))
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        for start in range(0, len(baseline), step):
+            rows = slice(start, start + step)
+            error_kernel(baseline[rows], candidate[rows], error[rows])
+            np.less_equal(error[rows], tol, out=failed[rows])
+
+    np.logical_not(failed, out=failed)
+
+    # Nulls are equal. A null gives a NaN error, which fails, so only the failures
+    # are rechecked rather than testing every row for NaN.
+    if "f" in (baseline.dtype.kind, candidate.dtype.kind):
+        cells = np.nonzero(failed)
+        both_nan = np.isnan(baseline[cells]) & np.isnan(candidate[cells])
+        failed[tuple(axis[both_nan] for axis in cells)] = False
+
+    return failed, error
+
+
+def abs_error(baseline: np.ndarray, candidate: np.ndarray, out: np.ndarray) -> None:
+    """Write ``|baseline - candidate|`` into ``out``."""
+    np.subtract(baseline, candidate, out=out)
+    np.abs(out, out=out)
+
+
+def rel_error(baseline: np.ndarray, candidate: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write ``|baseline - candidate| / |candidate|`` into ``out``.
+
+    A zero denominator is replaced by ``1e-10``.
+    """
+    abs_error(baseline, candidate, out)
+
+    denominator = SCRATCH.get(out.shape, np.float64, slot=0)
+    zero = SCRATCH.get(out.shape, bool, slot=1)
+
+    np.abs(candidate, out=denominator)
+    np.equal(denominator, 0, out=zero)
+    np.copyto(denominator, 1e-10, where=zero)
+    np.divide(out, denominator, out=out)
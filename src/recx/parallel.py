@@ -0,0 +1,55 @@
+"""
+Parallel execution helpers.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Executor = Literal["thread", "process"]
+
+EXECUTORS = ("thread", "process")
+
+
+def resolve_n_jobs(n_jobs: int | None) -> int:
+    """
+    Return the number of workers for an ``n_jobs`` setting.
+
+    ``None`` or ``1`` runs serially. Negative values count back from the number of
+    CPUs, so ``-1`` uses every CPU.
+    """
+    if n_jobs is None:
+        return 1
+
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+
+    return n_jobs
+
+
+def imap_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    n_jobs: int = 1,
+) -> Iterator[R]:
+    """
+    Apply ``fn`` to every item, on a thread pool if ``n_jobs > 1``.
+
+    Results are yielded in the order of ``items``, each as soon as it and the ones
+    before it are done, on the calling thread.
+    """
+    items = list(items)
+
+    if n_jobs <= 1 or len(items) <= 1:
+        yield from map(fn, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(n_jobs, len(items))) as pool:
+        yield from pool.map(fn, items)
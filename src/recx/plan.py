@@ -0,0 +1,97 @@
+"""
+Compiled reconciliation plans.
+
+Resolving a ``Rec`` configuration (regex column specs, default columns, which
+checks are evaluated as 2-D blocks, how rows are joined) only depends on the column
+names and dtypes of the two frames. A :class:`RecPlan` holds that resolution, so
+runs on frames with an unchanged schema skip it.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+from recx.align import Duplicates
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+
+Schema = tuple[tuple[Hashable, Any], ...]
+
+
+def schema_of(frame: pd.DataFrame) -> Schema:
+    """Return the column names and dtypes of ``frame``."""
+    return tuple(zip(frame.columns, frame.dtypes, strict=True))
+
+
+def empty_frame(schema: Schema) -> pd.DataFrame:
+    """Return a frame without rows that has the given schema."""
+    data = {i: pd.Series(dtype=dtype) for i, (_, dtype) in enumerate(schema)}
+    return pd.DataFrame(data).set_axis([column for column, _ in schema], axis=1)
+
+
+def make_schema(columns: Iterable[Hashable], dtypes: Iterable[Any]) -> Schema:
+    """Pair column names with dtypes, e.g. ``make_schema(df.columns, df.dtypes)``."""
+    return tuple(
+        (column, pd.api.types.pandas_dtype(dtype))
+        for column, dtype in zip(columns, dtypes, strict=True)
+    )
+
+
+class RecPlan:
+    """
+    A ``Rec`` configuration resolved against the schema of two frames.
+
+    Plans are created by :meth:`Rec.compile` and picklable, so they can be shipped
+    to worker processes along with their checks.
+
+    Parameters
+    ----------
+    baseline_schema, candidate_schema : tuple
+        Column names and dtypes of the frames the plan was compiled for.
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Checks paired with the concrete column they apply to.
+
+    block_keys : list
+        :meth:`ColumnCheck.block_key` of every task; tasks sharing a key are
+        evaluated together as 2-D blocks, the rest one column at a time.
+
+    keys : list[str], optional
+        Key columns the rows are joined on, or ``None`` to join on the index.
+
+    duplicates : {'product', 'occurrence'}
+        How rows sharing a key are paired.
+    """
+
+    def __init__(
+        self,
+        baseline_schema: Schema,
+        candidate_schema: Schema,
+        tasks: list[tuple["ColumnCheck", str]],
+        block_keys: list[Hashable | None],
+        keys: list[str] | None,
+        duplicates: Duplicates,
+    ):
+        self.baseline_schema = baseline_schema
+        self.candidate_schema = candidate_schema
+        self.tasks = tasks
+        self.block_keys = block_keys
+        self.keys = keys
+        self.duplicates: Duplicates = duplicates
+
+    @property
+    def schema(self) -> tuple[Schema, Schema]:
+        """The baseline and candidate schemas, as used to cache the plan."""
+        return self.baseline_schema, self.candidate_schema
+
+    def matches(self, baseline: pd.DataFrame, candidate: pd.DataFrame) -> bool:
+        """``True`` if both frames have the schema the plan was compiled for."""
+        return self.schema == (schema_of(baseline), schema_of(candidate))
+
+    def __repr__(self) -> str:
+        return (
+            f"RecPlan(tasks={len(self.tasks)}, "
+            f"columns={len(self.baseline_schema)}, keys={self.keys!r})"
+        )
@@ -0,0 +1,123 @@
+"""
+Row-fingerprint prefilter.
+
+Usually only a small fraction of rows differ between the two frames. The prefilter
+hashes every aligned row over the columns of checks that opt in (see
+:attr:`ColumnCheck.prefilter`) and compares the two fingerprints. Those checks then
+only run on the rows whose fingerprints differ; every other row is known to hold
+identical values and passes.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from recx.align import Alignment
+from recx.engine import _column, _dtype
+from recx.fingerprint import column_hash, hashable
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+
+# Multiplier used to fold column hashes into one row hash (64-bit FNV prime)
+_PRIME = np.uint64(1099511628211)
+
+
+def _fold(hashes: np.ndarray, values: pd.Series) -> None:
+    """
+    Fold the hashes of one column into the running row hashes, in place.
+    """
+    hashes ^= column_hash(values)
+    hashes *= _PRIME
+
+
+class RowFilter:
+    """
+    Aligned rows that may differ, and the checks that only look at those rows.
+
+    Parameters
+    ----------
+    changed : numpy.ndarray
+        Boolean mask over the aligned rows, ``True`` where the row fingerprints
+        differ.
+
+    columns : frozenset[str]
+        Columns covered by the fingerprint.
+    """
+
+    def __init__(self, changed: np.ndarray, columns: frozenset[str]):
+        self.changed = changed
+        self.columns = columns
+
+    def applies(self, check: "ColumnCheck", column: str) -> bool:
+        """``True`` if ``check`` on ``column`` only needs the changed rows."""
+        return check.prefilter and column in self.columns
+
+    def take_rows(self, positions: np.ndarray) -> "RowFilter":
+        """Return the filter for the aligned rows at ``positions``."""
+        return RowFilter(self.changed[positions], self.columns)
+
+    def slice_rows(self, start: int, stop: int) -> "RowFilter":
+        """Return the filter for the aligned rows ``start:stop``."""
+        return RowFilter(self.changed[start:stop], self.columns)
+
+
+def build_row_filter(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment,
+) -> RowFilter | None:
+    """
+    Fingerprint the aligned rows over the columns of opted-in checks.
+
+    Parameters
+    ----------
+    baseline : pandas.DataFrame
+        Baseline frame.
+
+    candidate : pandas.DataFrame
+        Candidate frame.
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Checks paired with the concrete column they apply to. Only columns of checks
+        with ``prefilter`` set, and whose values can be hashed safely, are
+        fingerprinted.
+
+    alignment : Alignment
+        Rows of each frame to compare.
+
+    Returns
+    -------
+    RowFilter or None
+        The filter, or ``None`` if no column qualifies.
+    """
+    b_dtypes = baseline.dtypes
+    c_dtypes = candidate.dtypes
+
+    candidates = dict.fromkeys(
+        column
+        for check, column in tasks
+        if check.prefilter and _dtype(b_dtypes, column) == _dtype(c_dtypes, column)
+    )
+
+    columns = []
+    b_hashes = np.zeros(len(alignment), dtype=np.uint64)
+    c_hashes = np.zeros(len(alignment), dtype=np.uint64)
+
+    # One column at a time, so only the running hashes are held
+    for column in candidates:
+        b = alignment.baseline(_column(baseline, column))
+        c = alignment.candidate(_column(candidate, column))
+
+        if hashable(b, c):
+            columns.append(column)
+            _fold(b_hashes, b)
+            _fold(c_hashes, c)
+
+    if not columns:
+        return None
+
+    return RowFilter(b_hashes != c_hashes, frozenset(columns))
@@ -0,0 +1,290 @@
+"""
+Timing and memory instrumentation of a run.
+
+A :class:`Profiler` records spans: named intervals of a run (a phase such as the
+index join, or the evaluation of one check or block) with their wall time and,
+optionally, the peak memory traced by ``tracemalloc``. Code that may be profiled
+takes an optional profiler and wraps its phases in :func:`span`, which costs one
+function call when profiling is off.
+
+Spans can be turned into a frame (:meth:`Profiler.timings`) or written as a Chrome
+trace (:meth:`Profiler.write_trace`), which ``chrome://tracing`` and Perfetto open.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Hashable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Span:
+    """
+    One timed interval.
+
+    Parameters
+    ----------
+    name : str
+        What ran, e.g. ``'join'`` or ``"AbsTolCheck('price')"``.
+
+    category : str
+        Kind of span: ``'run'``, ``'phase'``, ``'check'`` or ``'align'``.
+
+    start : float
+        Start in seconds, relative to the start of the profiler.
+
+    thread : int
+        Identifier of the thread the span ran on.
+
+    args : dict, optional
+        Extra details, e.g. the ``columns`` of a check span.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        thread: int,
+        args: dict[str, Any] | None = None,
+    ):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.thread = thread
+        self.args = args or {}
+        self.seconds: float | None = None
+        self.peak_bytes: int | None = None
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.category!r}, seconds={self.seconds})"
+
+
+class Profiler:
+    """
+    Collects the spans of one run.
+
+    Parameters
+    ----------
+    memory : bool, default False
+        Also record the peak memory of each span, as traced by ``tracemalloc``.
+        Tracing slows the run down noticeably. Memory is only recorded for spans on
+        the thread that created the profiler, and is the peak above the memory in
+        use when the span started.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.spans: list[Span] = []
+        self.task_seconds: dict[tuple[int, Hashable], float] = {}
+
+        self._origin = time.perf_counter()
+        self._owner = threading.get_ident()
+        self._lock = threading.Lock()
+
+        # Per open span on the owner thread: memory at its start and the highest
+        # peak seen by the spans nested in it
+        self._memory_stack: list[list[int]] = []
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Start tracing memory, if requested and not already on."""
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracing memory, if :meth:`start` turned it on."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _traced(self) -> bool:
+        return (
+            self.memory
+            and tracemalloc.is_tracing()
+            and threading.get_ident() == self._owner
+        )
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        category: str = "phase",
+        tasks: Sequence[tuple["ColumnCheck", Hashable]] = (),
+        **args: Any,
+    ) -> Iterator[Span]:
+        """
+        Record the enclosed block as a span.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+
+        category : str, default 'phase'
+            Kind of span.
+
+        tasks : list[tuple[ColumnCheck, str]], optional
+            Checks evaluated by the span. Its time is split evenly between them
+            and added to :attr:`task_seconds`.
+
+        **args
+            Extra details stored on the span.
+        """
+        traced = self._traced()
+
+        if traced:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._memory_stack:
+                parent = self._memory_stack[-1]
+                parent[1] = max(parent[1], peak)
+            tracemalloc.reset_peak()
+            self._memory_stack.append([current, current])
+
+        start = time.perf_counter()
+        span = Span(name, category, start - self._origin, threading.get_ident(), args)
+
+        try:
+            yield span
+        finally:
+            span.seconds = time.perf_counter() - start
+
+            if traced:
+                base, nested = self._memory_stack.pop()
+                peak = max(nested, tracemalloc.get_traced_memory()[1])
+                span.peak_bytes = peak - base
+                if self._memory_stack:
+                    parent = self._memory_stack[-1]
+                    parent[1] = max(parent[1], peak)
+
+            with self._lock:
+                self.spans.append(span)
+
+            for check, column in tasks:
+                self.add_seconds(check, column, span.seconds / len(tasks))
+
+    def add_seconds(
+        self,
+        check: "ColumnCheck",
+        column: Hashable,
+        seconds: float,
+    ) -> None:
+        """Add to the time spent evaluating ``check`` on ``column``."""
+        key = (id(check), column)
+
+        with self._lock:
+            self.task_seconds[key] = self.task_seconds.get(key, 0.0) + seconds
+
+    def seconds(self, check: "ColumnCheck", column: Hashable) -> float | None:
+        """Time spent evaluating ``check`` on ``column``, if it was recorded."""
+        return self.task_seconds.get((id(check), column))
+
+    def timings(self) -> pd.DataFrame:
+        """
+        Return one row per span, in the order they started.
+
+        Columns are ``name``, ``category``, ``start`` and ``seconds`` (in seconds),
+        ``peak_bytes`` (missing unless memory was traced), ``thread`` and
+        ``columns`` (the columns of check spans).
+        """
+        spans = sorted(self.spans, key=lambda s: s.start)
+        threads = self._thread_numbers()
+
+        return pd.DataFrame(
+            {
+                "name": [s.name for s in spans],
+                "category": [s.category for s in spans],
+                "start": [s.start for s in spans],
+                "seconds": [s.seconds for s in spans],
+                "peak_bytes": pd.array([s.peak_bytes for s in spans], dtype="Int64"),
+                "thread": [threads[s.thread] for s in spans],
+                "columns": [s.args.get("columns") for s in spans],
+            }
+        )
+
+    def _thread_numbers(self) -> dict[int, int]:
+        # The owner thread is 0, the others are numbered as they first appear
+        threads = {self._owner: 0}
+        for span in sorted(self.spans, key=lambda s: s.start):
+            threads.setdefault(span.thread, len(threads))
+        return threads
+
+    def trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format."""
+        pid = os.getpid()
+        threads = self._thread_numbers()
+
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": number,
+                "args": {"name": "main" if number == 0 else f"worker {number}"},
+            }
+            for number in threads.values()
+        ]
+
+        for span in sorted(self.spans, key=lambda s: s.start):
+            args = {k: _jsonable(v) for k, v in span.args.items()}
+            if span.peak_bytes is not None:
+                args["peak_bytes"] = span.peak_bytes
+
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": (span.seconds or 0.0) * 1e6,
+                    "pid": pid,
+                    "tid": threads[span.thread],
+                    "args": args,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: str | os.PathLike) -> None:
+        """
+        Write the spans to ``path`` as a Chrome trace (JSON).
+        """
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+
+    return str(value)
+
+
+def span(
+    profiler: Profiler | None,
+    name: str,
+    category: str = "phase",
+    tasks: Sequence[tuple["ColumnCheck", Hashable]] = (),
+    **args: Any,
+) -> contextlib.AbstractContextManager[Span | None]:
+    """
+    Return :meth:`Profiler.span`, or a no-op context if ``profiler`` is ``None``.
+    """
+    if profiler is None:
+        return _NULL_SPAN
+
+    return profiler.span(name, category, tasks, **args)
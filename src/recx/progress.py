@@ -0,0 +1,237 @@
+"""
+Progress reports, time budgets and cancellation of a run.
+
+A :class:`RunControl` follows one run: it reports :class:`Progress` to a callback at
+every phase and at every column check, and tells the column checks to stop once a
+time budget runs out or a :class:`CancelToken` is cancelled. Runs that can stop
+compare the rows of each check in slices and also report after every slice; checks
+stopped this way are marked truncated or skipped, as with a failure budget.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Literal
+
+StopReason = Literal["time_budget", "cancelled"]
+
+# Seconds between two progress reports while the rows of a check are compared. Phase
+# and column boundaries are always reported.
+PROGRESS_INTERVAL = 0.1
+
+
+class CancelToken:
+    """
+    Flag to stop a run from another thread (or from a progress callback).
+
+    Examples
+    --------
+    >>> token = CancelToken()
+    >>> token.cancelled
+    False
+    >>> token.cancel()
+    >>> token.cancelled
+    True
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the run to stop at the next slice of rows."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def __repr__(self) -> str:
+        return f"CancelToken(cancelled={self.cancelled})"
+
+
+class Progress:
+    """
+    State of a run, as passed to a progress callback.
+
+    Parameters
+    ----------
+    phase : str
+        Current phase: ``'clip_dates'``, ``'plan'``, ``'join'``,
+        ``'index_checks'``, ``'column_checks'`` or ``'done'``.
+
+    elapsed : float
+        Seconds since the run started.
+
+    rows_done, rows_total : int
+        Rows compared so far and rows to compare, summed over the column checks.
+        Rows of checks that stopped early no longer count towards the total.
+
+    columns_done, columns_total : int
+        Column checks finished (complete, truncated or skipped) and planned.
+    """
+
+    def __init__(
+        self,
+        phase: str,
+        elapsed: float,
+        rows_done: int = 0,
+        rows_total: int = 0,
+        columns_done: int = 0,
+        columns_total: int = 0,
+    ):
+        self.phase = phase
+        self.elapsed = elapsed
+        self.rows_done = rows_done
+        self.rows_total = rows_total
+        self.columns_done = columns_done
+        self.columns_total = columns_total
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the rows of the column checks compared so far."""
+        if self.rows_total == 0:
+            return 1.0 if self.phase == "done" else 0.0
+        return self.rows_done / self.rows_total
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Estimated seconds until the column checks finish, extrapolated from the
+        rows compared so far. ``None`` until the first rows are compared.
+        """
+        if self.phase == "done":
+            return 0.0
+
+        if self.rows_done == 0:
+            return None
+
+        remaining = self.rows_total - self.rows_done
+        return self.elapsed / self.rows_done * remaining
+
+    def __str__(self) -> str:
+        eta = "?" if self.eta is None else f"{self.eta:.1f}s"
+        return (
+            f"{self.phase}: {self.rows_done:,}/{self.rows_total:,} rows, "
+            f"{self.columns_done}/{self.columns_total} columns, "
+            f"{self.elapsed:.1f}s elapsed, eta {eta}"
+        )
+
+    def __repr__(self) -> str:
+        return f"Progress({self})"
+
+
+class RunControl:
+    """
+    Progress reporting and stop conditions of one run.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Called with a :class:`Progress` at every report.
+
+    time_budget : float, optional
+        Seconds after which the column checks stop.
+
+    cancel : CancelToken, optional
+        Token that stops the column checks once cancelled.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Progress], None] | None = None,
+        time_budget: float | None = None,
+        cancel: CancelToken | None = None,
+    ):
+        if time_budget is not None and time_budget < 0:
+            raise ValueError(f"time_budget must not be negative, got {time_budget}")
+
+        self.callback = callback
+        self.cancel = cancel
+        self.stop_reason: StopReason | None = None
+
+        self.phase = "start"
+        self.rows_done = 0
+        self.rows_total = 0
+        self.columns_done = 0
+        self.columns_total = 0
+
+        self._start = time.monotonic()
+        self._deadline = None if time_budget is None else self._start + time_budget
+        self._last_report = -float("inf")
+
+    def progress(self) -> Progress:
+        """Snapshot of the run so far."""
+        return Progress(
+            self.phase,
+            time.monotonic() - self._start,
+            self.rows_done,
+            self.rows_total,
+            self.columns_done,
+            self.columns_total,
+        )
+
+    def report(self, force: bool = True) -> None:
+        """
+        Call the callback, unless ``force`` is off and the last report was less than
+        ``PROGRESS_INTERVAL`` ago.
+        """
+        if self.callback is None:
+            return
+
+        now = time.monotonic()
+        if force or now - self._last_report >= PROGRESS_INTERVAL:
+            self._last_report = now
+            self.callback(self.progress())
+
+    def enter(self, phase: str) -> None:
+        """Start a new phase and report it."""
+        self.phase = phase
+        self.report()
+
+    def plan_columns(self, n_rows: int, n_tasks: int) -> None:
+        """Set the totals of the column checks: ``n_tasks`` over ``n_rows`` rows."""
+        self.rows_total += n_rows * n_tasks
+        self.columns_total += n_tasks
+
+    @property
+    def can_stop(self) -> bool:
+        """
+        Whether the run has a time budget or a cancel token, so that the column
+        checks must compare their rows in slices to be able to stop between them.
+        """
+        return self._deadline is not None or self.cancel is not None
+
+    def advance(self, rows: int) -> None:
+        """Count ``rows`` more rows compared, reporting at most every interval."""
+        self.rows_done += rows
+        self.report(force=False)
+
+    def finish_columns(self, n: int, rows_left: int = 0) -> None:
+        """
+        Count ``n`` more column checks finished, leaving ``rows_left`` of their rows
+        uncompared, and report it.
+        """
+        self.columns_done += n
+        self.rows_total -= rows_left
+        self.report()
+
+    def complete_columns(self, n: int, rows: int) -> None:
+        """
+        Count ``n`` more column checks finished after comparing all of their
+        ``rows`` rows, and report it.
+        """
+        self.rows_done += n * rows
+        self.finish_columns(n)
+
+    def should_stop(self) -> bool:
+        """
+        Whether the column checks must stop: the time budget ran out or the run
+        was cancelled. The first reason found is kept in :attr:`stop_reason`.
+        """
+        if self.stop_reason is None:
+            if self.cancel is not None and self.cancel.cancelled:
+                self.stop_reason = "cancelled"
+            elif self._deadline is not None and time.monotonic() >= self._deadline:
+                self.stop_reason = "time_budget"
+
+        return self.stop_reason is not None
@@ -1,12 +1,33 @@
 import logging
+import os
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from functools import partial
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from recx.checks import ColumnCheck, EqualCheck, index_check
+from recx.align import DUPLICATES, Alignment, Duplicates, IndexJoin
+from recx.budget import FailureBudget, run_budgeted
+from recx.cache import PartitionCache, PartitionHasher, config_key, partition_positions
+from recx.checks import ColumnCheck, EqualCheck, duplicate_check, index_check
+from recx.chunks import merge_windows
+from recx.engine import MODES, Mode, run_column_checks, task_block_keys
+from recx.parallel import EXECUTORS, Executor, resolve_n_jobs
+from recx.plan import RecPlan, Schema, empty_frame, make_schema, schema_of
+from recx.prefilter import RowFilter, build_row_filter
+from recx.profile import Profiler, span
+from recx.progress import CancelToken, Progress, RunControl
 from recx.results import CheckResult, RecResult
+from recx.sampling import sample_positions
+from recx.shards import run_sharded
+from recx.sketch import ErrorSketch, merge_sketches
 
 logger = logging.getLogger(__name__)
 
+# Number of compiled plans (one per schema) kept by each Rec
+PLAN_CACHE_SIZE = 16
+
 
 def get_col(df: pd.DataFrame, col: str) -> pd.Series:
     """
@@ -26,6 +47,85 @@ def get_col(df: pd.DataFrame, col: str) -> pd.Series:
     return series_or_df
 
 
+def _row_labels(frame: pd.DataFrame, keys: list[str] | None) -> pd.Index:
+    """
+    Return the label of every row: its index, or its key columns with ``keys``.
+    """
+    if keys is None:
+        return frame.index
+
+    if len(keys) == 1:
+        return pd.Index(frame[keys[0]], name=keys[0])
+
+    return pd.MultiIndex.from_frame(frame.loc[:, keys])
+
+
+def _in_row_order(frame: pd.DataFrame, labels: pd.Index) -> pd.DataFrame:
+    """
+    Stably sort ``frame`` by where each of its labels first occurs in ``labels``.
+    """
+    first = ~labels.duplicated()
+    positions = np.flatnonzero(first)[labels[first].get_indexer(frame.index)]
+
+    return frame.iloc[np.argsort(positions, kind="stable")]
+
+
+def _by_label(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stably sort ``frame`` by label where labels are sortable.
+    """
+    try:
+        return frame.sort_index(kind="stable")
+    except TypeError:
+        return frame
+
+
+def _sorted_cut(
+    df: pd.DataFrame,
+    date_col: str,
+) -> tuple[Any, Callable[[Any], int]] | None:
+    """
+    Fast path for frames sorted by ``date_col``.
+
+    Returns the latest date and a function giving the number of leading rows dated
+    on or before a given date, or ``None`` if the frame is empty or not sorted
+    (including when it holds missing dates). Nothing is copied: MultiIndex levels
+    are searched through their codes and uniques.
+    """
+    index = df.index
+
+    if len(df) == 0:
+        return None
+
+    if isinstance(index, pd.MultiIndex) and date_col in index.names:
+        level = index.names.index(date_col)
+        codes: np.ndarray = index.codes[level]  # type: ignore[assignment]
+        uniques: pd.Index = index.levels[level]  # type: ignore[assignment]
+
+        sorted_codes = pd.Index(codes, copy=False).is_monotonic_increasing
+
+        # Missing dates have code -1, which sorts first
+        if codes[0] < 0 or not sorted_codes or not uniques.is_monotonic_increasing:
+            return None
+
+        def level_cut(date) -> int:
+            # Rows whose code is below the number of uniques up to ``date``
+            n_uniques = uniques.searchsorted(date, side="right")
+            return int(codes.searchsorted(n_uniques, side="left"))
+
+        return uniques[codes[-1]], level_cut
+
+    dates = index if date_col in index.names else get_col(df, date_col)
+
+    if not dates.is_monotonic_increasing:
+        return None
+
+    def cut(date) -> int:
+        return int(dates.searchsorted(date, side="right"))
+
+    return dates[-1] if isinstance(dates, pd.Index) else dates.iloc[-1], cut
+
+
 def clip_to_last_common_date(
     a: pd.DataFrame,
     b: pd.DataFrame,
@@ -37,6 +137,9 @@ def clip_to_last_common_date(
     Useful to safely align two versions of a dataset where one includes newer data that
     we do not expect to be in the other.
 
+    Frames sorted by ``date_col`` are clipped with a binary search and a positional
+    slice; only unsorted frames are scanned with a boolean mask.
+
     Parameters
     ----------
 
@@ -53,16 +156,34 @@ def clip_to_last_common_date(
     -------
     tuple[pandas.DataFrame, pandas.DataFrame]
         ``(a_clipped, b_clipped)`` with only rows whose ``date_col`` value is
-        less than or equal to the shared maximum date.
+        less than or equal to the shared maximum date. Rows with a missing date
+        are dropped and do not count towards either frame's maximum.
     """
-    a_dates = get_col(a, date_col).to_numpy()
-    b_dates = get_col(b, date_col).to_numpy()
+    frames = (a, b)
+    sorted_cuts = [_sorted_cut(df, date_col) for df in frames]
+    dates: list[np.ndarray | None] = [None, None]
+    latest: list[Any] = [None, None]
+
+    for i, (df, sorted_cut) in enumerate(zip(frames, sorted_cuts, strict=True)):
+        if sorted_cut is not None:
+            latest[i] = sorted_cut[0]
+        else:
+            col = get_col(df, date_col)
+            dates[i] = col.to_numpy()
+            # Missing dates are skipped here as on the sorted path, which refuses
+            # frames holding any
+            latest[i] = col.max()
 
-    latest_date = min(a_dates.max(), b_dates.max())
+    latest_date = min(latest)
+    clipped = []
 
-    clip_a = a.loc[a_dates <= latest_date]
-    clip_b = b.loc[b_dates <= latest_date]
+    for df, sorted_cut, df_dates in zip(frames, sorted_cuts, dates, strict=True):
+        if sorted_cut is not None:
+            clipped.append(df.iloc[: sorted_cut[1](latest_date)])
+        else:
+            clipped.append(df.loc[df_dates <= latest_date])
 
+    clip_a, clip_b = clipped
     return clip_a, clip_b
 
 
@@ -90,6 +211,47 @@ class Rec:
     align_date_col : str, optional
         Optional date/datetime column (or index level) name used to clip both
         frames to their last common date before comparison.
+
+    n_jobs : int, default 1
+        Number of workers used to run the column checks. ``-1`` uses every CPU.
+        Results are returned in the same order as with a single worker.
+
+    executor : {'thread', 'process'}, default 'thread'
+        How the column checks are parallelised when ``n_jobs > 1``. With
+        ``'thread'`` blocks of columns (or single columns) are scheduled on a thread
+        pool; NumPy releases the GIL for the bulk of the comparison work. With
+        ``'process'`` the aligned rows are hash-partitioned by index label into
+        ``n_jobs`` shards, each reconciled in its own process with the column data
+        handed over through shared memory. This also scales checks that hold the
+        GIL, but the checks must be picklable.
+
+    prefilter : bool, default False
+        Fingerprint every aligned row over the columns of checks that opt in
+        (:class:`EqualCheck`, and tolerance checks created with
+        ``prefilter=True``). Those checks then only run on rows whose fingerprints
+        differ. ``total_rows`` still counts every row.
+
+    cache_dir : str or os.PathLike, optional
+        Directory for a partition cache (requires ``align_date_col``). Each
+        partition of ``align_date_col`` is hashed in both frames, and only
+        partitions whose hash changed since the last run with the same
+        configuration are reconciled again. The cached results are reused for
+        the others. Rows are only matched within their partition, so the cache is
+        only used when ``align_date_col`` is an index level or one of ``keys``.
+
+    keys : list[str], optional
+        Columns to match rows on instead of the index, so the frames need no
+        ``set_index``. The key columns are factorized and joined as integer codes.
+        Failing rows are labelled by their keys as if both frames had been indexed
+        by them, and the key columns are not checked by ``check_all``.
+
+    duplicates : {'product', 'occurrence'}, default 'product'
+        How rows sharing an index label (or key) are paired. ``'product'`` pairs
+        every combination, as ``.loc`` would, which multiplies the rows of
+        repeated keys. ``'occurrence'`` pairs the n-th row of a key in the
+        baseline with its n-th row in the candidate, in linear time. Surplus rows
+        are reported as missing or extra, and a ``duplicate_count_check`` result
+        lists the duplicated keys whose counts differ.
     """
 
     def __init__(
@@ -99,18 +261,492 @@ class Rec:
         check_missing_indices: bool = True,
         check_extra_indices: bool = True,
         align_date_col: str | None = None,
+        n_jobs: int = 1,
+        executor: Executor = "thread",
+        prefilter: bool = False,
+        cache_dir: str | os.PathLike | None = None,
+        keys: Sequence[str] | None = None,
+        duplicates: Duplicates = "product",
     ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}, got {executor!r}")
+
+        if duplicates not in DUPLICATES:
+            raise ValueError(
+                f"duplicates must be one of {DUPLICATES}, got {duplicates!r}"
+            )
+
+        if cache_dir is not None and align_date_col is None:
+            raise ValueError("cache_dir requires align_date_col to partition by.")
+
         self.align_date_col = align_date_col
         self.columns = columns
         self.check_all = check_all
         self.check_missing_indices = check_missing_indices
         self.check_extra_indices = check_extra_indices
+        self.n_jobs = resolve_n_jobs(n_jobs)
+        self.executor = executor
+        self.prefilter = prefilter
+        self.cache_dir = cache_dir
+        self.keys = list(keys) if keys is not None else None
+        self.duplicates: Duplicates = duplicates
+        self._plans: dict[tuple[Schema, Schema, Hashable], RecPlan] = {}
+
+    @property
+    def stoppable(self) -> bool:
+        """
+        Whether :meth:`run` can stop the column checks early (budgets,
+        ``time_budget``, ``cancel``), which checks run in processes cannot.
+        """
+        return self.executor != "process" or self.n_jobs == 1
+
+    def _tasks(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+    ) -> list[tuple[ColumnCheck, str]]:
+        """
+        Resolve the configured checks into concrete ``(check, column)`` tasks.
+        """
+        # Key columns identify rows; they are matched, not compared
+        checked_columns: set[str] = set(self.keys or [])
+        tasks: list[tuple[ColumnCheck, str]] = []
+
+        for column, check in self.columns.items():
+            # We might not want to check this column
+            if check is None:
+                checked_columns.add(column)
+                continue
+
+            matched = check.resolve_columns(baseline, candidate, column)
+            checked_columns.update(matched)
+            tasks += [(check, col) for col in matched]
+
+        # Default checks
+        if self.check_all:
+            # Only check the columns we haven't provided checks for
+            default_check = EqualCheck()
+            tasks += [
+                (default_check, col)
+                for col in baseline.columns
+                if col not in checked_columns
+            ]
+
+        return tasks
+
+    def compile(
+        self,
+        columns: Iterable[str],
+        dtypes: Iterable[Any],
+        candidate_columns: Iterable[str] | None = None,
+        candidate_dtypes: Iterable[Any] | None = None,
+    ) -> RecPlan:
+        """
+        Resolve the configuration against a schema, once.
+
+        The plan holds the column each check applies to (regex specs and
+        ``check_all`` resolved), which checks are evaluated together as 2-D blocks,
+        and how rows are joined. It is cached on the ``Rec``, and :meth:`run` uses
+        it for any frames with the same schema, as long as the column specs,
+        ``check_all``, ``keys`` and ``duplicates`` are unchanged. Frames with
+        another schema get a plan of their own, compiled on first use.
+
+        Parameters
+        ----------
+        columns : Iterable[str]
+            Column names of the baseline frame.
+
+        dtypes : Iterable
+            Dtype of every column, e.g. ``baseline.dtypes``.
+
+        candidate_columns, candidate_dtypes : Iterable, optional
+            Schema of the candidate frame, if it differs from the baseline's.
+
+        Returns
+        -------
+        RecPlan
+            The compiled plan. It is picklable if the checks are.
+
+        Raises
+        ------
+        ValueError
+            If a key column is missing from either schema.
+        """
+        b_schema = make_schema(columns, dtypes)
+
+        if candidate_columns is None or candidate_dtypes is None:
+            c_schema = b_schema
+        else:
+            c_schema = make_schema(candidate_columns, candidate_dtypes)
+
+        return self._compile(b_schema, c_schema)
+
+    def _compile(self, b_schema: Schema, c_schema: Schema) -> RecPlan:
+        for key in self.keys or []:
+            if key not in dict(b_schema) or key not in dict(c_schema):
+                raise ValueError(f"Key column {key!r} is missing from a frame.")
+
+        # Checks only look at the columns and dtypes, so frames without rows do
+        baseline = empty_frame(b_schema)
+        candidate = empty_frame(c_schema)
+        tasks = self._tasks(baseline, candidate)
+
+        plan = RecPlan(
+            b_schema,
+            c_schema,
+            tasks,
+            task_block_keys(baseline, candidate, tasks),
+            self.keys,
+            self.duplicates,
+        )
+
+        if len(self._plans) >= PLAN_CACHE_SIZE:
+            # Drop the oldest plan
+            del self._plans[next(iter(self._plans))]
+
+        self._plans[(*plan.schema, self._plan_settings())] = plan
+        return plan
+
+    def _plan_settings(self) -> Hashable:
+        """
+        The settings a plan is compiled from besides the schemas: the column specs
+        and their checks, ``check_all``, ``keys`` and ``duplicates``.
+
+        Plans are cached under these too, so changing any of them after a run (even
+        in place, as in ``rec.columns[spec] = check``) compiles a new plan.
+        """
+        # Checks are compared by identity; the cached plans keep them alive
+        columns = tuple((spec, id(check)) for spec, check in self.columns.items())
+        keys = None if self.keys is None else tuple(self.keys)
+        return columns, self.check_all, keys, self.duplicates
+
+    def _plan(self, baseline: pd.DataFrame, candidate: pd.DataFrame) -> RecPlan:
+        """
+        Return the cached plan for the schema of two frames and the current
+        settings, compiling it if needed.
+        """
+        b_schema = schema_of(baseline)
+        c_schema = schema_of(candidate)
+        plan = self._plans.get((b_schema, c_schema, self._plan_settings()))
+
+        if plan is None:
+            plan = self._compile(b_schema, c_schema)
+
+        return plan
+
+    def _reconcile(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        plan: RecPlan,
+        budget: FailureBudget | None = None,
+        check_budget: FailureBudget | None = None,
+        mode: Mode = "rows",
+        sample: float | int | None = None,
+        seed: int | None = None,
+        profiler: Profiler | None = None,
+        control: RunControl | None = None,
+    ) -> list[CheckResult]:
+        """
+        Run the index checks and the column checks of ``plan`` on two (already
+        clipped) frames.
+        """
+        tasks = plan.tasks
+        results: list[CheckResult] = []
+
+        if control is not None:
+            control.enter("join")
+
+        # One join of the two indexes serves the index checks and the alignment.
+        # Nothing is copied here: each check only takes the aligned rows of the
+        # columns it reads, and when the indexes already match the frames are used
+        # as they are.
+        with span(profiler, "join"):
+            join = IndexJoin.from_frames(
+                baseline, candidate, plan.keys, plan.duplicates
+            )
+
+        if control is not None:
+            control.enter("index_checks")
+
+        index_checks = []
+
+        if self.check_missing_indices:
+            index_checks.append(
+                ("missing_indices_check", partial(index_check, check="missing"))
+            )
+
+        if self.check_extra_indices:
+            index_checks.append(
+                ("extra_indices_check", partial(index_check, check="extra"))
+            )
+
+        for name, run_check in index_checks:
+            with span(profiler, name, "check") as timed:
+                results.append(run_check(baseline, candidate, join=join))
+
+            if timed is not None:
+                results[-1].elapsed = timed.seconds
+
+        if plan.duplicates == "occurrence":
+            with span(profiler, "duplicate_count_check", "check") as timed:
+                results.append(duplicate_check(join))
+
+            if timed is not None:
+                results[-1].elapsed = timed.seconds
+
+        alignment = join.alignment
+
+        # The index checks above are always exact; only the column checks are sampled
+        population = None
+
+        if sample is not None:
+            population = len(alignment)
+            strata = None
+
+            if self.align_date_col is not None:
+                dates = get_col(baseline, self.align_date_col).to_numpy()
+                strata = dates[alignment.baseline_positions(np.arange(population))]
+
+            with span(profiler, "sample"):
+                positions = sample_positions(population, sample, seed, strata)
+                alignment = alignment.take_rows(positions)
+
+        n_index = len(results)
+
+        row_filter = None
+        if self.prefilter:
+            with span(profiler, "prefilter"):
+                row_filter = build_row_filter(baseline, candidate, tasks, alignment)
+
+        if control is not None:
+            control.enter("column_checks")
+
+        with span(profiler, "column_checks"):
+            results += self._run_column_checks(
+                baseline,
+                candidate,
+                plan,
+                alignment,
+                results,
+                budget,
+                check_budget,
+                mode,
+                row_filter,
+                profiler,
+                control,
+            )
+
+        for result, (check, column) in zip(results[n_index:], tasks, strict=True):
+            result.population = population
+
+            # Checks passed by the prefilter or skipped by a budget took no time
+            if profiler is not None:
+                result.elapsed = profiler.seconds(check, column) or 0.0
+
+        return results
+
+    def _run_column_checks(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        plan: RecPlan,
+        alignment: Alignment,
+        prior: list[CheckResult],
+        budget: FailureBudget | None,
+        check_budget: FailureBudget | None,
+        mode: Mode,
+        row_filter: RowFilter | None,
+        profiler: Profiler | None,
+        control: RunControl | None,
+    ) -> list[CheckResult]:
+        """
+        Run the column checks of ``plan`` with the runner the settings call for.
+        """
+        tasks = plan.tasks
+
+        # Columns sharing a check and dtype are compared together as 2-D blocks.
+        # Runs that can stop early need the rows in slices; progress alone does not.
+        can_stop = control is not None and control.can_stop
+
+        if budget is not None or check_budget is not None or can_stop:
+            return run_budgeted(
+                baseline,
+                candidate,
+                tasks,
+                alignment,
+                budget=budget,
+                check_budget=check_budget,
+                prior=prior,
+                n_jobs=self.n_jobs,
+                mode=mode,
+                row_filter=row_filter,
+                block_keys=plan.block_keys,
+                profiler=profiler,
+                control=control,
+            )
+
+        if self.executor == "process" and self.n_jobs > 1:
+            return run_sharded(
+                baseline,
+                candidate,
+                tasks,
+                alignment,
+                self.n_jobs,
+                mode=mode,
+                row_filter=row_filter,
+                block_keys=plan.block_keys,
+                profiler=profiler,
+                control=control,
+            )
+
+        return run_column_checks(
+            baseline,
+            candidate,
+            tasks,
+            alignment,
+            n_jobs=self.n_jobs,
+            mode=mode,
+            row_filter=row_filter,
+            block_keys=plan.block_keys,
+            profiler=profiler,
+            control=control,
+        )
+
+    def _matched_within_dates(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+    ) -> bool:
+        """
+        Whether ``align_date_col`` is part of what rows are matched on, so that
+        matched rows always fall in the same partition.
+        """
+        if self.keys is not None:
+            return self.align_date_col in self.keys
+
+        return all(
+            self.align_date_col in df.index.names for df in (baseline, candidate)
+        )
+
+    def _reconcile_cached(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        plan: RecPlan,
+        mode: Mode = "rows",
+        profiler: Profiler | None = None,
+    ) -> list[CheckResult]:
+        """
+        Reconcile partition by partition, reusing cached results where unchanged.
+        """
+        assert self.cache_dir is not None and self.align_date_col is not None
+        tasks = plan.tasks
+
+        settings = {
+            "check_missing_indices": self.check_missing_indices,
+            "check_extra_indices": self.check_extra_indices,
+            "align_date_col": self.align_date_col,
+            "keys": self.keys,
+            "duplicates": self.duplicates,
+            "mode": mode,
+        }
+        cache = PartitionCache(self.cache_dir, config_key(settings, tasks)).load()
+
+        b_parts = partition_positions(get_col(baseline, self.align_date_col).to_numpy())
+        c_parts = partition_positions(
+            get_col(candidate, self.align_date_col).to_numpy()
+        )
+        b_hasher = PartitionHasher(baseline)
+        c_hasher = PartitionHasher(candidate)
+
+        empty = np.empty(0, dtype=np.intp)
+        entries = {}
+        reused = 0
+
+        for partition in dict.fromkeys([*b_parts, *c_parts]):
+            b_positions = b_parts.get(partition, empty)
+            c_positions = c_parts.get(partition, empty)
+            b_hash = b_hasher.digest(b_positions)
+            c_hash = c_hasher.digest(c_positions)
+
+            results = cache.get(partition, b_hash, c_hash)
+
+            if results is None:
+                with span(profiler, "partition", partition=partition):
+                    results = self._reconcile(
+                        baseline.iloc[b_positions],
+                        candidate.iloc[c_positions],
+                        plan,
+                        mode=mode,
+                        profiler=profiler,
+                    )
+
+                    # Build the failing rows now so that they can be stored
+                    for r in results:
+                        if r.has_failed_rows:
+                            r.failed_rows  # noqa: B018
+            else:
+                reused += 1
+
+                # Time spent in an earlier run does not count towards this one
+                for r in results:
+                    r.elapsed = None
+
+            entries[partition] = (b_hash, c_hash, results)
+
+        cache.save(entries)
+        logger.info(f"Reused cached results for {reused}/{len(entries)} partitions")
+
+        if not entries:
+            # Both frames were empty
+            return self._reconcile(
+                baseline, candidate, plan, mode=mode, profiler=profiler
+            )
+
+        # Partitions interleave in the frames: put the merged failing rows back in
+        # row order, then order them as each check does on a single run
+        b_labels = _row_labels(baseline, self.keys)
+        c_labels = _row_labels(candidate, self.keys)
+        index_labels = {
+            "missing_indices_check": b_labels,
+            "extra_indices_check": c_labels,
+            "duplicate_count_check": b_labels.append(c_labels),
+        }
+
+        def index_order(labels: pd.Index) -> Callable[[pd.DataFrame], pd.DataFrame]:
+            return lambda frame: _by_label(_in_row_order(frame, labels))
+
+        def column_order(check: ColumnCheck) -> Callable[[pd.DataFrame], pd.DataFrame]:
+            return lambda frame: check.order_failures(_in_row_order(frame, b_labels))
+
+        partitions = [results for _, _, results in entries.values()]
+        n_index = len(partitions[0]) - len(tasks)
+        orders = [
+            index_order(index_labels[r.check_name]) for r in partitions[0][:n_index]
+        ] + [column_order(check) for check, _ in tasks]
+
+        return [
+            CheckResult.merge([results[i] for results in partitions], order=order)
+            for i, order in enumerate(orders)
+        ]
 
     def run(
         self,
         baseline: pd.DataFrame,
         candidate: pd.DataFrame,
         raise_on_failure: bool = False,
+        fail_fast: bool = False,
+        budget: FailureBudget | None = None,
+        check_budget: FailureBudget | None = None,
+        mode: Mode = "rows",
+        sample: float | int | None = None,
+        seed: int | None = None,
+        profile: bool = False,
+        profile_memory: bool = False,
+        progress: Callable[[Progress], None] | None = None,
+        time_budget: float | None = None,
+        cancel: CancelToken | None = None,
     ) -> RecResult:
         """
         Execute all configured checks.
@@ -126,12 +762,150 @@ class Rec:
         raise_on_failure : bool, default False
             If ``True`` raise :class:`RecFailedException` when any check fails.
 
+        fail_fast : bool, default False
+            Stop at the first failing check. Shorthand for
+            ``budget=FailureBudget(rows=0)``.
+
+        budget : FailureBudget, optional
+            Failure budget over all checks together. Once more rows fail than the
+            budget allows, the checks in progress are truncated and the remaining
+            checks are skipped.
+
+        check_budget : FailureBudget, optional
+            Failure budget applied to each column check on its own. A check is
+            truncated as soon as it exceeds the budget.
+
+        mode : {'rows', 'counts'}, default 'rows'
+            With ``'counts'`` the column checks keep no failing rows, only the
+            number of failures plus :attr:`CheckResult.stats` (null mismatches and
+            the max and mean error of tolerance checks). This uses far less memory
+            on large frames; accessing ``failed_rows`` of such a result raises.
+
+        sample : float or int, optional
+            Run the column checks on a random sample of the aligned rows: a fraction
+            (float in ``(0, 1]``) or a number of rows (int). With ``align_date_col``
+            the sample is stratified by date. Failure rates are then estimates and
+            :meth:`CheckResult.outcome` shows a 95% confidence interval. The index
+            checks are always exact.
+
+        seed : int, optional
+            Seed for ``sample``, for reproducible samples.
+
+        profile : bool, default False
+            Time each phase of the run (date clipping, the index join and checks,
+            each column check and its alignment) and the summary. The timings are
+            in :attr:`RecResult.timings` and :attr:`CheckResult.elapsed`, and
+            :meth:`RecResult.write_trace` writes them as a Chrome trace.
+
+        profile_memory : bool, default False
+            Like ``profile``, and also record the peak memory of each phase, as
+            traced by ``tracemalloc``. This slows the run down noticeably.
+
+        progress : callable, optional
+            Called with a :class:`Progress` at the start of every phase and after
+            every column check (every shard with ``executor='process'``), e.g. to
+            show the rows done and an ETA. With ``time_budget`` or ``cancel`` the
+            rows are compared in slices, and it is also called at most every 0.1s
+            while a check compares them.
+
+        time_budget : float, optional
+            Seconds after which the column checks stop. The checks in progress are
+            truncated and the rest skipped, as with ``budget``, and the partial
+            result is returned. The index checks always run to completion. Like the
+            budgets, it needs ``executor='thread'`` (or ``n_jobs=1``).
+
+        cancel : CancelToken, optional
+            Token to stop the run from another thread or from ``progress``. Once it
+            is cancelled the column checks stop as with ``time_budget``.
+
         Returns
         -------
         RecResult
             The full list of check results (passing + failing). When
             ``raise_on_failure`` is ``True`` and failures occur this method raises an
-            exception.
+            exception. With a budget, a time budget or a cancellation,
+            :meth:`RecResult.incomplete` lists the checks that were truncated or
+            skipped and :attr:`RecResult.stop_reason` says why the run stopped.
+
+        Raises
+        ------
+        ValueError
+            If a budget, ``time_budget`` or ``cancel`` is given to a ``Rec`` that
+            runs its checks in processes, which cannot be stopped early.
+        """
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
+
+        if fail_fast:
+            if budget is not None:
+                raise ValueError("Pass either fail_fast or budget, not both.")
+            budget = FailureBudget(rows=0)
+
+        stops_early = budget is not None or check_budget is not None
+        stops_early = stops_early or time_budget is not None or cancel is not None
+
+        if stops_early and not self.stoppable:
+            raise ValueError(
+                "executor='process' cannot stop the column checks early; use "
+                "executor='thread' with budgets, time_budget or cancel."
+            )
+
+        control = None
+        if progress is not None or time_budget is not None or cancel is not None:
+            control = RunControl(progress, time_budget, cancel)
+
+        profiler = None
+        if profile or profile_memory:
+            profiler = Profiler(memory=profile_memory)
+            profiler.start()
+
+        try:
+            with span(profiler, "run", "run"):
+                results = self._run(
+                    baseline,
+                    candidate,
+                    budget,
+                    check_budget,
+                    mode,
+                    sample,
+                    seed,
+                    profiler,
+                    control,
+                )
+        finally:
+            if profiler is not None:
+                profiler.stop()
+
+        result = RecResult(
+            results=results,
+            baseline=baseline,  # Pass the original frames
+            candidate=candidate,
+            profiler=profiler,
+            stop_reason=control.stop_reason if control is not None else None,
+        )
+
+        if control is not None:
+            control.enter("done")
+
+        if raise_on_failure:
+            result.raise_for_failures()
+
+        return result
+
+    def _run(
+        self,
+        baseline: pd.DataFrame,
+        candidate: pd.DataFrame,
+        budget: FailureBudget | None,
+        check_budget: FailureBudget | None,
+        mode: Mode,
+        sample: float | int | None,
+        seed: int | None,
+        profiler: Profiler | None,
+        control: RunControl | None,
+    ) -> list[CheckResult]:
+        """
+        Clip, plan and reconcile two frames; the body of :meth:`run`.
         """
         # We're going to clip both DataFrames, so so we will work with a copy. Don't
         # copy here, just setup new references.
@@ -139,53 +913,164 @@ class Rec:
         _candidate = candidate
 
         if self.align_date_col is not None:
-            _baseline, _candidate = clip_to_last_common_date(
-                _baseline,
-                _candidate,
-                self.align_date_col,
+            if control is not None:
+                control.enter("clip_dates")
+
+            with span(profiler, "clip_dates"):
+                _baseline, _candidate = clip_to_last_common_date(
+                    _baseline,
+                    _candidate,
+                    self.align_date_col,
+                )
+
+        if control is not None:
+            control.enter("plan")
+
+        # Column resolution only depends on the schema, so it is compiled once
+        with span(profiler, "plan"):
+            plan = self._plan(_baseline, _candidate)
+
+        # Partial (sampled, budgeted or interruptible) runs are never cached
+        use_cache = self.cache_dir is not None and sample is None and budget is None
+        use_cache = use_cache and check_budget is None and control is None
+
+        if use_cache and not self._matched_within_dates(_baseline, _candidate):
+            logger.warning(
+                f"Not using the cache: {self.align_date_col!r} is not an index level "
+                "or key, so rows are not matched within their partition"
             )
+            use_cache = False
 
-        results: list[CheckResult] = []
+        if use_cache:
+            return self._reconcile_cached(_baseline, _candidate, plan, mode, profiler)
 
-        if self.check_missing_indices:
-            results.append(index_check(_baseline, _candidate, "missing"))
+        return self._reconcile(
+            _baseline,
+            _candidate,
+            plan,
+            budget,
+            check_budget,
+            mode,
+            sample,
+            seed,
+            profiler,
+            control,
+        )
 
-        if self.check_extra_indices:
-            results.append(index_check(_baseline, _candidate, "extra"))
+    def run_chunks(
+        self,
+        baseline: Iterable[pd.DataFrame],
+        candidate: Iterable[pd.DataFrame],
+        raise_on_failure: bool = False,
+    ) -> RecResult:
+        """
+        Execute all configured checks over two streams of sorted chunks.
 
-        # Make sure the indices match
-        index = _baseline.index.intersection(_candidate.index)
-        _baseline = _baseline.loc[index]
-        _candidate = _candidate.loc[index]
+        The streams are merge-joined on their index into windows covering the same
+        label range, and each window is reconciled on its own. Only about one chunk
+        per side, plus the failing rows found so far, is held in memory.
 
-        checked_columns: set[str] = set()
+        Parameters
+        ----------
+        baseline : Iterable[pandas.DataFrame]
+            Baseline chunks. The index must be unique and sorted in ascending order
+            across all chunks.
 
-        for column, check in self.columns.items():
-            # We might not want to check this column
-            if check is None:
-                checked_columns.add(column)
-                continue
+        candidate : Iterable[pandas.DataFrame]
+            Candidate chunks, sorted the same way.
+
+        raise_on_failure : bool, default False
+            If ``True`` raise :class:`RecFailedException` when any check fails.
+
+        Returns
+        -------
+        RecResult
+            One result per check with row and failure counts over all chunks. The
+            result does not hold the frames; ``baseline`` and ``candidate`` are
+            ``None``.
 
-            new_results = check.run(_baseline, _candidate, column)
+        Raises
+        ------
+        ValueError
+            If ``align_date_col`` is set (the last common date is not known until
+            both streams are consumed), if ``keys`` is set, or if the chunks are
+            not sorted.
+        """
+        if self.align_date_col is not None:
+            raise ValueError(
+                "align_date_col is not supported by run_chunks; "
+                "clip the chunks before passing them in."
+            )
+
+        if self.keys is not None:
+            raise ValueError(
+                "keys are not supported by run_chunks; "
+                "index the chunks by their keys instead."
+            )
 
-            for result in new_results:
-                if result.column is not None:
-                    checked_columns.add(result.column)
+        # Per check: the first result, later results with failures and the row
+        # counts and sketches of later passing results
+        kept: list[list[CheckResult]] = []
+        extra_rows: list[int] = []
+        extra_sketches: list[dict[str, ErrorSketch]] = []
+        orders: list[Callable[[pd.DataFrame], pd.DataFrame] | None] = []
+        b_rows = c_rows = 0
+        b_cols = c_cols = 0
 
-            results += new_results
+        windows = merge_windows(baseline, candidate)
 
-        # Default checks
-        if self.check_all:
-            # Only check the columns we haven't provided checks for
-            columns = [c for c in _baseline.columns if c not in checked_columns]
+        for b_window, c_window in windows:
+            plan = self._plan(b_window, c_window)
+            tasks = plan.tasks
+            results = self._reconcile(b_window, c_window, plan)
 
-            for col in columns:
-                results += EqualCheck().run(_baseline, _candidate, col)
+            if not kept:
+                n_index = len(results) - len(tasks)
+                orders = [None] * n_index + [c.order_failures for c, _ in tasks]
+                kept = [[r] for r in results]
+                extra_rows = [0] * len(results)
+                extra_sketches = [{} for _ in results]
+            elif len(results) != len(kept):
+                raise ValueError("All chunks must have the same columns.")
+            else:
+                for i, r in enumerate(results):
+                    if r.failed_count > 0:
+                        kept[i].append(r)
+                    else:
+                        extra_rows[i] += r.total_rows
+                        extra_sketches[i] = merge_sketches(
+                            [extra_sketches[i], r.sketches]
+                        )
+
+            # Build the failing rows now so that the window can be released
+            for r in results:
+                r.failed_rows  # noqa: B018
+
+            b_rows += len(b_window)
+            c_rows += len(c_window)
+            b_cols = len(b_window.columns)
+            c_cols = len(c_window.columns)
+
+        if not kept:
+            # Neither stream yielded a single chunk, so their columns are unknown
+            return self.run(pd.DataFrame(), pd.DataFrame(), raise_on_failure)
+
+        merged: list[CheckResult] = []
+
+        for parts, order, rows, sketches in zip(
+            kept, orders, extra_rows, extra_sketches, strict=True
+        ):
+            result = CheckResult.merge(parts, order=order)
+            result.total_rows += rows
+            result.sketches = merge_sketches([result.sketches, sketches])
+            merged.append(result)
 
         result = RecResult(
-            results=results,
-            baseline=baseline,  # Pass the original frames
-            candidate=candidate,
+            results=merged,
+            baseline=None,
+            candidate=None,
+            baseline_shape=(b_rows, b_cols),
+            candidate_shape=(c_rows, c_cols),
         )
 
         if raise_on_failure:
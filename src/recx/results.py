@@ -1,11 +1,23 @@
 import logging
+import os
+from collections.abc import Callable
+from typing import Literal
 
 import pandas as pd
 
 from recx.exceptions import RecFailedException
+from recx.profile import Profiler, span
+from recx.progress import StopReason
+from recx.sampling import wilson_interval
+from recx.sketch import ErrorSketch, merge_sketches, sketch_stats
 
 logger = logging.getLogger(__name__)
 
+Status = Literal["complete", "truncated", "skipped"]
+
+# How the summary names each reason a run stopped early
+STOP_REASONS = {"time_budget": "the time budget", "cancelled": "cancellation"}
+
 
 def df2str(
     df: pd.DataFrame,
@@ -28,9 +40,12 @@ class CheckResult:
     Parameters
     ----------
 
-    failed_rows : pandas.DataFrame
+    failed_rows : pandas.DataFrame, callable or None
         Subset of rows (and associated columns) that *failed* the check. A zero-length
-        frame indicates success.
+        frame indicates success. May also be a zero-argument callable returning the
+        frame, in which case it is only built the first time :attr:`failed_rows` is
+        accessed and ``failed_count`` must be given. ``None`` if the failing rows
+        were not kept (count-only runs); ``failed_count`` must then be given.
 
     check_name : str
         Name of the check (usually the class name of the checker).
@@ -46,29 +61,219 @@ class CheckResult:
 
     min_dots : int, default 5
         Minimum number of dots when formatting one-line summaries.
+
+    disp_rows : int, default 20
+        Maximum number of failing rows shown by :meth:`failures_str`.
+
+    failed_count : int, optional
+        Number of failing rows. Defaults to ``len(failed_rows)`` when a frame is
+        given.
+
+    status : {'complete', 'truncated', 'skipped'}, default 'complete'
+        ``'truncated'`` if the check stopped early because a failure budget was
+        exceeded, so only the first ``total_rows`` rows were evaluated.
+        ``'skipped'`` if the check never ran. A skipped check does not pass.
+
+    stats : dict[str, float], optional
+        Summary statistics of a count-only run, e.g. ``null_mismatches``,
+        ``max_abs_error`` and ``mean_abs_error``.
+
+    population : int, optional
+        Number of rows the evaluated rows were sampled from. When given, the
+        ``total_rows`` rows are a random sample and the outcome reports an estimated
+        failure rate with a confidence interval.
+
+    sketches : dict[str, ErrorSketch], optional
+        Distribution of each numeric diagnostic (e.g. ``abs_error``) over all
+        evaluated rows, passing or failing.
+
+    elapsed : float, optional
+        Seconds spent evaluating the check, when the run was profiled. Checks
+        evaluated together as a block share its time evenly; checks passed by the
+        prefilter or skipped by a failure budget took none.
     """
 
     def __init__(
         self,
-        failed_rows: pd.DataFrame,
+        failed_rows: pd.DataFrame | Callable[[], pd.DataFrame] | None,
         check_name: str,
         total_rows: int,
         column: str | None = None,
         check_args: dict | None = None,
         min_dots: int = 5,
         disp_rows: int = 20,
+        failed_count: int | None = None,
+        status: Status = "complete",
+        stats: dict[str, float] | None = None,
+        population: int | None = None,
+        sketches: dict[str, ErrorSketch] | None = None,
+        elapsed: float | None = None,
     ):
-        self.failed_rows = failed_rows
+        if isinstance(failed_rows, pd.DataFrame):
+            self._failed_rows = failed_rows
+            self._build_failed_rows = None
+            if failed_count is None:
+                failed_count = len(failed_rows)
+        else:
+            if failed_count is None:
+                raise ValueError(
+                    "failed_count is required when failed_rows is lazy or None"
+                )
+            self._failed_rows = None
+            self._build_failed_rows = failed_rows
+
+        self.failed_count = failed_count
         self.column = column
         self.check_name = check_name
         self.check_args = check_args or dict()
         self.min_dots = min_dots
         self.total_rows = total_rows
         self.disp_rows = disp_rows
+        self.status: Status = status
+        self.stats = stats
+        self.population = population
+        self.sketches = dict(sketches or {})
+        self.elapsed = elapsed
+
+    @classmethod
+    def merge(
+        cls,
+        results: list["CheckResult"],
+        order: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    ) -> "CheckResult":
+        """
+        Combine results of the same check run over disjoint sets of rows.
+
+        Parameters
+        ----------
+        results : list[CheckResult]
+            Partial results, e.g. one per chunk. All must share the check name,
+            column and arguments.
+
+        order : callable, optional
+            Applied to the concatenated failing rows (e.g. to re-sort them).
+
+        Returns
+        -------
+        CheckResult
+            Result with summed row and failure counts and merged sketches. The
+            failing rows of all parts are concatenated when first accessed.
+        """
+        first = results[0]
+
+        for other in results[1:]:
+            if (other.check_name, other.column) != (first.check_name, first.column):
+                raise ValueError("Can only merge results of the same check.")
+
+        # Any part that did not run to completion leaves the whole partial
+        statuses = {r.status for r in results}
+        status: Status = "complete"
+        if statuses == {"skipped"}:
+            status = "skipped"
+        elif statuses != {"complete"}:
+            status = "truncated"
+
+        populations = [r.population for r in results]
+        population = None
+        if all(p is not None for p in populations):
+            population = sum(p for p in populations if p is not None)
+
+        sketches = merge_sketches(r.sketches for r in results)
+
+        stats = None
+        if all(r.stats is not None for r in results):
+            nulls = sum((r.stats or {}).get("null_mismatches", 0) for r in results)
+            stats = {"null_mismatches": nulls, **sketch_stats(sketches)}
+
+        # Parts that were not timed (e.g. reused from a cache) took no time
+        elapsed = None
+        if any(r.elapsed is not None for r in results):
+            elapsed = sum(r.elapsed for r in results if r.elapsed is not None)
+
+        def failed_rows() -> pd.DataFrame:
+            parts = [r.failed_rows for r in results]
+            frame = pd.concat(parts) if len(parts) > 1 else parts[0]
+            return order(frame) if order is not None else frame
+
+        return cls(
+            failed_rows=failed_rows,
+            failed_count=sum(r.failed_count for r in results),
+            check_name=first.check_name,
+            total_rows=sum(r.total_rows for r in results),
+            column=first.column,
+            check_args=first.check_args,
+            min_dots=first.min_dots,
+            disp_rows=first.disp_rows,
+            status=status,
+            stats=stats,
+            population=population,
+            sketches=sketches,
+            elapsed=elapsed,
+        )
+
+    @property
+    def has_failed_rows(self) -> bool:
+        """``False`` if the failing rows were not kept (count-only runs)."""
+        return self._failed_rows is not None or self._build_failed_rows is not None
+
+    @property
+    def failed_rows(self) -> pd.DataFrame:
+        """
+        Frame of failing rows, built on first access if it was deferred.
+
+        Raises
+        ------
+        ValueError
+            If the failing rows were not kept, e.g. with ``Rec.run(mode="counts")``.
+        """
+        if not self.has_failed_rows:
+            raise ValueError(
+                "Failing rows were not kept for this result; "
+                "run with mode='rows' to get them."
+            )
+
+        if self._failed_rows is None:
+            assert self._build_failed_rows is not None
+            self._failed_rows = self._build_failed_rows()
+            self._build_failed_rows = None
+
+        return self._failed_rows
 
     @property
     def passed(self) -> bool:
-        return len(self.failed_rows) == 0
+        """
+        ``True`` if the check compared all its rows and none failed. Checks stopped
+        early (truncated or skipped) never pass, since their remaining rows are
+        unknown.
+        """
+        return self.failed_count == 0 and self.status == "complete"
+
+    @property
+    def sampled(self) -> bool:
+        """``True`` if the check ran on a random sample of the rows."""
+        return self.population is not None
+
+    def confidence_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """
+        Confidence interval of the failure rate (Wilson score interval).
+
+        Exact (both bounds equal the observed rate) unless the check was sampled.
+
+        Parameters
+        ----------
+        z : float, default 1.96
+            Standard normal quantile; 1.96 gives a 95% interval.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bound of the failure rate.
+        """
+        if not self.sampled:
+            rate = self.failed_count / self.total_rows if self.total_rows else 0.0
+            return rate, rate
+
+        return wilson_interval(self.failed_count, self.total_rows, z)
 
     def signature(self) -> str:
         if self.check_args:
@@ -93,15 +298,35 @@ class CheckResult:
         Return formatted outcome string.
 
         ``"PASSED"`` if there are no failing rows, otherwise a summary of the form
-        ``"[<count>/<total> (<pct>%)] FAILED"``.
+        ``"[<count>/<total> (<pct>%)] FAILED"``. Checks that were stopped early are
+        marked ``TRUNCATED``, whether or not they found failures, and checks that
+        never ran ``SKIPPED``. For sampled checks the percentage is an estimate
+        followed by its 95% interval.
         """
-        if self.passed:
-            return "PASSED ꪜ"
+        if self.status == "skipped":
+            return "SKIPPED ⏭"
 
-        count = len(self.failed_rows)
+        count = self.failed_count
         total = self.total_rows
         pct = (count / total) if total > 0 else 0
-        return f"[{count:,.0f}/{total:,.0f} ({pct:.2%})] FAILED ❌"
+
+        if self.status == "truncated" and count == 0:
+            return f"[0/{total:,.0f} compared] TRUNCATED ⏸"
+
+        if self.sampled:
+            low, high = self.confidence_interval()
+            sample = f"{count:,.0f}/{total:,.0f} sampled of {self.population:,.0f}"
+
+            if self.passed:
+                return f"PASSED ꪜ [{sample}, est. <= {high:.2%}]"
+
+            estimate = f"est. {pct:.2%}, CI {low:.2%}-{high:.2%}"
+            return f"[{sample} ({estimate})] FAILED ❌"
+
+        if self.passed:
+            return "PASSED ꪜ"
+        truncated = " TRUNCATED" if self.status == "truncated" else ""
+        return f"[{count:,.0f}/{total:,.0f} ({pct:.2%})] FAILED{truncated} ❌"
 
     def one_liner(self, width: int | None = None) -> str:
         """
@@ -150,10 +375,26 @@ class CheckResult:
         line = self.one_liner(width=width)
         logger.info(line)
 
+    def stats_str(self) -> str:
+        """
+        Return the statistics as ``"name=value"`` pairs.
+        """
+        return ", ".join(f"{k}={v:,.6g}" for k, v in (self.stats or {}).items())
+
+    def sketches_str(self) -> str:
+        """
+        Return one ``"<diagnostic>: n=... mean=... p50=... max=..."`` line per sketch.
+        """
+        return "\n".join(f"{name}: {sketch}" for name, sketch in self.sketches.items())
+
     def failures_str(self) -> str:
+        title = self.mini_signature()
+
+        if not self.has_failed_rows:
+            return f"{title}:\n │   Failing rows not kept ({self.stats_str()})\n"
+
         # These are the rows we want to display to the user.
         disp = df2str(self.failed_rows, max_rows=self.disp_rows)
-        title = self.mini_signature()
         subtitle = f"Showing up to {self.disp_rows} rows"
 
         # First create the message without the title (wrapper)
@@ -178,18 +419,48 @@ class RecResult:
     ----------
     results : list[CheckResult]
         All individual check results (passing and failing) in execution order.
+
+    baseline, candidate : pandas.DataFrame, optional
+        The reconciled frames. May be ``None`` when the frames were never held in
+        memory (see :meth:`Rec.run_chunks`), in which case pass their shapes.
+
+    baseline_shape, candidate_shape : tuple[int, int], optional
+        ``(rows, columns)`` of each frame. Defaults to the frames' shapes.
+
+    profiler : Profiler, optional
+        Timings of the run, when it was profiled (see ``Rec.run(profile=True)``).
+
+    stop_reason : {'time_budget', 'cancelled'}, optional
+        Why the run stopped before finishing its column checks, if it did.
     """
 
     def __init__(
         self,
         results: list[CheckResult],
-        baseline: pd.DataFrame,
-        candidate: pd.DataFrame,
+        baseline: pd.DataFrame | None,
+        candidate: pd.DataFrame | None,
+        baseline_shape: tuple[int, int] | None = None,
+        candidate_shape: tuple[int, int] | None = None,
+        profiler: Profiler | None = None,
+        stop_reason: StopReason | None = None,
     ):
         self.results = results
+        self.profiler = profiler
+        self.stop_reason = stop_reason
         self.baseline = baseline
         self.candidate = candidate
 
+        if baseline_shape is None:
+            assert baseline is not None, "baseline or baseline_shape is required"
+            baseline_shape = baseline.shape
+
+        if candidate_shape is None:
+            assert candidate is not None, "candidate or candidate_shape is required"
+            candidate_shape = candidate.shape
+
+        self.baseline_shape = baseline_shape
+        self.candidate_shape = candidate_shape
+
     def __getitem__(self, i):
         return self.results[i]
 
@@ -202,6 +473,35 @@ class RecResult:
     def failures(self) -> list[CheckResult]:
         return [r for r in self.results if not r.passed]
 
+    def incomplete(self) -> list[CheckResult]:
+        """
+        Return the checks that were truncated or skipped by a failure budget.
+        """
+        return [r for r in self.results if r.status != "complete"]
+
+    @property
+    def timings(self) -> pd.DataFrame:
+        """
+        Time (and peak memory) of every phase and check of a profiled run.
+
+        One row per span, in the order they started; see
+        :meth:`Profiler.timings`. Calling :meth:`summary` adds a ``summary`` span.
+        """
+        if self.profiler is None:
+            raise ValueError("No timings: run with profile=True to record them.")
+
+        return self.profiler.timings()
+
+    def write_trace(self, path: str | os.PathLike) -> None:
+        """
+        Write the timings of a profiled run to ``path`` as a Chrome trace (JSON),
+        which ``chrome://tracing`` and Perfetto open.
+        """
+        if self.profiler is None:
+            raise ValueError("No timings: run with profile=True to record them.")
+
+        self.profiler.write_trace(path)
+
     def raise_for_failures(self):
         errors = self.failures()
         if errors:
@@ -213,6 +513,10 @@ class RecResult:
         """
         Print a summary.
         """
+        with span(self.profiler, "summary"):
+            self._print_summary(log)
+
+    def _print_summary(self, log: bool) -> None:
         if log:
             print_info = logger.info
             print_error = logger.error
@@ -228,11 +532,11 @@ class RecResult:
         print_info("─" * width)
 
         # Easier reference
-        b = self.baseline
-        c = self.candidate
+        b_rows, b_cols = self.baseline_shape
+        c_rows, c_cols = self.candidate_shape
 
-        print_info(f"Baseline: rows={len(b):,} cols={len(b.columns):,}")
-        print_info(f"Candidate: rows={len(c):,} cols={len(c.columns):,}")
+        print_info(f"Baseline: rows={b_rows:,} cols={b_cols:,}")
+        print_info(f"Candidate: rows={c_rows:,} cols={c_cols:,}")
 
         print_info("")
 
@@ -240,12 +544,40 @@ class RecResult:
         if len(failures) > 0:
             print_error(f"{len(failures)} check(s) FAILED ❌")
 
+        sampled = [r for r in self.results if r.sampled]
+        if len(sampled) > 0:
+            print_info(
+                f"{len(sampled)} check(s) ran on a random sample; "
+                "failure rates are estimates with 95% intervals"
+            )
+
+        incomplete = self.incomplete()
+        if len(incomplete) > 0:
+            reason = STOP_REASONS.get(self.stop_reason or "", "a failure budget")
+            print_error(
+                f"{len(incomplete)} check(s) stopped early by {reason}; "
+                "counts are partial"
+            )
+
         for result in self.results:
             print_info(result.one_liner(width=width))
 
+        with_stats = [r for r in self.results if r.stats or r.sketches]
+        if len(with_stats) > 0:
+            print_info("\nStatistics:\n")
+
+            for result in with_stats:
+                if result.stats:
+                    print_info(f"{result.mini_signature()}: {result.stats_str()}")
+                else:
+                    print_info(f"{result.mini_signature()}:")
+
+                for line in result.sketches_str().splitlines():
+                    print_info(f" │   {line}")
+
         if len(failures) > 0:
             print_info("\nFailing rows:\n")
 
             for result in self.results:
-                if not result.passed:
+                if result.failed_count > 0:
                     print_info(result.failures_str())
@@ -0,0 +1,114 @@
+"""
+Row sampling and confidence bounds for approximate reconciliation.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+
+def sample_positions(
+    n_rows: int,
+    sample: float | int,
+    seed: int | None = None,
+    strata: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Draw a random subset of ``range(n_rows)`` without replacement.
+
+    Parameters
+    ----------
+    n_rows : int
+        Number of rows to sample from.
+
+    sample : float or int
+        Fraction of rows (a float in ``(0, 1]``) or number of rows (an int) to draw.
+
+    seed : int, optional
+        Seed for the random generator, for reproducible samples.
+
+    strata : numpy.ndarray, optional
+        One value per row (e.g. the date). Rows are sampled separately within each
+        stratum, in proportion to its size. The fractional row of each stratum is
+        drawn at random, so every row is sampled with the same probability and the
+        sample can be analysed as a simple random one. Strata smaller than
+        ``1 / fraction`` rows may get no row at all.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sampled positions in ascending order.
+    """
+    if isinstance(sample, bool) or sample <= 0:
+        raise ValueError(f"sample must be a positive fraction or count, got {sample}")
+
+    if isinstance(sample, float):
+        if sample > 1:
+            raise ValueError(f"A sample fraction must be at most 1, got {sample}")
+        fraction = sample
+    else:
+        fraction = sample / n_rows if n_rows else 1.0
+
+    if fraction >= 1:
+        return np.arange(n_rows)
+
+    rng = np.random.default_rng(seed)
+    keys = rng.random(n_rows)
+
+    if strata is None:
+        size = round(fraction * n_rows)
+        chosen = np.argpartition(keys, min(size, n_rows - 1))[:size]
+        return np.sort(chosen)
+
+    codes, _ = pd.factorize(strata, use_na_sentinel=False)
+    sizes = np.bincount(codes)
+
+    # Round each stratum up with a probability equal to its fractional row. A fixed
+    # rounding (or a minimum of one row) would over-represent small strata, and the
+    # failure rate estimated from the sample would be biased towards them.
+    expected = fraction * sizes
+    take = np.floor(expected) + (rng.random(len(sizes)) < expected % 1)
+
+    # Sort by stratum, randomly within each, and keep the first rows of each
+    order = np.lexsort((keys, codes))
+    starts = np.cumsum(sizes) - sizes
+    rank = np.arange(n_rows) - np.repeat(starts, sizes)
+    chosen = order[rank < np.repeat(take, sizes)]
+
+    return np.sort(chosen)
+
+
+def wilson_interval(
+    failed: int,
+    total: int,
+    z: float = 1.96,
+) -> tuple[float, float]:
+    """
+    Wilson score interval for a failure rate observed in a sample.
+
+    Parameters
+    ----------
+    failed : int
+        Number of failing rows in the sample.
+
+    total : int
+        Number of sampled rows.
+
+    z : float, default 1.96
+        Standard normal quantile; 1.96 gives a 95% interval.
+
+    Returns
+    -------
+    tuple[float, float]
+        Lower and upper bound of the failure rate.
+    """
+    if total == 0:
+        return 0.0, 1.0
+
+    p = failed / total
+    denom = 1 + z**2 / total
+    centre = (p + z**2 / (2 * total)) / denom
+    half = z * math.sqrt(p * (1 - p) / total + z**2 / (4 * total**2)) / denom
+
+    return max(0.0, centre - half), min(1.0, centre + half)
@@ -0,0 +1,347 @@
+"""
+Row-sharded reconciliation on a process pool.
+
+Aligned rows are hash-partitioned by index label into shards and each shard's column
+checks run in a separate worker process, so even checks that hold the GIL scale
+across cores. NumPy-backed columns are placed in shared memory once and every worker
+takes its rows straight from there; other columns (object, extension dtypes) are
+pickled per shard. Workers send back only failing positions and diagnostics, which
+are merged into one result per check.
+"""
+
+from collections.abc import Hashable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from recx.align import Alignment
+from recx.engine import (
+    ArrayLike,
+    ColumnOutcome,
+    Mode,
+    _column,
+    concat_arrays,
+    evaluate_tasks,
+    merge_counts,
+    to_result,
+)
+from recx.profile import Profiler, span
+from recx.progress import RunControl
+from recx.results import CheckResult
+from recx.sketch import merge_sketches
+
+if TYPE_CHECKING:
+    from recx.checks import ColumnCheck
+    from recx.prefilter import RowFilter
+
+
+def shard_positions(index: pd.Index, n_shards: int) -> list[np.ndarray]:
+    """
+    Hash-partition the positions of ``index`` into ``n_shards`` groups.
+
+    Equal labels always land in the same shard. Positions within each shard are in
+    ascending order.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        Labels to partition.
+
+    n_shards : int
+        Number of shards.
+
+    Returns
+    -------
+    list[numpy.ndarray]
+        Positions of the rows in each shard.
+    """
+    hashes = pd.util.hash_pandas_object(index, index=False).to_numpy()  # type: ignore
+    shard = (hashes % np.uint64(n_shards)).astype(np.intp)
+    order = np.argsort(shard, kind="stable")
+    counts = np.bincount(shard, minlength=n_shards)
+    return np.split(order, np.cumsum(counts)[:-1])
+
+
+class SharedArray:
+    """
+    Picklable handle to a NumPy array stored in shared memory.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block.
+
+    shape : tuple[int, ...]
+        Shape of the array.
+
+    dtype : str
+        NumPy dtype string of the array.
+    """
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    @classmethod
+    def create(cls, values: np.ndarray) -> tuple[SharedMemory, "SharedArray"]:
+        """Copy ``values`` into a new shared memory block."""
+        shm = SharedMemory(create=True, size=max(1, values.nbytes))
+        array = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)
+        array[...] = values
+        return shm, cls(shm.name, values.shape, values.dtype.str)
+
+    def attach(self) -> tuple[SharedMemory, np.ndarray]:
+        """Map the shared block; close the returned handle when done."""
+        shm = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf)
+        return shm, array
+
+
+def _shareable(series: pd.Series) -> bool:
+    dtype = series.dtype
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+
+
+def _shard_frame(
+    sources: dict[str, SharedArray | ArrayLike],
+    rows: np.ndarray,
+    handles: list[SharedMemory],
+) -> pd.DataFrame:
+    data = {}
+
+    for column, source in sources.items():
+        if isinstance(source, SharedArray):
+            shm, array = source.attach()
+            handles.append(shm)
+            data[column] = array.take(rows)
+        else:
+            data[column] = source
+
+    return pd.DataFrame(data, index=pd.RangeIndex(len(rows)))
+
+
+def _evaluate_shard(payload) -> tuple[list[ColumnOutcome], list[float | None]]:
+    tasks, b_sources, c_sources, b_rows, c_rows, mode, row_filter, keys = payload[:8]
+    profiler = Profiler() if payload[8] else None
+    handles: list[SharedMemory] = []
+
+    try:
+        b = _shard_frame(b_sources, b_rows, handles)
+        c = _shard_frame(c_sources, c_rows, handles)
+        outcomes = evaluate_tasks(
+            b,
+            c,
+            tasks,
+            mode=mode,
+            row_filter=row_filter,
+            block_keys=keys,
+            profiler=profiler,
+        )
+    finally:
+        for shm in handles:
+            shm.close()
+
+    # Spans stay in the worker; only the time per task is sent back
+    seconds = [
+        profiler.seconds(check, column) if profiler else None for check, column in tasks
+    ]
+    return outcomes, seconds
+
+
+def _merge_outcomes(
+    parts: list[tuple[np.ndarray, ColumnOutcome]],
+    alignment: Alignment,
+) -> ColumnOutcome:
+    total_rows = sum(o.total_rows for _, o in parts)
+
+    if parts[0][1].counts_only:
+        return merge_counts([o for _, o in parts])
+
+    if all(o.positions is not None for _, o in parts):
+        positions = np.concatenate(
+            [rows[o.positions] for rows, o in parts if o.positions is not None]
+        )
+        order = np.argsort(positions, kind="stable")
+
+        diagnostics = {
+            name: concat_arrays([o.diagnostics[name] for _, o in parts])[order]
+            for name in parts[0][1].diagnostics
+        }
+
+        return ColumnOutcome(
+            total_rows,
+            positions[order],
+            diagnostics,
+            count=sum(o.failed_count for _, o in parts),
+            sketches=merge_sketches(o.sketches for _, o in parts),
+        )
+
+    frames = []
+    positions = []
+
+    for rows, outcome in parts:
+        assert outcome.failed_rows is not None
+        # Shard frames are labelled with shard-local positions
+        frame = outcome.failed_rows
+        global_positions = rows[frame.index.to_numpy(dtype=np.intp)]
+        frames.append(frame.set_axis(alignment.index[global_positions]))
+        positions.append(global_positions)
+
+    order = np.argsort(np.concatenate(positions), kind="stable")
+    failed_rows = pd.concat(frames).iloc[order]
+
+    return ColumnOutcome(total_rows, failed_rows=failed_rows)
+
+
+def run_sharded(
+    baseline: pd.DataFrame,
+    candidate: pd.DataFrame,
+    tasks: Sequence[tuple["ColumnCheck", str]],
+    alignment: Alignment,
+    n_jobs: int,
+    mode: Mode = "rows",
+    row_filter: "RowFilter | None" = None,
+    block_keys: Sequence[Hashable | None] | None = None,
+    profiler: Profiler | None = None,
+    control: RunControl | None = None,
+) -> list[CheckResult]:
+    """
+    Run ``(check, column)`` tasks on hash-partitioned row shards in processes.
+
+    Checks must be picklable (e.g. defined at module level). Results match
+    :func:`recx.engine.run_column_checks`, including the order of failing rows.
+
+    Parameters
+    ----------
+    baseline : pandas.DataFrame
+        Baseline frame.
+
+    candidate : pandas.DataFrame
+        Candidate frame.
+
+    tasks : list[tuple[ColumnCheck, str]]
+        Checks paired with the concrete column they apply to.
+
+    alignment : Alignment
+        Rows of each frame to compare.
+
+    n_jobs : int
+        Number of shards and worker processes.
+
+    mode : {'rows', 'counts'}, default 'rows'
+        See :func:`recx.engine.run_column_checks`.
+
+    row_filter : RowFilter, optional
+        See :func:`recx.engine.run_column_checks`.
+
+    block_keys : list, optional
+        See :func:`recx.engine.run_column_checks`.
+
+    profiler : Profiler, optional
+        Records spans of the sharding, the workers and the merge. The time of each
+        task is its time summed over the workers.
+
+    control : RunControl, optional
+        Progress is reported to it whenever a shard is done. The checks are never
+        stopped early.
+
+    Returns
+    -------
+    list[CheckResult]
+        One result per task, in the same order as ``tasks``.
+    """
+    tasks = list(tasks)
+    shards = shard_positions(alignment.index, n_jobs)
+    columns = list(dict.fromkeys(column for _, column in tasks))
+
+    shared: list[SharedMemory] = []
+
+    def share(series: pd.Series) -> SharedArray | ArrayLike:
+        if not _shareable(series):
+            return series.array
+
+        shm, handle = SharedArray.create(series.to_numpy())
+        shared.append(shm)
+        return handle
+
+    def sources_for(sources: dict, rows: np.ndarray) -> dict:
+        # Shared columns are taken by the worker; the rest is taken here and pickled
+        return {
+            column: source if isinstance(source, SharedArray) else source.take(rows)
+            for column, source in sources.items()
+        }
+
+    try:
+        with span(profiler, "share"):
+            b_sources = {col: share(_column(baseline, col)) for col in columns}
+            c_sources = {col: share(_column(candidate, col)) for col in columns}
+
+            payloads = []
+
+            for rows in shards:
+                b_rows = alignment.baseline_positions(rows)
+                c_rows = alignment.candidate_positions(rows)
+
+                payloads.append(
+                    (
+                        tasks,
+                        sources_for(b_sources, b_rows),
+                        sources_for(c_sources, c_rows),
+                        b_rows,
+                        c_rows,
+                        mode,
+                        row_filter.take_rows(rows) if row_filter else None,
+                        block_keys,
+                        profiler is not None,
+                    )
+                )
+
+        with (
+            span(profiler, "shards", shards=len(shards)),
+            ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=get_context("spawn"),
+            ) as pool,
+        ):
+            shard_outcomes = []
+
+            if control is not None:
+                control.plan_columns(len(alignment), len(tasks))
+
+            for rows, outcome in zip(
+                shards, pool.map(_evaluate_shard, payloads), strict=True
+            ):
+                shard_outcomes.append(outcome)
+
+                if control is not None:
+                    control.advance(len(rows) * len(tasks))
+    finally:
+        for shm in shared:
+            shm.close()
+            shm.unlink()
+
+    if control is not None:
+        control.finish_columns(len(tasks))
+
+    results: list[CheckResult] = []
+
+    with span(profiler, "merge"):
+        for t, (check, column) in enumerate(tasks):
+            parts = [
+                (rows, outcomes[t])
+                for rows, (outcomes, _) in zip(shards, shard_outcomes, strict=True)
+            ]
+            outcome = _merge_outcomes(parts, alignment)
+            result = to_result(baseline, candidate, alignment, check, column, outcome)
+            results.append(result)
+
+            if profiler is not None:
+                seconds = [s[t] or 0.0 for _, s in shard_outcomes]
+                profiler.add_seconds(check, column, sum(seconds))
+
+    return results
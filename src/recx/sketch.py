@@ -0,0 +1,320 @@
+"""
+Mergeable sketches of error distributions.
+
+An :class:`ErrorSketch` summarises the values of a diagnostic (e.g. ``abs_error``)
+over every compared row: the count, sum, min and max exactly, and quantiles to a
+relative accuracy. Values are counted in bins whose width grows with their magnitude,
+so memory is bounded by the number of bins rather than the number of rows, and two
+sketches of disjoint rows merge into the sketch of their union. That is what lets the
+results of chunks, slices, shards and cached partitions be combined.
+"""
+
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+
+# Values added to a sketch per pass, so that temporaries stay small
+SKETCH_CHUNK = 2**16
+
+# Bits of a float64 below the exponent
+_MANTISSA_BITS = 52
+
+
+def _empty_bins() -> tuple[np.ndarray, np.ndarray]:
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+def _merge_bins(
+    keys: np.ndarray,
+    counts: np.ndarray,
+    max_bins: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sum the counts of equal keys, collapsing the lowest keys beyond ``max_bins``.
+    """
+    keys, inverse = np.unique(keys, return_inverse=True)
+    counts = np.bincount(inverse, weights=counts, minlength=len(keys))
+    counts = counts.astype(np.int64)
+
+    if len(keys) > max_bins:
+        # The smallest magnitudes lose accuracy first; they matter least for errors
+        excess = len(keys) - max_bins + 1
+        counts = np.concatenate([[counts[:excess].sum()], counts[excess:]])
+        keys = keys[excess - 1 :]
+
+    return keys, counts
+
+
+class ErrorSketch:
+    """
+    Summary of a distribution of values in bounded memory.
+
+    Count, sum, min and max are exact. Quantiles are approximate: the value returned
+    is within ``2 ** -(precision + 1)`` (under 1% by default) of the true value at
+    the same rank. Missing values are ignored.
+
+    Values are binned on the exponent and the leading ``precision`` bits of the
+    mantissa of their magnitude, which only takes integer operations.
+
+    Parameters
+    ----------
+    precision : int, default 6
+        Mantissa bits kept per bin, between 0 and 52. Each extra bit halves the
+        error of the quantiles and doubles the number of bins.
+
+    max_bins : int, default 4096
+        Maximum number of bins kept for each sign. With the default precision that
+        spans 64 powers of two; beyond that the smallest magnitudes are merged into
+        one bin.
+
+    Examples
+    --------
+    >>> sketch = ErrorSketch.from_values([0.0, 1.0, 2.0, 3.0, 100.0])
+    >>> sketch.count, sketch.mean, sketch.max
+    (5, 21.2, 100.0)
+    >>> round(sketch.quantile(0.5), 1)
+    2.0
+    """
+
+    def __init__(self, precision: int = 6, max_bins: int = 4096):
+        if not 0 <= precision <= _MANTISSA_BITS:
+            raise ValueError(f"precision must be between 0 and 52, got {precision}")
+
+        self.precision = precision
+        self.max_bins = max_bins
+
+        self.count = 0
+        self.sum = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+        # Keys and counts of the bins of positive values (and zeros), and of the
+        # magnitudes of negative values
+        self.positive = _empty_bins()
+        self.negative = _empty_bins()
+
+    @classmethod
+    def from_values(cls, values, **kwargs) -> "ErrorSketch":
+        """Return a sketch of ``values``; ``kwargs`` go to the constructor."""
+        sketch = cls(**kwargs)
+        sketch.add(values)
+        return sketch
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values, NaN if there are none."""
+        return self.sum / self.count if self.count else np.nan
+
+    @property
+    def _shift(self) -> int:
+        return _MANTISSA_BITS - self.precision
+
+    def _values(self, keys: np.ndarray) -> np.ndarray:
+        # Midpoint of each bin. The bits of non-negative floats sort like the
+        # floats, so a bin spans the floats whose bits start with its key.
+        low = (keys << self._shift).view(np.float64)
+        high = (((keys + 1) << self._shift) - 1).view(np.float64)
+
+        with np.errstate(invalid="ignore"):
+            middle = np.where(np.isinf(low), low, low + (high - low) / 2)
+
+        # The lowest bin holds zero
+        return np.where(low == 0, 0.0, middle)
+
+    def _add_bins(
+        self,
+        bins: tuple[np.ndarray, np.ndarray],
+        magnitudes: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if len(magnitudes) == 0:
+            return bins
+
+        keys = magnitudes.view(np.int64) >> self._shift
+        low = keys.min()
+        counts = np.bincount(keys - low)
+        present = np.flatnonzero(counts)
+
+        return _merge_bins(
+            np.concatenate([bins[0], present + low]),
+            np.concatenate([bins[1], counts[present]]),
+            self.max_bins,
+        )
+
+    def add(self, values) -> None:
+        """
+        Add values (array-like, NumPy or pandas) to the sketch in place.
+        """
+        if isinstance(values, pd.Series):
+            values = values.array
+
+        if isinstance(values, ExtensionArray):
+            values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        values = np.asarray(values, dtype=np.float64).ravel()
+
+        for start in range(0, len(values), SKETCH_CHUNK):
+            chunk = values[start : start + SKETCH_CHUNK]
+
+            missing = np.isnan(chunk)
+            if missing.any():
+                chunk = chunk[~missing]
+
+            if len(chunk) == 0:
+                continue
+
+            self.count += len(chunk)
+            self.sum += float(chunk.sum())
+            self.min = float(np.fmin(self.min, chunk.min()))
+            self.max = float(np.fmax(self.max, chunk.max()))
+
+            if chunk.view(np.int64).min() >= 0:
+                # No sign bit is set, as for most errors
+                self.positive = self._add_bins(self.positive, chunk)
+                continue
+
+            negative = chunk < 0
+            self.negative = self._add_bins(self.negative, -chunk[negative])
+            self.positive = self._add_bins(self.positive, np.abs(chunk[~negative]))
+
+    def add_zeros(self, count: int) -> None:
+        """
+        Add ``count`` zeros to the sketch in place, e.g. the errors of rows known to
+        be identical, without materialising them.
+        """
+        if count <= 0:
+            return
+
+        self.count += count
+        self.min = float(np.fmin(self.min, 0.0))
+        self.max = float(np.fmax(self.max, 0.0))
+
+        # Zero has no bits set, so it falls in the positive bin with key 0
+        keys, counts = self.positive
+        self.positive = _merge_bins(
+            np.concatenate([keys, [0]]),
+            np.concatenate([counts, [count]]),
+            self.max_bins,
+        )
+
+    def merge(self, other: "ErrorSketch") -> None:
+        """
+        Add the values summarised by ``other`` to this sketch in place.
+
+        Raises
+        ------
+        ValueError
+            If the sketches were built with a different precision.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Can only merge sketches with the same precision.")
+
+        self.count += other.count
+        self.sum += other.sum
+        self.min = float(np.fmin(self.min, other.min))
+        self.max = float(np.fmax(self.max, other.max))
+
+        for sign in ("positive", "negative"):
+            keys, counts = getattr(self, sign)
+            other_keys, other_counts = getattr(other, sign)
+            merged = _merge_bins(
+                np.concatenate([keys, other_keys]),
+                np.concatenate([counts, other_counts]),
+                self.max_bins,
+            )
+            setattr(self, sign, merged)
+
+    def copy(self) -> "ErrorSketch":
+        sketch = ErrorSketch(self.precision, self.max_bins)
+        sketch.merge(self)
+        return sketch
+
+    def quantile(self, q: float) -> float:
+        """
+        Return the approximate ``q``-quantile, NaN if the sketch is empty.
+
+        Parameters
+        ----------
+        q : float
+            Quantile between 0 and 1, e.g. ``0.99``.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+
+        if self.count == 0:
+            return np.nan
+
+        if q == 0:
+            return self.min
+
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+
+        # Bins from the most negative value to the most positive one
+        neg_keys, neg_counts = self.negative
+        pos_keys, pos_counts = self.positive
+        values = np.concatenate([-self._values(neg_keys[::-1]), self._values(pos_keys)])
+        seen = np.cumsum(np.concatenate([neg_counts[::-1], pos_counts]))
+
+        i = min(int(np.searchsorted(seen, rank, side="right")), len(values) - 1)
+        return float(np.clip(values[i], self.min, self.max))
+
+    def describe(
+        self, quantiles: Iterable[float] = (0.5, 0.9, 0.99)
+    ) -> dict[str, float]:
+        """
+        Return the count, mean, the given quantiles and the max.
+
+        Quantiles are keyed ``p50``, ``p90`` and so on.
+        """
+        stats: dict[str, float] = {"n": self.count, "mean": self.mean}
+
+        for q in quantiles:
+            stats[f"p{100 * q:g}"] = self.quantile(q)
+
+        stats["max"] = self.max
+        return stats
+
+    def __str__(self) -> str:
+        stats = self.describe()
+        n = stats.pop("n")
+        return " ".join([f"n={n:,.0f}", *(f"{k}={v:,.4g}" for k, v in stats.items())])
+
+    def __repr__(self) -> str:
+        return f"ErrorSketch({self})"
+
+
+def merge_sketches(
+    parts: Iterable[Mapping[str, ErrorSketch]],
+) -> dict[str, ErrorSketch]:
+    """
+    Merge the sketches of several outcomes or results, diagnostic by diagnostic.
+
+    The sketches in ``parts`` are left unchanged.
+    """
+    merged: dict[str, ErrorSketch] = {}
+
+    for sketches in parts:
+        for name, sketch in sketches.items():
+            if name in merged:
+                merged[name].merge(sketch)
+            else:
+                merged[name] = sketch.copy()
+
+    return merged
+
+
+def sketch_stats(sketches: Mapping[str, ErrorSketch]) -> dict[str, float]:
+    """
+    Return the max and mean of each sketch, e.g. ``max_abs_error``.
+    """
+    stats: dict[str, float] = {}
+
+    for name, sketch in sketches.items():
+        stats[f"max_{name}"] = sketch.max
+        stats[f"mean_{name}"] = sketch.mean
+
+    return stats
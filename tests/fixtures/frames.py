@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from recx import budget as budget_module
+from recx import progress as progress_module
+
 
 # Basic aligned baseline/candidate pair with a single differing column 'B'
 @pytest.fixture
@@ -106,3 +110,268 @@ def multi_index_frames():
         }
     ).set_index(["vintage_date", "date", "series_id"])
     return baseline, candidate
+
+
+# Small frames with two numeric columns and a string column, for plan tests
+@pytest.fixture
+def metric_frames():
+    baseline = pd.DataFrame(
+        {
+            "metric_1": np.arange(5.0),
+            "metric_2": np.arange(5.0),
+            "label": list("abcde"),
+        }
+    )
+    candidate = baseline.copy()
+    candidate.loc[3, "metric_2"] = 10.0
+    return baseline, candidate
+
+
+# Frames of mixed dtypes with failures and missing values in every column
+@pytest.fixture
+def wide_frames():
+    rng = np.random.default_rng(0)
+    baseline = pd.DataFrame(
+        {
+            "f1": rng.normal(size=50),
+            "f2": rng.normal(size=50),
+            "i1": rng.integers(0, 5, size=50),
+            "s1": ["x"] * 50,
+        }
+    )
+    candidate = baseline.copy()
+    candidate.loc[[3, 7], "f1"] += 1.0
+    candidate.loc[[1, 2, 3], "f2"] = np.nan
+    baseline.loc[[2, 9], "f2"] = np.nan
+    candidate.loc[[4], "i1"] += 3
+    candidate.loc[[5], "s1"] = "y"
+    return baseline, candidate
+
+
+# Frames with failures spread over many small budget slices
+@pytest.fixture
+def progress_frames(monkeypatch):
+    # Small slices so that a run reports and stops between them
+    monkeypatch.setattr(budget_module, "BUDGET_ROWS", 10)
+    monkeypatch.setattr(progress_module, "PROGRESS_INTERVAL", 0)
+
+    n = 100
+    baseline = pd.DataFrame(
+        {
+            "a": np.arange(n, dtype=float),
+            "b": np.arange(n, dtype=float),
+            "c": ["x"] * n,
+        }
+    )
+    candidate = baseline.copy()
+    candidate.loc[::5, "a"] += 1.0
+    candidate.loc[::7, "c"] = "y"
+    return baseline, candidate
+
+
+# Large dated frames where 5% of the rows differ, for sampling tests
+@pytest.fixture
+def sample_frames():
+    n = 10_000
+    dates = pd.date_range("2024-01-01", periods=10).repeat(n // 10)
+    baseline = pd.DataFrame({"date": dates, "x": np.arange(n, dtype=float)})
+    candidate = baseline.copy()
+    # 5% of rows differ
+    candidate.loc[::20, "x"] += 1
+    return baseline, candidate
+
+
+# Frames on a date and id MultiIndex with failures in two columns
+@pytest.fixture
+def profile_frames():
+    n = 1_000
+    dates = pd.date_range("2024-01-01", periods=4).repeat(n // 4)
+    baseline = pd.DataFrame(
+        {
+            "date": dates,
+            "id": np.arange(n),
+            "x": np.linspace(0, 1, n),
+            "y": np.linspace(1, 2, n),
+            "z": ["a"] * n,
+        }
+    ).set_index(["date", "id"])
+    candidate = baseline.copy()
+    candidate.iloc[::10, :2] += 1.0
+    return baseline, candidate
+
+
+# Reordered frames matched on key columns, with missing and extra keys
+@pytest.fixture
+def keyed_frames():
+    baseline = pd.DataFrame(
+        {
+            "account": ["a", "a", "b", "b", "c", None],
+            "date": pd.to_datetime(["2024-01-01", "2024-01-02"] * 3),
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "y": [1, 2, 3, 4, 5, 6],
+        }
+    )
+    candidate = baseline.iloc[[5, 3, 2, 1, 4]].copy()
+    candidate.loc[3, "x"] = 4.5
+    candidate.loc[2, "y"] = 0
+    extra = pd.DataFrame(
+        {"account": ["d"], "date": pd.to_datetime(["2024-01-01"]), "x": [0.0], "y": [0]}
+    )
+    return baseline, pd.concat([candidate, extra], ignore_index=True)
+
+
+# Frames with failures and missing values for count tests
+@pytest.fixture
+def count_frames():
+    baseline = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, np.nan, 5.0],
+            "b": [1.0, 1.0, 1.0, 1.0, 1.0],
+            "s": ["x", "y", "z", None, "w"],
+        }
+    )
+    candidate = baseline.copy()
+    candidate["a"] = [1.0, 2.5, 3.0, 4.0, 7.0]
+    candidate["s"] = ["x", "y", "q", "v", "w"]
+    return baseline, candidate
+
+
+# Frames whose errors grow with the row number
+@pytest.fixture
+def failing_frames():
+    n = 100
+    baseline = pd.DataFrame({"x": np.zeros(n), "y": np.zeros(n)})
+    candidate = pd.DataFrame({"x": np.arange(n, dtype=float), "y": np.arange(n)})
+    candidate.loc[50, "x"] = np.nan
+    return baseline, candidate
+
+
+# Frames with many float columns for parallel tests
+@pytest.fixture
+def many_columns():
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(300, 40))
+    baseline = pd.DataFrame(data, columns=[f"c{i}" for i in range(40)])
+    candidate = baseline.copy()
+    candidate.iloc[::7, ::3] += 1.0
+    candidate["s"] = baseline["s"] = "a"
+    return baseline, candidate
+
+
+# Frames with duplicated index labels
+@pytest.fixture
+def repeated_frames():
+    baseline = pd.DataFrame({"x": [1, 2, 3, 4]}, index=["a", "a", "b", "c"])
+    candidate = pd.DataFrame({"x": [1, 5, 9, 3]}, index=["a", "a", "a", "b"])
+    return baseline, candidate
+
+
+# Frames with a few failures spread over many small budget slices
+@pytest.fixture
+def budget_frames(monkeypatch):
+    # Small slices so that early termination is visible on a small frame
+    monkeypatch.setattr(budget_module, "BUDGET_ROWS", 10)
+
+    n = 100
+    baseline = pd.DataFrame(
+        {
+            "a": np.arange(n, dtype=float),
+            "b": np.arange(n, dtype=float),
+            "c": ["x"] * n,
+        }
+    )
+    candidate = baseline.copy()
+    candidate.loc[[5, 15, 25, 35, 45], "a"] += 1.0
+    candidate.loc[[95], "c"] = "y"
+    return baseline, candidate
+
+
+# Frames with failures in every column and missing candidate rows
+@pytest.fixture
+def sharded_frames():
+    rng = np.random.default_rng(3)
+    n = 500
+    baseline = pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.normal(size=n),
+            "s": rng.choice(["a", "b"], size=n).astype(object),
+        },
+        index=pd.Index([f"k{i}" for i in range(n)], name="key"),
+    )
+    candidate = baseline.copy()
+    candidate.iloc[::13, 0] += 1.0
+    candidate.iloc[::17, 1] *= -1
+    candidate.iloc[::19, 2] = "c"
+    candidate = candidate.iloc[5:]
+    return baseline, candidate
+
+
+# Frames with small random errors and some missing candidate values
+@pytest.fixture
+def error_frames():
+    rng = np.random.default_rng(5)
+    n = 1_000
+    baseline = pd.DataFrame(
+        {"x": rng.normal(size=n), "y": rng.normal(size=n) + 5},
+        index=pd.Index([f"k{i}" for i in range(n)], name="key"),
+    )
+    candidate = baseline + rng.normal(scale=0.1, size=(n, 2))
+    candidate.iloc[::50, 0] = np.nan
+    return baseline, candidate
+
+
+# Frames with rare failures in columns of every kind, for prefilter tests
+@pytest.fixture
+def prefilter_frames():
+    n = 1000
+    rng = np.random.default_rng(4)
+    baseline = pd.DataFrame(
+        {
+            "f": rng.normal(size=n),
+            "i": rng.integers(0, 10, size=n),
+            "s": rng.choice(["a", "b", None], size=n).astype(object),
+            "t": rng.normal(size=n),
+        }
+    )
+    baseline.loc[::50, "f"] = np.nan
+    candidate = baseline.copy()
+    candidate.loc[[3, 501], "f"] += 1
+    candidate.loc[[7], "i"] += 1
+    candidate.loc[[11], "s"] = "z"
+    candidate.loc[[13, 600], "t"] += 1
+    return baseline, candidate
+
+
+# Sorted frames with failures, missing and extra rows, for chunked runs
+@pytest.fixture
+def long_frames():
+    rng = np.random.default_rng(1)
+    baseline = pd.DataFrame(
+        {"x": rng.normal(size=200), "y": rng.integers(0, 3, size=200)},
+        index=pd.Index(np.arange(0, 400, 2), name="id"),
+    )
+    candidate = baseline.copy()
+    candidate.loc[[10, 50, 300], "x"] += 1.0
+    candidate.loc[[20], "y"] += 1
+    # Drop some baseline rows and add some extra ones
+    candidate = candidate.drop([0, 100, 398])
+    extra = pd.DataFrame({"x": [0.0, 0.0], "y": [0, 0]}, index=[51, 1001])
+    candidate = pd.concat([candidate, extra]).sort_index()
+    return baseline, candidate
+
+
+# Frames of five dates with one differing value, for cache tests
+@pytest.fixture
+def partitioned_frames():
+    dates = pd.date_range("2024-01-01", periods=5).repeat(3)
+    baseline = pd.DataFrame(
+        {
+            "date": dates,
+            "id": list(range(3)) * 5,
+            "x": [float(i) for i in range(15)],
+        }
+    ).set_index(["date", "id"])
+    candidate = baseline.copy()
+    candidate.iloc[4, 0] += 1
+    return baseline, candidate
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+
+from recx import EqualCheck, Rec
+from recx.align import Alignment
+
+
+def test_equal_indexes_are_identity():
+    b = pd.DataFrame({"x": range(5)})
+    c = pd.DataFrame({"x": range(5)})
+    alignment = Alignment.from_frames(b, c)
+    assert alignment.is_identity
+    assert alignment.baseline(b) is b
+    assert len(alignment) == 5
+
+
+def test_equal_multi_index_is_identity(multi_index_frames):
+    b, _ = multi_index_frames
+    assert Alignment.from_frames(b, b.copy()).is_identity
+
+
+def test_partial_overlap_indexers():
+    b = pd.DataFrame({"x": [1, 2, 3]}, index=["a", "b", "c"])
+    c = pd.DataFrame({"x": [30, 10, 99]}, index=["c", "a", "z"])
+    alignment = Alignment.from_frames(b, c)
+
+    assert list(alignment.index) == ["a", "c"]
+    np.testing.assert_array_equal(alignment.baseline_indexer, [0, 2])
+    np.testing.assert_array_equal(alignment.candidate_indexer, [1, 0])
+
+    aligned = alignment.candidate(c["x"])
+    assert list(aligned) == [10, 30]
+    assert aligned.index.equals(alignment.index)
+
+
+def test_subset_keeps_superset_frame_unindexed():
+    b = pd.DataFrame({"x": [1, 2, 3]}, index=[1, 2, 3])
+    c = pd.DataFrame({"x": [1, 2]}, index=[1, 2])
+    alignment = Alignment.from_frames(b, c)
+    assert alignment.baseline_indexer is not None
+    assert alignment.candidate_indexer is None
+
+
+def test_rec_matches_loc_alignment():
+    b = pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0]}, index=[4, 3, 2, 1])
+    c = pd.DataFrame({"x": [2.0, 5.0, 1.0, 0.0]}, index=[3, 2, 4, 9])
+
+    result = Rec(columns={"x": EqualCheck()}, check_extra_indices=False).run(b, c)
+    failure = result.failures()
+    assert [r.check_name for r in failure] == ["missing_indices_check", "EqualCheck"]
+
+    column_result = result.results[-1]
+    assert column_result.total_rows == 3
+    assert list(column_result.failed_rows.index) == [2]
+    assert list(column_result.failed_rows["candidate"]) == [5.0]
+
+
+def test_duplicate_labels_pair_like_loc():
+    b = pd.DataFrame({"x": [1, 2]}, index=["a", "a"])
+    c = pd.DataFrame({"x": [1, 1, 5]}, index=["a", "b", "b"])
+    alignment = Alignment.from_frames(b, c)
+    assert len(alignment) == len(b.loc[b.index.intersection(c.index)])
@@ -0,0 +1,136 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, EqualCheck, FailureBudget, Rec
+from recx import budget as budget_module
+
+
+def test_failure_budget_limit():
+    assert FailureBudget(rows=5).limit(1000) == 5
+    assert FailureBudget(fraction=0.01).limit(1000) == 10
+    assert FailureBudget(rows=5, fraction=0.001).limit(1000) == 1
+
+    with pytest.raises(ValueError):
+        FailureBudget()
+
+    with pytest.raises(ValueError):
+        FailureBudget(fraction=1.5)
+
+
+def test_fail_fast_stops_at_first_failure(budget_frames):
+    b, c = budget_frames
+    result = Rec(columns={"a": AbsTolCheck(tol=0.5)}).run(b, c, fail_fast=True)
+
+    statuses = {r.column: r.status for r in result if r.column}
+    assert statuses == {"a": "truncated", "b": "skipped", "c": "skipped"}
+
+    a = result[2]
+    assert a.total_rows == 10
+    assert a.failed_count == 1
+    assert "TRUNCATED" in a.outcome()
+    assert result[3].outcome().startswith("SKIPPED")
+    assert not result[3].passed
+    assert len(result.incomplete()) == 3
+
+
+def test_check_budget_truncates_only_failing_check(budget_frames):
+    b, c = budget_frames
+    result = Rec(columns={}).run(b, c, check_budget=FailureBudget(rows=2))
+
+    by_column = {r.column: r for r in result if r.column}
+    assert by_column["a"].status == "truncated"
+    assert by_column["a"].failed_count == 3
+    assert list(by_column["a"].failed_rows.index) == [5, 15, 25]
+
+    # Under budget: runs to the end
+    assert by_column["b"].status == "complete"
+    assert by_column["c"].status == "complete"
+    assert by_column["c"].failed_count == 1
+
+
+def test_budget_not_exceeded_matches_full_run(budget_frames):
+    b, c = budget_frames
+    rec = Rec(columns={"a": EqualCheck()})
+
+    full = rec.run(b, c)
+    budgeted = rec.run(b, c, budget=FailureBudget(fraction=0.5))
+
+    assert not budgeted.incomplete()
+    for x, y in zip(full, budgeted, strict=True):
+        assert x.total_rows == y.total_rows
+        pd.testing.assert_frame_equal(x.failed_rows, y.failed_rows)
+
+
+def test_budgeted_blocks_match_full_run_on_reordered_rows(budget_frames):
+    b, c = budget_frames
+    c = c.iloc[::-1]
+    rec = Rec(columns={"a": AbsTolCheck(tol=0.5), "b": AbsTolCheck(tol=0.5)})
+
+    full = rec.run(b, c)
+    budgeted = rec.run(b, c, check_budget=FailureBudget(rows=100))
+
+    assert not budgeted.incomplete()
+    for x, y in zip(full, budgeted, strict=True):
+        assert x.failed_count == y.failed_count
+        pd.testing.assert_frame_equal(x.failed_rows, y.failed_rows)
+
+
+def test_truncated_check_without_failures_does_not_pass(budget_frames):
+    b, c = budget_frames
+    # b's only failure is in the last row, beyond the first slice
+    c.loc[99, "b"] += 1.0
+    rec = Rec(columns={"a": AbsTolCheck(tol=0.5), "b": AbsTolCheck(tol=0.5)})
+
+    result = rec.run(b, c, fail_fast=True)
+    by_column = {r.column: r for r in result if r.column}
+
+    assert by_column["b"].status == "truncated"
+    assert by_column["b"].failed_count == 0
+    assert not by_column["b"].passed
+    assert "TRUNCATED" in by_column["b"].outcome()
+    assert "PASSED" not in by_column["b"].outcome()
+    assert not result.passed()
+
+
+def test_slices_cost_their_own_rows(monkeypatch):
+    # A slice that costs as much as the whole frame makes budgeted runs quadratic
+    monkeypatch.setattr(budget_module, "BUDGET_ROWS", 1_000)
+    n = 200_000
+    rng = np.random.default_rng(0)
+    # Columns added one by one are separate blocks, which to_numpy copies
+    baseline = pd.DataFrame(index=range(n))
+    for column in "wxyz":
+        baseline[column] = rng.normal(size=n)
+
+    # Reordered rows, so that the rows of each slice are taken, not viewed
+    candidate = baseline.sample(frac=1, random_state=0)
+
+    peaks = []
+    evaluate_tasks = budget_module.evaluate_tasks
+
+    def traced(*args, **kwargs):
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        outcomes = evaluate_tasks(*args, **kwargs)
+        peaks.append(tracemalloc.get_traced_memory()[1] - start)
+        return outcomes
+
+    monkeypatch.setattr(budget_module, "evaluate_tasks", traced)
+    columns = {column: AbsTolCheck(tol=0.1) for column in "wxyz"}
+
+    tracemalloc.start()
+    try:
+        result = Rec(columns=columns).run(
+            baseline, candidate, check_budget=FailureBudget(rows=10)
+        )
+    finally:
+        tracemalloc.stop()
+
+    assert all(r.passed for r in result)
+    assert len(peaks) == n // 1_000
+
+    # Far less than one copy of the block of four columns
+    assert max(peaks) < n * 4 * 8 / 20
@@ -0,0 +1,116 @@
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, Rec
+
+
+@pytest.fixture
+def count_reconciles(monkeypatch):
+    calls = []
+    reconcile = Rec._reconcile
+
+    def spy(self, baseline, *args, **kwargs):
+        calls.append(len(baseline))
+        return reconcile(self, baseline, *args, **kwargs)
+
+    monkeypatch.setattr(Rec, "_reconcile", spy)
+    return calls
+
+
+def test_cache_requires_date_col(tmp_path):
+    with pytest.raises(ValueError):
+        Rec(columns={}, cache_dir=tmp_path)
+
+
+def test_cached_run_matches_full_run(partitioned_frames, tmp_path, count_reconciles):
+    b, c = partitioned_frames
+    columns = {"x": AbsTolCheck(tol=0.5, sort="desc")}
+
+    full = Rec(columns=columns, align_date_col="date").run(b, c)
+    rec = Rec(columns=columns, align_date_col="date", cache_dir=tmp_path)
+
+    for _ in range(2):
+        cached = rec.run(b, c)
+
+        for x, y in zip(full, cached, strict=True):
+            assert x.total_rows == y.total_rows
+            pd.testing.assert_frame_equal(x.failed_rows, y.failed_rows)
+
+    # First run reconciles all 5 partitions, the second none
+    assert len(count_reconciles) == 1 + 5
+
+
+def test_cached_rows_are_in_row_order(tmp_path):
+    # Dates interleave, so concatenating the partitions would group rows by date
+    baseline = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-02", "2024-01-01"] * 4),
+            "id": [7, 3, 5, 1, 6, 2, 4, 0],
+            "x": [float(i) for i in range(8)],
+        }
+    )
+    candidate = baseline.iloc[1:].copy()
+    candidate["x"] += [1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0]
+    candidate.loc[8] = [pd.Timestamp("2024-01-02"), 9, 0.0]
+    candidate.loc[9] = [pd.Timestamp("2024-01-01"), 8, 0.0]
+
+    settings = dict(columns={"x": AbsTolCheck(tol=0.5)}, keys=["date", "id"])
+    full = Rec(**settings).run(baseline, candidate)
+    cached = Rec(**settings, align_date_col="date", cache_dir=tmp_path)
+
+    for _ in range(2):
+        for x, y in zip(full, cached.run(baseline, candidate), strict=True):
+            assert list(y.failed_rows.index) == list(x.failed_rows.index)
+            pd.testing.assert_frame_equal(x.failed_rows, y.failed_rows)
+
+
+def test_only_changed_partitions_rerun(partitioned_frames, tmp_path, count_reconciles):
+    b, c = partitioned_frames
+    rec = Rec(columns={}, align_date_col="date", cache_dir=tmp_path)
+    rec.run(b, c)
+    count_reconciles.clear()
+
+    c = c.copy()
+    c.iloc[13, 0] = -1.0
+    result = rec.run(b, c)
+
+    assert count_reconciles == [3]
+    assert result[2].failed_count == 2
+
+
+def test_config_change_invalidates(partitioned_frames, tmp_path, count_reconciles):
+    b, c = partitioned_frames
+    Rec(columns={}, align_date_col="date", cache_dir=tmp_path).run(b, c)
+    count_reconciles.clear()
+
+    columns = {"x": AbsTolCheck(tol=2.0)}
+    result = Rec(columns=columns, align_date_col="date", cache_dir=tmp_path).run(b, c)
+
+    assert len(count_reconciles) == 5
+    assert result.passed()
+
+
+def test_cache_bypassed_unless_date_is_matched_on(tmp_path, count_reconciles, caplog):
+    b = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=4).repeat(50),
+            "id": range(200),
+            "x": 1.0,
+        }
+    )
+    c = b.copy()
+    c.loc[10, "date"] = pd.Timestamp("2024-01-02")
+
+    full = Rec(columns={}, keys=["id"], align_date_col="date").run(b, c)
+    count_reconciles.clear()
+
+    rec = Rec(columns={}, keys=["id"], align_date_col="date", cache_dir=tmp_path)
+    cached = rec.run(b, c)
+
+    # The changed date is a failure of the date column, not a missing and extra row
+    assert [r.failed_count for r in cached] == [r.failed_count for r in full]
+    assert [r.failed_count for r in cached] == [0, 0, 1, 0]
+    assert cached[2].total_rows == 200
+    # One reconcile of all the rows, not one per date
+    assert count_reconciles == [200]
+    assert "Not using the cache" in caplog.text
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, EqualCheck, Rec
+from recx.chunks import merge_windows
+
+
+def chunked(df: pd.DataFrame, size: int):
+    return (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+def test_merge_windows_cover_all_rows(long_frames):
+    b, c = long_frames
+    windows = list(merge_windows(chunked(b, 17), chunked(c, 23)))
+    assert sum(len(bw) for bw, _ in windows) == len(b)
+    assert sum(len(cw) for _, cw in windows) == len(c)
+
+    # Windows cover consecutive, non-overlapping label ranges
+    labels = [bw.index.append(cw.index) for bw, cw in windows]
+    for prev, nxt in zip(labels, labels[1:], strict=False):
+        if len(prev) and len(nxt):
+            assert prev.max() < nxt.min()
+
+
+@pytest.mark.parametrize("sizes", [(17, 23), (200, 5), (1, 1000)])
+def test_run_chunks_matches_run(long_frames, sizes):
+    b, c = long_frames
+    rec = Rec(columns={"x": AbsTolCheck(tol=0.5, sort="desc")})
+
+    expected = rec.run(b, c)
+    actual = rec.run_chunks(chunked(b, sizes[0]), chunked(c, sizes[1]))
+
+    assert len(actual) == len(expected)
+    for a, e in zip(actual.results, expected.results, strict=True):
+        assert a.signature() == e.signature()
+        assert a.total_rows == e.total_rows
+        assert a.failed_count == e.failed_count
+        assert list(a.failed_rows.index) == list(e.failed_rows.index)
+
+    assert actual.baseline_shape == b.shape
+    assert actual.candidate_shape == c.shape
+
+
+def test_run_chunks_summary(capsys, long_frames):
+    b, c = long_frames
+    result = Rec(columns={"x": EqualCheck()}).run_chunks(chunked(b, 50), chunked(c, 50))
+    result.summary()
+    out = capsys.readouterr().out
+    assert f"Baseline: rows={len(b)}" in out
+    assert "FAILED" in out
+
+
+def test_run_chunks_unsorted_raises(long_frames):
+    b, c = long_frames
+    with pytest.raises(ValueError):
+        Rec(columns={}).run_chunks([b.iloc[::-1]], [c])
+
+    with pytest.raises(ValueError):
+        Rec(columns={}).run_chunks([b.iloc[100:], b.iloc[:100]], [c])
+
+
+def test_run_chunks_rejects_align_date_col(long_frames):
+    b, c = long_frames
+    with pytest.raises(ValueError):
+        Rec(columns={}, align_date_col="date").run_chunks([b], [c])
+
+
+def test_run_chunks_one_side_empty(long_frames):
+    b, _ = long_frames
+    result = Rec(columns={}).run_chunks(chunked(b, 64), [])
+    assert result[0].check_name == "missing_indices_check"
+    assert result[0].failed_count == len(b)
+
+
+def test_run_chunks_both_empty():
+    result = Rec(columns={}).run_chunks([], [])
+    assert result.passed()
+
+
+def test_run_chunks_only_empty_chunks(long_frames):
+    b, c = long_frames
+    rec = Rec(columns={"x": AbsTolCheck(tol=0.1), "y": EqualCheck()})
+
+    result = rec.run_chunks([b.iloc[:0], b.iloc[:0]], [c.iloc[:0]])
+
+    assert result.passed()
+    assert [r.column for r in result[2:]] == ["x", "y"]
+    assert all(r.total_rows == 0 for r in result)
+    assert result.baseline_shape == (0, 2)
@@ -0,0 +1,161 @@
+import json
+
+import pandas as pd
+import pytest
+
+from recx.cli import EXIT_ERROR, EXIT_FAILED, EXIT_PASSED, main, read_csv
+
+CONFIG = """
+keys = ["account", "date"]
+align_date_col = "date"
+check_all = false
+
+[dtypes]
+account = "string"
+price = "float64"
+
+[columns.price]
+check = "abs_tol"
+tol = 0.01
+
+[columns."^metric_"]
+check = "rel_tol"
+tol = 1e-6
+regex = true
+
+[columns.status]
+check = "equal"
+"""
+
+
+@pytest.fixture
+def csv_files(tmp_path):
+    baseline = pd.DataFrame(
+        {
+            "account": ["a", "b", "c", "a"],
+            "date": ["2024-01-01", "2024-01-01", "2024-01-01", "2024-01-02"],
+            "price": [1.0, 2.0, 3.0, 4.0],
+            "metric_1": [0.5, 0.5, 0.5, 0.5],
+            "status": ["on", "on", "off", "on"],
+            "notes": ["x", "y", "z", "w"],
+        }
+    )
+    candidate = baseline.copy()
+    candidate["notes"] = "changed"
+
+    # A newer date only in the candidate is clipped away
+    extra = baseline.iloc[[0]].assign(date="2024-01-03", price=99.0)
+    candidate = pd.concat([candidate, extra])
+
+    paths = {
+        "baseline": tmp_path / "baseline.csv",
+        "candidate": tmp_path / "candidate.csv",
+        "config": tmp_path / "rec.toml",
+    }
+    baseline.to_csv(paths["baseline"], index=False)
+    candidate.to_csv(paths["candidate"], index=False)
+    paths["config"].write_text(CONFIG)
+    return paths
+
+
+def run(paths, *extra):
+    args = [str(paths["baseline"]), str(paths["candidate"])]
+    return main([*args, "--config", str(paths["config"]), *extra])
+
+
+def test_passing_run(csv_files, capsys):
+    assert run(csv_files) == EXIT_PASSED
+
+    out = capsys.readouterr().out
+    assert "DataFrame Reconciliation Summary" in out
+    assert "notes" not in out
+
+
+def test_failing_run_writes_report(csv_files, tmp_path, capsys):
+    candidate = pd.read_csv(csv_files["candidate"])
+    candidate.loc[1, "price"] = 2.5
+    candidate.loc[2, "metric_1"] = 0.6
+    candidate.to_csv(csv_files["candidate"], index=False)
+
+    report_path = tmp_path / "report.json"
+    assert run(csv_files, "--report", str(report_path)) == EXIT_FAILED
+    assert "FAILED" in capsys.readouterr().out
+
+    report = json.loads(report_path.read_text())
+    assert report["exit_code"] == EXIT_FAILED
+    assert report["passed"] is False
+    assert report["baseline"]["rows"] == 4
+
+    checks = {(c["check"], c["column"]): c for c in report["checks"]}
+    assert checks[("AbsTolCheck", "price")]["failed_count"] == 1
+    assert checks[("RelTolCheck", "metric_1")]["failed_count"] == 1
+    assert checks[("EqualCheck", "status")]["passed"] is True
+    assert checks[("AbsTolCheck", "price")]["sketches"]["abs_error"]["max"] == 0.5
+
+
+def test_reads_only_needed_columns_with_dtypes(csv_files):
+    config = {
+        "columns": {"price": {}, "^metric_": {"regex": True}},
+        "keys": ["account"],
+        "align_date_col": "date",
+        "check_all": False,
+        "dtypes": {"account": "string", "price": "float32"},
+    }
+    frame = read_csv(str(csv_files["baseline"]), config)
+
+    assert list(frame.columns) == ["account", "date", "price", "metric_1"]
+    assert frame["account"].dtype == "string"
+    assert frame["price"].dtype == "float32"
+    assert pd.api.types.is_datetime64_any_dtype(frame["date"])
+    assert len(frame) == 4
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ("[columns.price]\ncheck = 'nope'\n", "Unknown check 'nope'"),
+        ("[columns.price]\ncheck = 'abs_tol'\n", "Bad arguments for column 'price'"),
+        ("[columns.price]\ntol = 0.1\n", "Unknown field(s) for column 'price': tol"),
+        ("colums = 1\n", "Unknown settings"),
+        ('index = "id"\n[columns.price]\n', "index in"),
+        ('keys = ["id", 1]\n[columns.price]\n', "keys in"),
+        ('dtypes = "float64"\n[columns.price]\n', "dtypes in"),
+        ("columns = 1\n", "columns in"),
+        ("[columns]\nprice = 1\n", "columns.price in"),
+        ("keys = [\n", "recx: error"),
+    ],
+)
+def test_config_errors(csv_files, capsys, config, message):
+    csv_files["config"].write_text(config)
+
+    assert run(csv_files) == EXIT_ERROR
+    assert message in capsys.readouterr().err
+
+
+def test_time_budget_with_processes(csv_files, capsys):
+    csv_files["config"].write_text('n_jobs = 2\nexecutor = "process"\n' + CONFIG)
+
+    assert run(csv_files, "--time-budget", "10") == EXIT_ERROR
+    assert "executor='process'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        'keys = ["account", "date"]\ncheck_all = false\n[columns.volume]\n',
+        'keys = ["account", "date"]\n[columns.volume]\ncheck = "abs_tol"\ntol = 1\n',
+        'keys = ["id"]\n[columns.price]\n',
+    ],
+)
+def test_missing_columns(csv_files, capsys, config):
+    csv_files["config"].write_text(config)
+
+    assert run(csv_files) == EXIT_ERROR
+    err = capsys.readouterr().err
+    assert "baseline.csv: Missing column(s)" in err
+    assert "Traceback" not in err
+
+
+def test_skipped_column_may_be_missing(csv_files):
+    csv_files["config"].write_text(CONFIG + '\n[columns.volume]\ncheck = "skip"\n')
+    assert run(csv_files) == EXIT_PASSED
@@ -0,0 +1,57 @@
+import pytest
+
+from recx import AbsTolCheck, FailureBudget, Rec, RelTolCheck
+
+
+def test_counts_match_rows_mode(count_frames):
+    b, c = count_frames
+    rec = Rec(columns={"a": AbsTolCheck(tol=0.1), "b": RelTolCheck(tol=0.1)})
+
+    rows = rec.run(b, c)
+    counts = rec.run(b, c, mode="counts")
+
+    for r, n in zip(rows, counts, strict=True):
+        assert r.failed_count == n.failed_count
+        assert r.total_rows == n.total_rows
+
+
+def test_counts_stats(count_frames):
+    b, c = count_frames
+    result = Rec(columns={"a": AbsTolCheck(tol=0.1)}).run(b, c, mode="counts")
+    by_column = {r.column: r for r in result if r.column}
+
+    a = by_column["a"]
+    assert a.stats == {
+        "null_mismatches": 1,
+        "max_abs_error": 2.0,
+        "mean_abs_error": pytest.approx(2.5 / 4),
+    }
+    assert not a.has_failed_rows
+    with pytest.raises(ValueError):
+        a.failed_rows  # noqa: B018
+
+    # Default equality: object column with one null mismatch
+    assert by_column["s"].failed_count == 2
+    assert by_column["s"].stats == {"null_mismatches": 1}
+
+
+def test_counts_with_budget(count_frames):
+    b, c = count_frames
+    result = Rec(columns={"a": AbsTolCheck(tol=0.1)}).run(
+        b, c, mode="counts", budget=FailureBudget(rows=100)
+    )
+    assert result[2].stats["max_abs_error"] == 2.0
+
+
+def test_counts_summary(count_frames, capsys):
+    b, c = count_frames
+    Rec(columns={"a": AbsTolCheck(tol=0.1)}).run(b, c, mode="counts").summary()
+    out = capsys.readouterr().out
+    assert "max_abs_error=2" in out
+    assert "Failing rows not kept" in out
+
+
+def test_invalid_mode(count_frames):
+    b, c = count_frames
+    with pytest.raises(ValueError):
+        Rec(columns={}).run(b, c, mode="frames")  # type: ignore[arg-type]
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import Rec
+from recx.align import IndexJoin
+
+
+def test_occurrence_pairs_in_order(repeated_frames):
+    baseline, candidate = repeated_frames
+    join = IndexJoin.from_frames(baseline, candidate, duplicates="occurrence")
+
+    assert list(join.alignment.index) == ["a", "a", "b"]
+    assert list(join.alignment.candidate(candidate["x"])) == [1, 5, 3]
+    assert list(join.missing) == [3]
+    assert list(join.extra) == [2]
+
+
+def test_occurrence_results(repeated_frames):
+    baseline, candidate = repeated_frames
+    result = Rec({}, duplicates="occurrence").run(baseline, candidate)
+    missing, extra, duplicates, x = result.results
+
+    assert (missing.failed_count, extra.failed_count) == (1, 1)
+    assert list(extra.failed_rows["x"]) == [9]
+    assert duplicates.check_name == "duplicate_count_check"
+    assert duplicates.total_rows == 3
+    assert duplicates.failed_rows.to_dict("index") == {
+        "a": {"baseline_count": 2, "candidate_count": 3}
+    }
+    assert list(x.failed_rows.index) == ["a"]
+
+
+def test_occurrence_is_linear():
+    baseline = pd.DataFrame({"x": np.arange(1000)}, index=np.zeros(1000, dtype=int))
+    candidate = baseline.copy()
+    candidate.iloc[10, 0] = -1
+
+    result = Rec({}, duplicates="occurrence").run(baseline, candidate.iloc[::-1])
+
+    assert result.results[-1].total_rows == 1000
+    assert all(r.passed for r in result.results[:-1])
+
+
+def test_occurrence_with_keys():
+    baseline = pd.DataFrame({"k": ["a", "a", "b"], "d": [1, 1, 2], "x": [1, 2, 3]})
+    candidate = pd.DataFrame({"k": ["a", "b", "b"], "d": [1, 2, 2], "x": [1, 3, 4]})
+
+    rec = Rec({}, keys=["k", "d"], duplicates="occurrence")
+    missing, extra, duplicates, x = rec.run(baseline, candidate).results
+
+    assert (missing.failed_count, extra.failed_count, x.failed_count) == (1, 1, 0)
+    assert list(duplicates.failed_rows.index) == [("a", 1), ("b", 2)]
+
+
+def test_unique_indexes_pass_duplicate_check():
+    frame = pd.DataFrame({"x": [1, 2]}, index=[1, 2])
+    result = Rec({}, duplicates="occurrence").run(frame, frame.iloc[:1])
+
+    assert result.results[2].passed
+    assert result.results[2].total_rows == 2
+
+
+def test_invalid_duplicates():
+    with pytest.raises(ValueError):
+        Rec({}, duplicates="bad")  # type: ignore[arg-type]
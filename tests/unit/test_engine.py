@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, EqualCheck, Rec, RelTolCheck
+from recx.checks import ColumnCheck
+from recx.engine import run_column_checks, take_block
+
+
+@pytest.mark.parametrize(
+    "check",
+    [EqualCheck(), AbsTolCheck(tol=0.5), RelTolCheck(tol=0.1, sort="desc")],
+)
+def test_block_matches_per_column_check(wide_frames, check):
+    b, c = wide_frames
+    results = run_column_checks(b, c, [(check, "f1"), (check, "f2"), (check, "i1")])
+
+    for result in results:
+        expected = check.check(b[result.column], c[result.column])
+        pd.testing.assert_frame_equal(
+            result.failed_rows, expected, check_index_type=False
+        )
+
+
+def test_block_results_keep_task_order(wide_frames):
+    b, c = wide_frames
+    tasks = [
+        (EqualCheck(), "s1"),
+        (AbsTolCheck(tol=0.5), "f1"),
+        (EqualCheck(), "i1"),
+        (AbsTolCheck(tol=0.5), "f2"),
+    ]
+    results = run_column_checks(b, c, tasks)
+    assert [r.column for r in results] == ["s1", "f1", "i1", "f2"]
+    assert [r.check_name for r in results] == [
+        "EqualCheck",
+        "AbsTolCheck",
+        "EqualCheck",
+        "AbsTolCheck",
+    ]
+
+
+def test_equivalent_checks_share_a_block(monkeypatch, wide_frames):
+    b, c = wide_frames
+    calls = []
+    original = EqualCheck.check_block
+
+    def spy(self, baseline, candidate):
+        calls.append(baseline.shape)
+        return original(self, baseline, candidate)
+
+    monkeypatch.setattr(EqualCheck, "check_block", spy)
+
+    Rec(columns={"f1": EqualCheck(), "f2": EqualCheck()}).run(b, c)
+
+    # f1 and f2 share one float block; i1 gets its own int block
+    assert sorted(calls) == [(50, 1), (50, 2)]
+
+
+def test_custom_check_block_hook():
+    class SignCheck(ColumnCheck):
+        def check(self, baseline, candidate):  # pragma: no cover - not used
+            raise AssertionError("block path expected")
+
+        def check_block(self, baseline, candidate):
+            return np.sign(baseline) != np.sign(candidate), {}
+
+    b = pd.DataFrame({"m1": [1.0, -1.0], "m2": [2.0, 2.0]})
+    c = pd.DataFrame({"m1": [1.0, 1.0], "m2": [3.0, 2.0]})
+
+    results = SignCheck(regex=True).run(b, c, r"^m")
+
+    assert [r.passed for r in results] == [False, True]
+    assert list(results[0].failed_rows.index) == [1]
+
+
+def test_subclass_overriding_check_is_used():
+    class LooseEqualCheck(EqualCheck):
+        def check(self, baseline, candidate):
+            # Allows differences up to 1
+            failed = (baseline - candidate).abs() > 1
+            return pd.DataFrame({"baseline": baseline[failed]})
+
+    class LooseAbsTolCheck(AbsTolCheck):
+        def check(self, baseline, candidate):
+            return pd.DataFrame({"baseline": baseline.iloc[:0]})
+
+    b = pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [1.0, 2.0, 3.0]})
+    c = pd.DataFrame({"x": [1.0, 2.5, 3.0], "y": [1.0, 9.0, 3.0]})
+
+    for check in (LooseEqualCheck(), LooseAbsTolCheck(tol=0.1)):
+        assert not check.uses_masks
+        assert check.block_key(b.dtypes["x"], c.dtypes["x"]) is None
+
+    result = Rec(columns={"x": LooseEqualCheck(), "y": LooseAbsTolCheck(tol=0.1)})
+    assert [r.failed_count for r in result.run(b, c)[2:]] == [0, 0]
+
+
+def test_subclass_overriding_check_mask_is_not_blocked(wide_frames):
+    b, c = wide_frames
+
+    class IgnoreNullsCheck(EqualCheck):
+        def check_mask(self, baseline, candidate):
+            failed, diagnostics = super().check_mask(baseline, candidate)
+            return failed & baseline.notna().to_numpy(), diagnostics
+
+    check = IgnoreNullsCheck()
+    assert check.uses_masks
+    assert check.block_key(b.dtypes["f2"], c.dtypes["f2"]) is None
+
+    # f2 is null on both sides at row 2 and only in the candidate at rows 1 and 3
+    rec = Rec(columns={"f1": EqualCheck(), "f2": check}, check_all=False)
+    f1, f2 = rec.run(b, c)[2:]
+    assert f1.failed_count == 2
+    assert list(f2.failed_rows.index) == [1, 3]
+
+    # A subclass that keeps the block hook still gets blocks of its own
+    class CountedEqualCheck(EqualCheck):
+        def check_block(self, baseline, candidate):
+            return super().check_block(baseline, candidate)
+
+    key = CountedEqualCheck().block_key(b.dtypes["f1"], c.dtypes["f1"])
+    assert key is not None
+    assert key != EqualCheck().block_key(b.dtypes["f1"], c.dtypes["f1"])
+
+
+def test_take_block_takes_rows_column_by_column(wide_frames):
+    baseline, _ = wide_frames
+    columns = ["f1", "f2"]
+    indexer = np.array([4, 0, 9, 9, 2])
+
+    block = take_block(baseline, columns, indexer)
+    np.testing.assert_array_equal(block, baseline[columns].to_numpy()[indexer])
+    assert block.flags.f_contiguous
+
+    np.testing.assert_array_equal(
+        take_block(baseline, columns), baseline[columns].to_numpy()
+    )
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import EqualCheck
+from recx import fingerprint as fingerprint_module
+from recx.checks import ColumnCheck
+from recx.engine import run_column_checks
+from recx.fingerprint import columns_identical
+
+
+class ExplodingCheck(ColumnCheck):
+    prefilter = True
+
+    def check_mask(self, baseline, candidate):
+        raise AssertionError("identical columns should not be checked")
+
+
+def test_columns_identical_numpy(monkeypatch):
+    monkeypatch.setattr(fingerprint_module, "FINGERPRINT_CHUNK", 3)
+
+    s = pd.Series([1.0, np.nan, -0.0, 4.0, 5.0])
+    assert columns_identical(s, s)
+    assert columns_identical(s, s.copy())
+
+    changed = s.copy()
+    changed.iloc[4] = 6.0
+    assert not columns_identical(s, changed)
+
+    # Equal under EqualCheck, but not byte-identical: not proven
+    assert not columns_identical(pd.Series([0.0]), pd.Series([-0.0]))
+    assert not columns_identical(s, s.astype("float32"))
+
+
+def test_columns_identical_objects():
+    s = pd.Series(["a", None, "c"], dtype=object)
+    assert columns_identical(s, s.copy())
+    assert not columns_identical(s, pd.Series(["a", None, "d"], dtype=object))
+
+    # Mixed objects cannot be proven through hashes
+    mixed = pd.Series([1, "a"], dtype=object)
+    assert not columns_identical(mixed, mixed.copy())
+
+
+def test_identical_columns_short_circuit():
+    b = pd.DataFrame({"x": np.arange(10.0), "s": list("abcdefghij")})
+    c = b.copy()
+
+    check = ExplodingCheck()
+    results = run_column_checks(b, c, [(check, "x"), (check, "s")])
+
+    assert all(r.passed for r in results)
+    assert [r.total_rows for r in results] == [10, 10]
+    assert results[0].failed_rows.empty
+
+
+def test_short_circuit_only_when_proven():
+    b = pd.DataFrame({"x": np.arange(10.0)})
+    c = b.copy()
+    c.loc[3, "x"] = 100
+
+    with pytest.raises(AssertionError):
+        run_column_checks(b, c, [(ExplodingCheck(), "x")])
+
+    (result,) = run_column_checks(b, c, [(EqualCheck(), "x")])
+    assert result.failed_count == 1
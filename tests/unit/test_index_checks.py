@@ -1,5 +1,9 @@
+import numpy as np
 import pandas as pd
+import pytest
 
+from recx import EqualCheck, Rec
+from recx.align import IndexJoin
 from recx.checks import index_check
 
 
@@ -10,3 +14,52 @@ def test_index_check_missing_and_extra():
     extra = index_check(base, cand, "extra")
     assert not missing.passed
     assert not extra.passed
+
+
+@pytest.mark.parametrize(
+    "base_labels, cand_labels",
+    [
+        ([3, 1, 2, 5], [2, 4, 3, 0]),
+        ([1, 1, 2, 3, 3], [3, 4, 4, 0]),
+        ([("a", 2), ("b", 1), ("a", 1)], [("a", 1), ("c", 1)]),
+    ],
+)
+def test_index_check_matches_difference(base_labels, cand_labels):
+    def frame(labels):
+        index = (
+            pd.MultiIndex.from_tuples(labels)
+            if isinstance(labels[0], tuple)
+            else pd.Index(labels)
+        )
+        return pd.DataFrame({"x": np.arange(len(labels))}, index=index)
+
+    base, cand = frame(base_labels), frame(cand_labels)
+    join = IndexJoin.from_frames(base, cand)
+
+    missing = index_check(base, cand, "missing", join)
+    extra = index_check(base, cand, "extra", join)
+
+    expected_missing = base.loc[base.index.difference(cand.index)]
+    expected_extra = cand.loc[cand.index.difference(base.index)]
+    assert missing.failed_count == len(expected_missing)
+    assert extra.failed_count == len(expected_extra)
+    pd.testing.assert_frame_equal(missing.failed_rows, expected_missing)
+    pd.testing.assert_frame_equal(extra.failed_rows, expected_extra)
+
+
+def test_rec_joins_indexes_once(monkeypatch):
+    base = pd.DataFrame({"x": [1, 2, 3]}, index=[1, 2, 3])
+    cand = pd.DataFrame({"x": [2, 3, 4]}, index=[2, 3, 4])
+
+    calls = []
+    from_frames = IndexJoin.from_frames.__func__  # type: ignore[attr-defined]
+
+    def counting(cls, baseline, candidate, *args):
+        calls.append(1)
+        return from_frames(cls, baseline, candidate, *args)
+
+    monkeypatch.setattr(IndexJoin, "from_frames", classmethod(counting))
+    result = Rec({"x": EqualCheck()}).run(base, cand)
+
+    assert len(calls) == 1
+    assert [r.failed_count for r in result.results] == [1, 1, 0]
@@ -0,0 +1,130 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import recx.kernels
+from recx.checks import AbsTolCheck, EqualCheck, RelTolCheck
+from recx.kernels import block_unequal, equal_kernel
+
+CASES = {
+    "int64": ([1, 2, 3, 4], [1, 0, 3, 5]),
+    "bool": ([True, False, True, False], [True, True, True, False]),
+    "float64": ([1.0, np.nan, np.nan, -0.0], [1.0, np.nan, 2.0, 0.0]),
+    "datetime64[ns]": (
+        ["2024-01-01", None, None, "2024-01-03"],
+        ["2024-01-01", None, "2024-01-02", "2024-01-04"],
+    ),
+    "timedelta64[ns]": (["1D", None, "2D", "3D"], ["1D", None, None, "3D"]),
+    "datetime64[ns, UTC]": (
+        ["2024-01-01", None, None, "2024-01-03"],
+        ["2024-01-01", None, "2024-01-02", "2024-01-03"],
+    ),
+    "Int64": ([1, None, None, 4], [1, None, 3, 5]),
+    "Float64": ([1.5, None, 2.0, 4.0], [1.5, None, None, 4.0]),
+    "boolean": ([True, None, False, None], [True, None, False, False]),
+    "category": (["a", "b", None, "c"], ["a", "c", None, "c"]),
+}
+
+
+def reference(baseline: pd.Series, candidate: pd.Series) -> np.ndarray:
+    good = (baseline == candidate) | (baseline.isnull() & candidate.isnull())
+    return ~good.to_numpy(dtype=bool, na_value=False)
+
+
+@pytest.mark.parametrize("dtype", list(CASES))
+def test_kernel_matches_generic(dtype):
+    b_values, c_values = CASES[dtype]
+    baseline = pd.Series(b_values).astype(dtype)
+    candidate = pd.Series(c_values).astype(dtype)
+
+    if dtype == "category":
+        # The generic comparison needs identical categories
+        candidate = candidate.cat.set_categories(baseline.cat.categories)
+
+    kernel = equal_kernel(baseline.dtype, candidate.dtype)
+
+    assert kernel is not None
+    np.testing.assert_array_equal(
+        kernel(baseline, candidate), reference(baseline, candidate)
+    )
+
+
+def test_categorical_unifies_categories():
+    baseline = pd.Series(["a", "b", None, "c"], dtype="category")
+    candidate = pd.Series(
+        pd.Categorical(["a", "b", None, "d"], categories=["d", "b", "a"])
+    )
+
+    failed, _ = EqualCheck().check_mask(baseline, candidate)
+
+    assert failed.tolist() == [False, False, False, True]
+
+
+@pytest.mark.parametrize("dtype", ["object", "str"])
+def test_no_kernel_for_strings(dtype):
+    assert equal_kernel(np.dtype(object), pd.Series([], dtype=dtype).dtype) is None
+    assert equal_kernel(np.dtype("int64"), np.dtype("float64")) is None
+
+
+def test_block_kernel_on_2d_views():
+    baseline = np.array([[1.0, np.nan], [np.nan, 2.0], [3.0, 4.0]])
+    candidate = np.array([[1.0, np.nan], [0.0, 2.0], [3.0, 5.0]])
+
+    failed = block_unequal(baseline.T.copy().T, candidate)
+
+    assert failed.tolist() == [[False, False], [True, False], [False, True]]
+
+
+def tolerance_reference(check, baseline, candidate):
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        error = check.error_block(baseline, candidate)
+        failed = ~(error <= check.tol)
+    failed &= ~(np.isnan(baseline) & np.isnan(candidate))
+    return failed, error
+
+
+@pytest.mark.parametrize("check", [AbsTolCheck(tol=0.1), RelTolCheck(tol=0.1)])
+def test_fused_tolerance_matches_reference(monkeypatch, check):
+    monkeypatch.setattr(recx.kernels, "TOLERANCE_CHUNK", 4)
+    rng = np.random.default_rng(0)
+    baseline = rng.normal(size=(11, 3))
+    candidate = baseline + rng.normal(scale=0.1, size=(11, 3))
+    baseline[[0, 1, 2], [0, 1, 2]] = [np.nan, np.inf, 0.0]
+    candidate[[0, 1, 2], [0, 1, 2]] = [np.nan, np.inf, 0.0]
+    candidate[3, 0] = np.nan
+
+    failed, diagnostics = check.check_block(baseline, candidate)
+    expected_failed, expected_error = tolerance_reference(check, baseline, candidate)
+
+    np.testing.assert_array_equal(failed, expected_failed)
+    np.testing.assert_allclose(diagnostics[check.error_column], expected_error)
+
+
+def test_fused_tolerance_mixed_dtypes():
+    baseline = pd.Series([1, 2, 3])
+    candidate = pd.Series([1.0, 2.5, np.nan])
+
+    failed, diagnostics = AbsTolCheck(tol=0.1).check_mask(baseline, candidate)
+
+    assert failed.tolist() == [False, True, True]
+    np.testing.assert_allclose(diagnostics["abs_error"], [0.0, 0.5, np.nan])
+
+
+def test_fused_tolerance_peak_memory():
+    n = 1_000_000
+    baseline = np.random.default_rng(0).normal(size=n)
+    candidate = baseline * 1.001
+    check = RelTolCheck(tol=0.01)
+    check.check_block(baseline, candidate)  # warm up the scratch arena
+
+    tracemalloc.start()
+    try:
+        check.check_block(baseline, candidate)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The float64 error plus the boolean mask, and little else
+    assert peak < 1.1 * n * (8 + 1)
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, Rec
+
+
+@pytest.mark.parametrize("keys", [["account", "date"], ["y"]])
+def test_keys_match_index_path(keyed_frames, keys):
+    baseline, candidate = keyed_frames
+    columns = {"x": AbsTolCheck(tol=0.1)}
+
+    by_keys = Rec(columns, keys=keys).run(baseline, candidate)
+    by_index = Rec(columns).run(baseline.set_index(keys), candidate.set_index(keys))
+
+    assert len(by_keys.results) == len(by_index.results)
+
+    for k, i in zip(by_keys.results, by_index.results, strict=True):
+        assert (k.check_name, k.column) == (i.check_name, i.column)
+        assert k.failed_count == i.failed_count
+        assert k.total_rows == i.total_rows
+        pd.testing.assert_frame_equal(k.failed_rows, i.failed_rows)
+
+
+def test_keys_excluded_from_check_all(keyed_frames):
+    baseline, candidate = keyed_frames
+    result = Rec({}, keys=["account", "date"]).run(baseline, candidate)
+
+    assert [r.column for r in result.results[2:]] == ["x", "y"]
+
+
+def test_duplicate_keys_pair_like_index(keyed_frames):
+    baseline, candidate = keyed_frames
+    rec = Rec({}, keys=["account"])
+    by_keys = rec.run(baseline, candidate)
+    by_index = Rec({}).run(
+        baseline.set_index("account"), candidate.set_index("account")
+    )
+
+    counts = [(r.failed_count, r.total_rows) for r in by_keys.results]
+    assert counts == [(r.failed_count, r.total_rows) for r in by_index.results]
+
+
+def test_missing_key_column(keyed_frames):
+    baseline, candidate = keyed_frames
+
+    with pytest.raises(ValueError, match="nope"):
+        Rec({}, keys=["nope"]).run(baseline, candidate)
+
+
+def test_keys_identity_join():
+    frame = pd.DataFrame({"k": np.arange(5), "x": np.arange(5.0)})
+    result = Rec({}, keys=["k"]).run(frame, frame.copy())
+
+    assert result.results[2].passed
+    assert list(result.results[2].failed_rows.index.names) == ["k"]
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import EqualCheck, Rec
+from recx.checks import ColumnCheck
+from recx.results import CheckResult
+
+
+class SignCheck(ColumnCheck):
+    def check_mask(self, baseline, candidate):
+        failed = np.sign(baseline.to_numpy()) != np.sign(candidate.to_numpy())
+        return failed, {"sign": np.sign(candidate.to_numpy())}
+
+
+def test_lazy_failed_rows_built_on_first_access():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return pd.DataFrame({"baseline": [1], "candidate": [2]})
+
+    cr = CheckResult(failed_rows=build, check_name="X", total_rows=4, failed_count=1)
+
+    assert not cr.passed
+    assert "[1/4 (25.00%)] FAILED" in cr.outcome()
+    assert calls == []
+
+    assert len(cr.failed_rows) == 1
+    assert len(cr.failed_rows) == 1
+    assert calls == [1]
+
+
+def test_lazy_failed_rows_requires_count():
+    with pytest.raises(ValueError):
+        CheckResult(failed_rows=pd.DataFrame, check_name="X", total_rows=1)
+
+
+def test_mask_check_in_rec():
+    b = pd.DataFrame({"x": [1.0, -2.0, 3.0]}, index=["a", "b", "c"])
+    c = pd.DataFrame({"x": [2.0, 2.0, -3.0]}, index=["a", "b", "c"])
+
+    result = Rec(columns={"x": SignCheck()}).run(b, c)
+    cr = result.results[-1]
+
+    assert cr.failed_count == 2
+    assert list(cr.failed_rows.index) == ["b", "c"]
+    assert list(cr.failed_rows.columns) == ["baseline", "candidate", "sign"]
+    assert list(cr.failed_rows["sign"]) == [1.0, -1.0]
+
+
+def test_default_check_is_built_from_mask():
+    b = pd.Series([1.0, -1.0])
+    c = pd.Series([1.0, 1.0])
+    frame = SignCheck().check(b, c)
+    assert list(frame.index) == [1]
+
+
+def test_check_without_protocol_raises():
+    class Empty(ColumnCheck):
+        pass
+
+    df = pd.DataFrame({"x": [1]})
+    with pytest.raises(NotImplementedError):
+        Empty().run(df, df, "x")
+
+
+def test_nullable_missing_comparison_fails():
+    b = pd.DataFrame({"x": pd.array([1, None, 3], dtype="Int64")})
+    c = pd.DataFrame({"x": pd.array([1, 2, None], dtype="Int64")})
+    res = EqualCheck().run(b, c, "x")[0]
+    assert res.failed_count == 2
+    assert res.failed_rows["baseline"].dtype == "Int64"
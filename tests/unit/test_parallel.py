@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+from recx import AbsTolCheck, Rec
+from recx.parallel import imap_ordered, resolve_n_jobs
+
+
+def test_resolve_n_jobs():
+    assert resolve_n_jobs(None) == 1
+    assert resolve_n_jobs(3) == 3
+    assert resolve_n_jobs(-1) == (os.cpu_count() or 1)
+    with pytest.raises(ValueError):
+        resolve_n_jobs(0)
+
+
+def test_imap_ordered_keeps_order():
+    results = imap_ordered(lambda x: x * 2, range(20), n_jobs=4)
+    assert list(results) == list(range(0, 40, 2))
+
+
+def test_threaded_rec_matches_serial(many_columns):
+    b, c = many_columns
+    columns = {r"^c1": AbsTolCheck(tol=0.5, regex=True)}
+
+    serial = Rec(columns=columns).run(b, c)
+    threaded = Rec(columns=columns, n_jobs=4, executor="thread").run(b, c)
+
+    assert [r.signature() for r in threaded] == [r.signature() for r in serial]
+    assert [r.failed_count for r in threaded] == [r.failed_count for r in serial]
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        Rec(columns={}, executor="fork")  # type: ignore[arg-type]
@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from recx import AbsTolCheck, Rec, RecPlan
+
+
+@pytest.fixture
+def count_resolves(monkeypatch):
+    calls = []
+    tasks = Rec._tasks
+
+    def spy(self, *args):
+        calls.append(1)
+        return tasks(self, *args)
+
+    monkeypatch.setattr(Rec, "_tasks", spy)
+    return calls
+
+
+def test_compile_resolves_columns(metric_frames):
+    baseline, _ = metric_frames
+    rec = Rec({r"^metric_": AbsTolCheck(tol=0.1, regex=True)})
+    plan = rec.compile(baseline.columns, baseline.dtypes)
+
+    assert isinstance(plan, RecPlan)
+    assert [column for _, column in plan.tasks] == ["metric_1", "metric_2", "label"]
+    # Both float columns share a block, the string column does not
+    assert plan.block_keys[0] == plan.block_keys[1]
+    assert plan.block_keys[2] != plan.block_keys[0]
+
+
+def test_run_reuses_plan(metric_frames, count_resolves):
+    baseline, candidate = metric_frames
+    rec = Rec({r"^metric_": AbsTolCheck(tol=0.1, regex=True)})
+    rec.compile(baseline.columns, baseline.dtypes)
+
+    first = rec.run(baseline, candidate)
+    second = rec.run(baseline, candidate)
+
+    assert len(count_resolves) == 1
+    assert [r.failed_count for r in first.results] == [0, 0, 0, 1, 0]
+    assert [r.failed_count for r in second.results] == [0, 0, 0, 1, 0]
+
+
+def test_schema_change_recompiles(metric_frames, count_resolves):
+    baseline, candidate = metric_frames
+    rec = Rec({r"^metric_": AbsTolCheck(tol=0.1, regex=True)})
+    rec.run(baseline, candidate)
+
+    wider = baseline.assign(metric_3=1.0)
+    result = rec.run(wider, candidate.assign(metric_3=1.0))
+
+    assert len(count_resolves) == 2
+    assert [r.column for r in result.results[2:]] == [
+        "metric_1",
+        "metric_2",
+        "metric_3",
+        "label",
+    ]
+
+
+def test_settings_change_recompiles(metric_frames, count_resolves):
+    baseline, candidate = metric_frames
+    rec = Rec({"metric_1": AbsTolCheck(tol=0.1)}, check_all=False)
+    first = rec.run(baseline, candidate)
+
+    rec.columns = {"metric_2": AbsTolCheck(tol=0.1)}
+    second = rec.run(baseline, candidate)
+
+    rec.columns["label"] = None
+    rec.check_all = True
+    third = rec.run(baseline, candidate)
+
+    assert len(count_resolves) == 3
+    assert [r.column for r in first.results[2:]] == ["metric_1"]
+    assert [r.column for r in second.results[2:]] == ["metric_2"]
+    assert [r.column for r in third.results[2:]] == ["metric_2", "metric_1"]
+    assert second.results[2].failed_count == 1
+
+
+def test_plan_is_picklable(metric_frames):
+    baseline, candidate = metric_frames
+    plan = Rec({}, keys=["label"]).compile(baseline.columns, baseline.dtypes)
+    restored = pickle.loads(pickle.dumps(plan))
+
+    assert restored.schema == plan.schema
+    assert restored.keys == ["label"]
+    assert restored.matches(baseline, candidate)
+
+
+def test_compile_checks_keys(metric_frames):
+    baseline, _ = metric_frames
+
+    with pytest.raises(ValueError, match="missing"):
+        Rec({}, keys=["id"]).compile(baseline.columns, baseline.dtypes)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, EqualCheck, FailureBudget, Rec
+from recx.align import Alignment
+from recx.prefilter import build_row_filter
+
+
+def test_row_filter_canonicalises_floats():
+    b = pd.DataFrame({"x": [0.0, np.nan, 1.0]})
+    c = pd.DataFrame({"x": [-0.0, -np.nan, 2.0]})
+    row_filter = build_row_filter(b, c, [(EqualCheck(), "x")], Alignment(b.index))
+
+    assert row_filter is not None
+    np.testing.assert_array_equal(row_filter.changed, [False, False, True])
+
+
+def test_row_filter_skips_mixed_objects():
+    b = pd.DataFrame({"x": [1, "a"]})
+    c = pd.DataFrame({"x": ["1", "a"]})
+    assert build_row_filter(b, c, [(EqualCheck(), "x")], Alignment(b.index)) is None
+
+
+@pytest.mark.parametrize("mode", ["rows", "counts"])
+def test_prefilter_matches_full_run(prefilter_frames, mode):
+    b, c = prefilter_frames
+    columns = {"t": AbsTolCheck(tol=0.5, prefilter=True)}
+
+    full = Rec(columns=columns).run(b, c, mode=mode)
+    filtered = Rec(columns=columns, prefilter=True).run(b, c, mode=mode)
+
+    for x, y in zip(full, filtered, strict=True):
+        assert x.total_rows == y.total_rows == 1000
+        assert x.failed_count == y.failed_count
+        if mode == "rows":
+            pd.testing.assert_frame_equal(x.failed_rows, y.failed_rows)
+
+
+@pytest.mark.parametrize("mode", ["rows", "counts"])
+def test_prefilter_keeps_stats_and_sketches(prefilter_frames, mode):
+    b, c = prefilter_frames
+    # u is identical, so its check passes without being evaluated
+    b = b.assign(u=b["t"])
+    c = c.assign(u=b["t"])
+
+    def columns(prefilter):
+        return {
+            name: AbsTolCheck(tol=0.5, prefilter=prefilter)
+            for name in ("f", "i", "t", "u")
+        }
+
+    full = Rec(columns=columns(False), check_all=False).run(b, c, mode=mode)
+    filtered = Rec(columns=columns(True), check_all=False, prefilter=True).run(
+        b, c, mode=mode
+    )
+
+    for x, y in zip(full[2:], filtered[2:], strict=True):
+        assert x.stats == y.stats
+        assert x.sketches.keys() == y.sketches.keys() == {"abs_error"}
+        assert x.sketches["abs_error"].describe() == y.sketches["abs_error"].describe()
+
+    # The rows with a NaN in f have no error
+    assert filtered[2].sketches["abs_error"].count == 980
+    assert filtered[5].sketches["abs_error"].count == 1000
+
+
+def test_prefilter_with_budget(prefilter_frames):
+    b, c = prefilter_frames
+    result = Rec(columns={}, prefilter=True).run(
+        b, c, check_budget=FailureBudget(rows=10)
+    )
+
+    assert [r.failed_count for r in result] == [0, 0, 2, 1, 1, 2]
+    assert list(result[2].failed_rows.index) == [3, 501]
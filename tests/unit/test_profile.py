@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from recx import AbsTolCheck, EqualCheck, FailureBudget, Rec
+from recx.profile import Profiler, span
+
+COLUMNS = {"x": AbsTolCheck(tol=0.1), "y": AbsTolCheck(tol=0.1), "z": EqualCheck()}
+
+
+def test_span_is_a_no_op_without_profiler():
+    with span(None, "anything") as timed:
+        assert timed is None
+
+
+def test_nested_spans():
+    profiler = Profiler()
+
+    with profiler.span("outer") as outer, profiler.span("inner", "check"):
+        pass
+
+    timings = profiler.timings()
+    assert list(timings["name"]) == ["outer", "inner"]
+    assert outer.seconds is not None and outer.seconds >= timings["seconds"].iloc[1]
+    assert timings["peak_bytes"].isna().all()
+
+
+def test_run_records_phases_and_checks(profile_frames):
+    b, c = profile_frames
+    rec = Rec(columns=COLUMNS, align_date_col="date")
+    result = rec.run(b, c, profile=True)
+    result.summary()
+
+    timings = result.timings
+    names = set(timings["name"])
+    assert {"run", "clip_dates", "plan", "join", "column_checks"} <= names
+    assert {"missing_indices_check", "extra_indices_check", "summary"} <= names
+    assert "align" in set(timings["category"])
+
+    # x and y are evaluated as one block, z on its own
+    checks = timings[timings["category"] == "check"]
+    assert "AbsTolCheck block (2 columns)" in set(checks["name"])
+    assert ["x", "y"] in list(checks["columns"])
+
+    for r in result:
+        assert r.elapsed is not None and r.elapsed >= 0
+
+    # z is identical, so the prefilter passes it without evaluating it
+    assert result[4].elapsed == 0
+
+    x, y = result[2:4]
+    assert x.elapsed == y.elapsed
+
+
+def test_no_timings_without_profile(profile_frames):
+    b, c = profile_frames
+    result = Rec(columns=COLUMNS).run(b, c)
+
+    assert all(r.elapsed is None for r in result)
+    assert result.profiler is None
+
+    with pytest.raises(ValueError, match="profile=True"):
+        result.timings  # noqa: B018
+
+
+def test_profile_memory(profile_frames):
+    b, c = profile_frames
+    result = Rec(columns=COLUMNS).run(b, c, profile_memory=True)
+
+    timings = result.timings
+    run = timings[timings["name"] == "run"].iloc[0]
+    assert run["peak_bytes"] > 0
+    assert (timings["peak_bytes"].dropna() <= run["peak_bytes"]).all()
+
+
+def test_write_trace(profile_frames, tmp_path):
+    b, c = profile_frames
+    result = Rec(columns=COLUMNS).run(b, c, profile=True)
+
+    path = tmp_path / "trace.json"
+    result.write_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+
+    complete = [e for e in events if e["ph"] == "X"]
+    assert len(complete) == len(result.timings)
+    assert {"name", "ts", "dur", "pid", "tid"} <= set(complete[0])
+    assert any(e["ph"] == "M" for e in events)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"n_jobs": 2, "executor": "thread"},
+        {"n_jobs": 2, "executor": "process"},
+        {"check_budget": FailureBudget(rows=10_000)},
+    ],
+)
+def test_elapsed_across_execution_paths(profile_frames, options):
+    b, c = profile_frames
+    rec_options = {k: v for k, v in options.items() if k in ("n_jobs", "executor")}
+    run_options = {k: v for k, v in options.items() if k not in rec_options}
+
+    result = Rec(columns=COLUMNS, **rec_options).run(b, c, profile=True, **run_options)
+    assert all(r.elapsed is not None for r in result)
+
+
+def test_cached_partitions_only_time_this_run(profile_frames, tmp_path):
+    b, c = profile_frames
+    rec = Rec(columns=COLUMNS, align_date_col="date", cache_dir=tmp_path)
+
+    first = rec.run(b, c, profile=True)
+    assert "partition" in set(first.timings["name"])
+
+    # Every partition is reused, so no check is evaluated
+    second = rec.run(b, c, profile=True)
+    assert "partition" not in set(second.timings["name"])
+    assert all(r.elapsed is None for r in second[2:])
@@ -0,0 +1,133 @@
+import pytest
+
+from recx import AbsTolCheck, CancelToken, EqualCheck, Progress, Rec
+
+COLUMNS = {"a": AbsTolCheck(tol=0.1), "b": None, "c": EqualCheck()}
+
+
+def test_progress_reports(progress_frames):
+    b, c = progress_frames
+    reports: list[Progress] = []
+
+    result = Rec(columns=COLUMNS).run(b, c, progress=reports.append)
+
+    phases = list(dict.fromkeys(p.phase for p in reports))
+    assert phases == ["plan", "join", "index_checks", "column_checks", "done"]
+    assert result.stop_reason is None
+
+    # One report per finished column; the rows are not compared in slices
+    column_reports = [p for p in reports if p.phase == "column_checks"]
+    assert [(p.rows_done, p.columns_done) for p in column_reports] == [
+        (0, 0),
+        (100, 1),
+        (200, 2),
+    ]
+
+    last = reports[-1]
+    assert (last.rows_done, last.rows_total) == (200, 200)
+    assert (last.columns_done, last.columns_total) == (2, 2)
+    assert last.fraction == 1.0 and last.eta == 0.0
+
+    # Reporting progress does not change the results
+    expected = Rec(columns=COLUMNS).run(b, c)
+    assert [r.failed_count for r in result] == [r.failed_count for r in expected]
+
+
+def test_interruptible_run_reports_slices(progress_frames):
+    b, c = progress_frames
+    reports: list[Progress] = []
+
+    Rec(columns=COLUMNS).run(b, c, progress=reports.append, cancel=CancelToken())
+
+    # One report per slice of rows, plus one per finished column
+    column_reports = [p for p in reports if p.phase == "column_checks"]
+    assert len(column_reports) > 2 * 10
+    assert [p.rows_done for p in column_reports] == sorted(
+        p.rows_done for p in column_reports
+    )
+    assert reports[-1].rows_done == 200
+
+
+def test_progress_with_process_executor(progress_frames):
+    b, c = progress_frames
+    reports: list[Progress] = []
+
+    rec = Rec(columns=COLUMNS, n_jobs=2, executor="process")
+    result = rec.run(b, c, progress=reports.append)
+
+    last = reports[-1]
+    assert (last.rows_done, last.rows_total) == (200, 200)
+    assert (last.columns_done, last.columns_total) == (2, 2)
+
+    expected = Rec(columns=COLUMNS).run(b, c)
+    assert [r.failed_count for r in result] == [r.failed_count for r in expected]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"time_budget": 10}, {"cancel": CancelToken()}, {"fail_fast": True}],
+)
+def test_process_executor_cannot_stop_early(progress_frames, options):
+    b, c = progress_frames
+    rec = Rec(columns=COLUMNS, n_jobs=2, executor="process")
+
+    with pytest.raises(ValueError, match="executor='process'"):
+        rec.run(b, c, **options)
+
+
+def test_eta():
+    progress = Progress("column_checks", 2.0, rows_done=25, rows_total=100)
+    assert progress.fraction == 0.25
+    assert progress.eta == pytest.approx(6.0)
+    assert "25/100 rows" in str(progress)
+
+    assert Progress("join", 1.0, rows_total=100).eta is None
+
+
+def test_time_budget_skips_column_checks(progress_frames, capsys):
+    b, c = progress_frames
+    result = Rec(columns=COLUMNS).run(b, c, time_budget=0)
+
+    # The index checks always complete
+    assert [r.status for r in result] == ["complete", "complete", "skipped", "skipped"]
+    assert result.stop_reason == "time_budget"
+
+    result.summary()
+    assert "2 check(s) stopped early by the time budget" in capsys.readouterr().out
+
+
+def test_cancel_truncates_check_in_progress(progress_frames):
+    b, c = progress_frames
+    token = CancelToken()
+
+    def cancel_after_three_slices(progress: Progress):
+        if progress.rows_done >= 30:
+            token.cancel()
+
+    result = Rec(columns=COLUMNS).run(
+        b, c, progress=cancel_after_three_slices, cancel=token
+    )
+
+    a, col_c = result[2:]
+    assert result.stop_reason == "cancelled"
+    assert a.status == "truncated"
+    assert a.failed_count == 6
+    assert col_c.status == "skipped"
+    assert [r.check_name for r in result.incomplete()] == ["AbsTolCheck", "EqualCheck"]
+
+
+def test_cancelled_before_run(progress_frames):
+    b, c = progress_frames
+    token = CancelToken()
+    token.cancel()
+
+    result = Rec(columns=COLUMNS).run(b, c, cancel=token)
+    assert result.stop_reason == "cancelled"
+    assert all(r.status == "skipped" for r in result[2:])
+
+
+def test_negative_time_budget(progress_frames):
+    b, c = progress_frames
+
+    with pytest.raises(ValueError, match="time_budget"):
+        Rec(columns=COLUMNS).run(b, c, time_budget=-1)
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import EqualCheck, Rec
+from recx.sampling import sample_positions, wilson_interval
+
+
+def test_sample_positions():
+    positions = sample_positions(1000, 0.1, seed=0)
+    assert len(positions) == 100
+    assert len(np.unique(positions)) == 100
+    assert np.all(np.diff(positions) > 0)
+
+    assert len(sample_positions(1000, 25, seed=0)) == 25
+    np.testing.assert_array_equal(sample_positions(10, 1.0), np.arange(10))
+    np.testing.assert_array_equal(
+        sample_positions(1000, 0.1, seed=1),
+        sample_positions(1000, 0.1, seed=1),
+    )
+
+    with pytest.raises(ValueError):
+        sample_positions(10, 1.5)
+
+    with pytest.raises(ValueError):
+        sample_positions(10, 0)
+
+
+def test_stratified_sample_is_proportional():
+    strata = np.array(["a"] * 9_900 + ["b"] * 100)
+    positions = sample_positions(10_000, 0.01, seed=0, strata=strata)
+
+    assert (strata[positions] == "a").sum() == 99
+    assert (strata[positions] == "b").sum() == 1
+
+    # Strata too small for a whole row are drawn with the probability of their rows
+    strata = np.arange(1_000)
+    counts = [
+        len(sample_positions(1_000, 0.1, seed=s, strata=strata)) for s in range(50)
+    ]
+    assert 80 < np.mean(counts) < 120
+
+
+def test_skewed_strata_interval_covers_rate():
+    # Many one-row strata that all fail, and one large clean stratum
+    n_small, n_large = 100, 50_000
+    strata = np.concatenate([np.arange(n_small), np.full(n_large, n_small)])
+    rate = n_small / len(strata)
+
+    covered = 0
+    for seed in range(100):
+        positions = sample_positions(len(strata), 0.02, seed=seed, strata=strata)
+        failed = int((positions < n_small).sum())
+        low, high = wilson_interval(failed, len(positions))
+        covered += low <= rate <= high
+
+    assert covered >= 90
+
+    b = pd.DataFrame({"date": strata, "x": 0.0})
+    c = b.assign(x=np.where(np.arange(len(b)) < n_small, 1.0, 0.0))
+    rec = Rec(columns={"x": EqualCheck()}, align_date_col="date")
+    x = rec.run(b, c, sample=0.02, seed=0)[2]
+
+    low, high = x.confidence_interval()
+    assert low <= rate <= high
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(0, 100)
+    assert low == 0
+    assert 0 < high < 0.05
+
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+
+
+def test_sampled_run(sample_frames):
+    b, c = sample_frames
+    rec = Rec(columns={"x": EqualCheck()}, align_date_col="date")
+    result = rec.run(b, c, sample=0.1, seed=0)
+
+    index_result, x = result[0], result[2]
+    assert not index_result.sampled
+    assert x.sampled
+    assert x.population == 10_000
+    assert x.total_rows == 1000
+
+    low, high = x.confidence_interval()
+    assert low < 0.05 < high
+    assert "sampled of 10,000" in x.outcome()
+    assert "CI" in x.outcome()
+
+    # Failing rows come from the sample only
+    assert len(x.failed_rows) == x.failed_count
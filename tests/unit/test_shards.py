@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, Rec
+from recx.checks import ColumnCheck
+from recx.shards import shard_positions
+
+
+class FrameSignCheck(ColumnCheck):
+    """Frame-based check (no masks), defined at module level to be picklable."""
+
+    def check(self, baseline, candidate):
+        bad = np.sign(baseline) != np.sign(candidate)
+        return pd.DataFrame({"baseline": baseline[bad], "candidate": candidate[bad]})
+
+
+def test_shard_positions_partition():
+    index = pd.Index(["a", "b", "c", "a", "d"] * 10)
+    shards = shard_positions(index, 3)
+    positions = np.sort(np.concatenate(shards))
+    np.testing.assert_array_equal(positions, np.arange(len(index)))
+
+    # Equal labels always land in the same shard
+    shard_of = {}
+    for k, rows in enumerate(shards):
+        for label in index[rows]:
+            assert shard_of.setdefault(label, k) == k
+
+
+def test_process_shards_match_serial(sharded_frames):
+    b, c = sharded_frames
+    columns = {
+        "x": AbsTolCheck(tol=0.5, sort="desc"),
+        "y": FrameSignCheck(),
+    }
+
+    serial = Rec(columns=columns).run(b, c)
+    sharded = Rec(columns=columns, n_jobs=2, executor="process").run(b, c)
+
+    assert len(sharded) == len(serial)
+
+    for s, e in zip(sharded.results, serial.results, strict=True):
+        assert s.signature() == e.signature()
+        assert s.total_rows == e.total_rows
+        assert s.failed_count == e.failed_count
+        pd.testing.assert_frame_equal(s.failed_rows, e.failed_rows)
+
+
+def test_process_shards_counts(sharded_frames):
+    b, c = sharded_frames
+    columns = {"x": AbsTolCheck(tol=0.5)}
+
+    serial = Rec(columns=columns).run(b, c, mode="counts")
+    sharded = Rec(columns=columns, n_jobs=2, executor="process").run(
+        b, c, mode="counts"
+    )
+
+    for s, e in zip(sharded.results, serial.results, strict=True):
+        assert s.failed_count == e.failed_count
+        assert s.stats == pytest.approx(e.stats)
@@ -0,0 +1,210 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, ColumnCheck, EqualCheck, FailureBudget, Rec, RelTolCheck
+from recx.sketch import ErrorSketch, merge_sketches
+
+
+class SignedErrorCheck(ColumnCheck):
+    """Mask-based check with a signed numeric diagnostic."""
+
+    def check_mask(self, baseline, candidate):
+        diff = (candidate - baseline).to_numpy()
+        return np.abs(diff) > 0.5, {"diff": diff}
+
+
+def assert_same_sketch(a: ErrorSketch, b: ErrorSketch):
+    assert a.count == b.count
+    assert a.sum == pytest.approx(b.sum)
+    assert (a.min, a.max) == (b.min, b.max)
+    for sign in ("positive", "negative"):
+        np.testing.assert_array_equal(getattr(a, sign)[0], getattr(b, sign)[0])
+        np.testing.assert_array_equal(getattr(a, sign)[1], getattr(b, sign)[1])
+
+
+def test_quantiles_within_precision():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.lognormal(size=10_000), -rng.lognormal(size=500)])
+    values[::100] = 0.0
+    sketch = ErrorSketch.from_values(np.append(values, np.nan))
+
+    assert sketch.count == len(values)
+    assert sketch.mean == pytest.approx(values.mean())
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+    for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+        expected = np.quantile(values, q, method="lower")
+        assert sketch.quantile(q) == pytest.approx(expected, rel=2**-7, abs=1e-12)
+
+
+def test_merge_matches_one_pass():
+    rng = np.random.default_rng(1)
+    values = rng.exponential(size=5_000)
+    parts = [ErrorSketch.from_values(part) for part in np.array_split(values, 7)]
+
+    merged = merge_sketches({"error": p} for p in parts)["error"]
+    assert_same_sketch(merged, ErrorSketch.from_values(values))
+
+    # The parts themselves are left unchanged
+    assert parts[0].count == len(np.array_split(values, 7)[0])
+    assert_same_sketch(pickle.loads(pickle.dumps(merged)), merged)
+
+
+def test_empty_and_infinite_values():
+    empty = ErrorSketch.from_values(np.array([np.nan]))
+    assert empty.count == 0
+    assert np.isnan(empty.mean) and np.isnan(empty.quantile(0.5))
+
+    values = pd.array([1.0, None, np.inf, np.inf], dtype="Float64")
+    sketch = ErrorSketch.from_values(values)
+    assert sketch.count == 3
+    assert sketch.quantile(0.9) == np.inf
+    assert sketch.quantile(0.1) == pytest.approx(1.0, rel=2**-7)
+
+
+def test_add_zeros_matches_adding_values():
+    values = np.array([-2.0, 0.5, 3.0])
+    sketch = ErrorSketch.from_values(values)
+    sketch.add_zeros(4)
+
+    assert_same_sketch(sketch, ErrorSketch.from_values([*values, 0, 0, 0, 0]))
+
+
+def test_results_carry_sketches(error_frames):
+    b, c = error_frames
+    rec = Rec(columns={"x": AbsTolCheck(tol=0.2), "y": RelTolCheck(tol=0.01)})
+    x, y = rec.run(b, c)[2:]
+
+    abs_error = (b["x"] - c["x"]).abs()
+    sketch = x.sketches["abs_error"]
+    assert sketch.count == abs_error.count()
+    assert sketch.max == abs_error.max()
+    assert sketch.mean == pytest.approx(abs_error.mean())
+    assert x.failed_count < sketch.count
+
+    assert list(y.sketches) == ["rel_error"]
+    assert y.sketches["rel_error"].count == len(b)
+
+    # Equality checks have no numeric diagnostics
+    assert Rec(columns={"x": EqualCheck()}).run(b, c)[2].sketches == {}
+
+
+def test_custom_check_sketch(error_frames):
+    b, c = error_frames
+    result = Rec(columns={"y": SignedErrorCheck()}).run(b, c)[2]
+
+    sketch = result.sketches["diff"]
+    diff = c["y"] - b["y"]
+    assert sketch.min == diff.min()
+    assert sketch.quantile(0.5) == pytest.approx(diff.median(), abs=0.01)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"n_jobs": 2, "executor": "process"},
+        {"n_jobs": 2, "executor": "thread"},
+        {"check_budget": FailureBudget(rows=10_000)},
+        {"mode": "counts"},
+    ],
+)
+def test_sketches_match_across_execution_paths(error_frames, options, monkeypatch):
+    b, c = error_frames
+    columns = {"x": AbsTolCheck(tol=0.2), "y": RelTolCheck(tol=0.01)}
+    monkeypatch.setattr("recx.budget.BUDGET_ROWS", 128)
+
+    expected = Rec(columns=columns).run(b, c)
+    rec_options = {k: v for k, v in options.items() if k in ("n_jobs", "executor")}
+    run_options = {k: v for k, v in options.items() if k not in rec_options}
+    result = Rec(columns=columns, **rec_options).run(b, c, **run_options)
+
+    for r, e in zip(result, expected, strict=True):
+        assert r.sketches.keys() == e.sketches.keys()
+        for name in e.sketches:
+            assert_same_sketch(r.sketches[name], e.sketches[name])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"prefilter": True},
+        {"prefilter": True, "mode": "counts"},
+        {"prefilter": True, "check_budget": FailureBudget(rows=10_000)},
+        {"prefilter": True, "n_jobs": 2, "executor": "process"},
+    ],
+)
+def test_sketches_do_not_depend_on_skipped_rows(error_frames, options, monkeypatch):
+    b, _ = error_frames
+    # Few changed rows for the prefilter to skip the rest, and an identical column
+    # that is passed without being evaluated
+    b = b.assign(z=b["x"])
+    c = b.copy()
+    c.iloc[::100, 0] += 0.5
+    c.iloc[::250, 1] = np.nan
+    monkeypatch.setattr("recx.budget.BUDGET_ROWS", 128)
+
+    def columns(prefilter):
+        return {
+            "x": AbsTolCheck(tol=0.2, prefilter=prefilter),
+            "y": RelTolCheck(tol=0.01, prefilter=prefilter),
+            "z": AbsTolCheck(tol=0.2, prefilter=prefilter),
+        }
+
+    rec_options = {
+        k: v for k, v in options.items() if k in ("prefilter", "n_jobs", "executor")
+    }
+    run_options = {k: v for k, v in options.items() if k not in rec_options}
+    expected = Rec(columns=columns(False)).run(b, c, **run_options)
+    result = Rec(columns=columns(True), **rec_options).run(b, c, **run_options)
+
+    for r, e in zip(result, expected, strict=True):
+        assert r.stats == e.stats
+        assert r.sketches.keys() == e.sketches.keys()
+        for name in e.sketches:
+            assert_same_sketch(r.sketches[name], e.sketches[name])
+
+    assert result[4].sketches["abs_error"].count == len(b)
+
+
+def test_sketches_merge_over_chunks(error_frames):
+    b, c = error_frames
+    b, c = b.reset_index(drop=True), c.reset_index(drop=True)
+    rec = Rec(columns={"x": AbsTolCheck(tol=0.2)})
+
+    def chunked(df):
+        return (df.iloc[i : i + 64] for i in range(0, len(df), 64))
+
+    expected = rec.run(b, c)[2].sketches["abs_error"]
+    result = rec.run_chunks(chunked(b), chunked(c))[2].sketches["abs_error"]
+    assert_same_sketch(result, expected)
+
+
+def test_sketches_merge_over_cached_partitions(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=4).repeat(25)
+    baseline = pd.DataFrame(
+        {"date": dates, "id": list(range(25)) * 4, "x": np.linspace(0, 1, 100)}
+    ).set_index(["date", "id"])
+    candidate = baseline * 1.01
+
+    columns = {"x": AbsTolCheck(tol=0.005)}
+    expected = Rec(columns=columns).run(baseline, candidate)[2]
+    rec = Rec(columns=columns, align_date_col="date", cache_dir=tmp_path)
+
+    for _ in range(2):
+        result = rec.run(baseline, candidate)[2]
+        assert_same_sketch(result.sketches["abs_error"], expected.sketches["abs_error"])
+
+
+def test_summary_prints_sketches(error_frames, capsys):
+    b, c = error_frames
+    Rec(columns={"x": AbsTolCheck(tol=0.2)}).run(b, c).summary()
+    out = capsys.readouterr().out
+
+    assert "Statistics:" in out
+    assert "abs_error: n=980 mean=" in out
+    assert "p99=" in out
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from recx import AbsTolCheck, Rec, RelTolCheck
+
+
+def test_keeps_worst_failures(failing_frames):
+    baseline, candidate = failing_frames
+    check = AbsTolCheck(tol=0.5, top_k=3)
+    result = Rec({"x": check, "y": check}).run(baseline, candidate)
+
+    for r in result.results[2:]:
+        assert r.failed_count == 99
+        assert list(r.failed_rows.index) == [99, 98, 97]
+
+
+def test_keeps_best_failures(failing_frames):
+    baseline, candidate = failing_frames
+    check = AbsTolCheck(tol=0.5, top_k=2, sort="asc")
+    x = Rec({"x": check}, check_all=False).run(baseline, candidate).results[2]
+
+    assert x.failed_count == 99
+    assert list(x.failed_rows.index) == [1, 2]
+
+
+def test_null_failures_go_last():
+    baseline = pd.DataFrame({"x": [0.0, 0.0, 0.0]})
+    candidate = pd.DataFrame({"x": [np.nan, 2.0, np.nan]})
+    x = Rec({"x": AbsTolCheck(tol=0, top_k=2)}).run(baseline, candidate).results[2]
+
+    assert x.failed_count == 3
+    assert list(x.failed_rows.index) == [1, 0]
+
+
+def test_top_k_over_chunks(failing_frames):
+    baseline, candidate = failing_frames
+    rec = Rec({"x": AbsTolCheck(tol=0.5, top_k=4)}, check_all=False)
+
+    def chunks(frame):
+        return (frame.iloc[i : i + 30] for i in range(0, len(frame), 30))
+
+    x = rec.run_chunks(chunks(baseline), chunks(candidate)).results[2]
+
+    assert x.failed_count == 99
+    assert list(x.failed_rows.index) == [99, 98, 97, 96]
+
+
+def test_relative_top_k():
+    baseline = pd.DataFrame({"x": [1.0, 1.0, 1.0, 1.0]})
+    candidate = pd.DataFrame({"x": [1.0, 2.0, 4.0, 3.0]})
+    check = RelTolCheck(tol=0.1, top_k=1)
+    x = Rec({"x": check}).run(baseline, candidate).results[2]
+
+    assert x.failed_count == 3
+    assert list(x.failed_rows.index) == [2]
+    assert x.check_args == {"tol": 0.1, "top_k": 1}
+
+
+def test_invalid_top_k():
+    with pytest.raises(ValueError):
+        AbsTolCheck(tol=0.1, top_k=0)
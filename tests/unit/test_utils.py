@@ -1,5 +1,7 @@
 import pandas as pd
+import pytest
 
+import recx.rec
 from recx.rec import clip_to_last_common_date, get_col
 
 
@@ -26,3 +28,63 @@ def test_clip_to_last_common_date_index_on_multi_index(multi_index_frames):
         "2024-01-01",
         "2024-01-02",
     ]
+
+
+@pytest.mark.parametrize("layout", ["column", "index", "level0", "level1"])
+@pytest.mark.parametrize("sort", [True, False])
+def test_clip_sorted_matches_mask(layout, sort):
+    dates = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03"])
+    a = pd.DataFrame({"date": dates, "id": [1, 2, 3, 4], "x": [1, 2, 3, 4]})
+    b = a.iloc[:3].copy()
+
+    if layout == "index":
+        a, b = a.set_index("date"), b.set_index("date")
+    elif layout == "level0":
+        a, b = a.set_index(["date", "id"]), b.set_index(["date", "id"])
+    elif layout == "level1":
+        a, b = a.set_index(["id", "date"]), b.set_index(["id", "date"])
+
+    if not sort:
+        a, b = a.iloc[::-1], b.iloc[::-1]
+
+    a_clip, b_clip = clip_to_last_common_date(a, b, "date")
+
+    assert len(a_clip) == 3
+    assert (get_col(a_clip, "date") <= dates[2]).all()
+    assert b_clip.equals(b)
+
+
+@pytest.mark.parametrize("layout", ["column", "index", "level0"])
+def test_clip_ignores_missing_dates(layout):
+    dates = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])
+    a = pd.DataFrame({"date": dates, "id": [1, 2, 3], "x": [1, 2, 3]})
+    # Otherwise sorted, with a trailing missing date
+    b = pd.DataFrame({"date": [*dates[:2], pd.NaT], "id": [1, 2, 3], "x": [1, 2, 3]})
+
+    if layout == "index":
+        a, b = a.set_index("date"), b.set_index("date")
+    elif layout == "level0":
+        a, b = a.set_index(["date", "id"]), b.set_index(["date", "id"])
+
+    a_clip, b_clip = clip_to_last_common_date(a, b, "date")
+
+    assert list(get_col(a_clip, "date")) == list(dates[:2])
+    assert list(get_col(b_clip, "date")) == list(dates[:2])
+
+
+def test_clip_sorted_skips_materialising(monkeypatch):
+    index = pd.MultiIndex.from_arrays(
+        [pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]), [1, 2, 3]],
+        names=["date", "id"],
+    )
+    a = pd.DataFrame({"x": [1, 2, 3]}, index=index)
+    b = a.iloc[:2]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("sorted frames should not materialise the dates")
+
+    monkeypatch.setattr(recx.rec, "get_col", fail)
+    a_clip, b_clip = clip_to_last_common_date(a, b, "date")
+
+    assert a_clip.equals(b)
+    assert b_clip.equals(b)